@@ -1,11 +1,23 @@
-# Makes the apps directory a Python package
-from .menu import Menu
-from .weather import WeatherApp
-from .notes import NotesApp
-from .music_control import SpotifyApp
-from .timer import TimerApp
-from .games_menu import GamesMenu
-from .snake_game import SnakeGame
-from .dino_game import DinoRunner
+# Makes the apps directory a Python package. App classes are imported on
+# first access, so importing one app (or the registry) doesn't import them all.
+import importlib
 
-__all__ = ['Menu', 'WeatherApp', 'NotesApp', 'SpotifyApp', 'TimerApp', 'GamesMenu', 'SnakeGame', 'DinoRunner']
\ No newline at end of file
+_MODULES = {
+    'Menu': '.menu',
+    'WeatherApp': '.weather',
+    'NotesApp': '.notes',
+    'SpotifyApp': '.music_control',
+    'TimerApp': '.timer',
+    'GamesMenu': '.games_menu',
+    'SnakeGame': '.snake_game',
+    'DinoRunner': '.dino_game',
+    'SystemStatsApp': '.system_stats',
+}
+
+__all__ = list(_MODULES)
+
+def __getattr__(name):
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module, __name__), name)
@@ -1,19 +1,70 @@
-import time
 import random
-from PIL import Image, ImageDraw
+from lib.pacer import FramePacer
+from lib.sprites import Sprite, collide
+
+# Same 6x8 footprint as the old rectangle, with two running frames
+DINO_RUN = [Sprite("""
+   ###
+   #.#
+   ###
+# ### 
+##### 
+ ###  
+ # #  
+ #  # 
+"""), Sprite("""
+   ###
+   #.#
+   ###
+# ### 
+##### 
+ ###  
+  ##  
+ #  # 
+""")]
+DINO_JUMP = Sprite("""
+   ###
+   #.#
+   ###
+# ### 
+##### 
+ ###  
+ # #  
+ # #  
+""")
+CACTUS = Sprite("""
+ # 
+ # 
+## 
+ ##
+## 
+ ##
+ # 
+ # 
+""")
+# Wings up / wings down
+BIRD = [Sprite("""
+  #    
+  ##   
+ ######
+#####  
+"""), Sprite("""
+ ######
+#####  
+  ##   
+  #    
+""")]
 
 class DinoRunner:
     def __init__(self, display, buttons):
         self.name = "Dino Runner"
         self.display = display
         self.buttons = buttons
+        self.pacer = FramePacer(50, self.name)
         
         # Game settings
         self.ground_height = 6
-        self.dino_width = 6
         self.dino_height = 8
-        self.obstacle_width = 3
-        self.obstacle_height = 8
         
         # Game state
         self.dino_x = 15
@@ -34,6 +85,8 @@ class DinoRunner:
         
     def run(self):
         self._reset_game()
+        self.buttons.set_profile('game')
+        self.pacer.reset()
         
         while True:
             # Handle input
@@ -57,7 +110,7 @@ class DinoRunner:
                 self._update_game()
                 
             self._draw_game()
-            time.sleep(0.02)  # Even faster! ~50 FPS for ultra-responsive gameplay
+            self.pacer.tick()  # 50 FPS for ultra-responsive gameplay
             
     def _reset_game(self):
         self.dino_y = self.display.height - self.ground_height - self.dino_height
@@ -95,20 +148,21 @@ class DinoRunner:
         self.spawn_timer += 1
         if self.spawn_timer >= self.spawn_interval:
             obstacle_type = random.choice(['cactus', 'bird'])
+            sprite = BIRD[0] if obstacle_type == 'bird' else CACTUS
             if obstacle_type == 'bird':
                 # Bird flies at random height
                 obstacle_y = random.randint(self.display.height - self.ground_height - 16, 
                                           self.display.height - self.ground_height - 8)
             else:
                 # Cactus on ground
-                obstacle_y = self.display.height - self.ground_height - self.obstacle_height
+                obstacle_y = self.display.height - self.ground_height - sprite.height
                 
             self.obstacles.append({
                 'x': self.display.width,
                 'y': obstacle_y,
                 'type': obstacle_type,
-                'width': self.obstacle_width,
-                'height': self.obstacle_height
+                'width': sprite.width,
+                'height': sprite.height
             })
             self.spawn_timer = 0
             
@@ -122,15 +176,9 @@ class DinoRunner:
                 self.score += 1
                 
         # Check collisions
-        dino_rect = {
-            'x': self.dino_x,
-            'y': self.dino_y,
-            'width': self.dino_width,
-            'height': self.dino_height
-        }
-        
+        dino_sprite = self._dino_sprite()
         for obstacle in self.obstacles:
-            if self._check_collision(dino_rect, obstacle):
+            if self._check_collision(dino_sprite, obstacle):
                 self.game_over = True
                 return
                 
@@ -139,62 +187,45 @@ class DinoRunner:
             self.speed = min(self.speed + 1.0, 12)  # Big speed jumps, very high max
             self.spawn_interval = max(self.spawn_interval - 2, 15)  # Very aggressive spawning
             
-    def _check_collision(self, rect1, rect2):
-        return (rect1['x'] < rect2['x'] + rect2['width'] and
-                rect1['x'] + rect1['width'] > rect2['x'] and
-                rect1['y'] < rect2['y'] + rect2['height'] and
-                rect1['y'] + rect1['height'] > rect2['y'])
+    def _check_collision(self, dino_sprite, obstacle):
+        # Pixel-accurate: only lit pixels count, not bounding boxes
+        return collide(dino_sprite, self.dino_x, self.dino_y,
+                       self._obstacle_sprite(obstacle), obstacle['x'], obstacle['y'])
+        
+    def _dino_sprite(self):
+        if not self.dino_on_ground:
+            return DINO_JUMP
+        return DINO_RUN[(self.frame_count // 3) % 2]
+        
+    def _obstacle_sprite(self, obstacle):
+        if obstacle['type'] == 'bird':
+            return BIRD[(self.frame_count // 4) % 2]
+        return CACTUS
                 
     def _draw_game(self):
         try:
-            image = Image.new("1", (self.display.width, self.display.height))
-            draw = ImageDraw.Draw(image)
-            
             if self.game_over:
                 self.display.draw_centered_text(f"Game Over!\nScore: {self.score}\nPress SELECT")
                 return
                 
+            fb = self.display.framebuf
+            fb.clear()
+            
             # Draw ground
             ground_y = self.display.height - self.ground_height
-            draw.line([(0, ground_y), (self.display.width, ground_y)], fill=255)
-            
-            # Draw dino (simple rectangle with animation)
-            dino_char = '█' if self.dino_on_ground and (self.frame_count // 5) % 2 else '▮'
-            draw.rectangle([self.dino_x, self.dino_y, 
-                          self.dino_x + self.dino_width - 1, 
-                          self.dino_y + self.dino_height - 1], fill=255)
+            fb.hline(0, ground_y, self.display.width)
             
-            # Add simple "legs" animation when running
-            if self.dino_on_ground:
-                leg_offset = 1 if (self.frame_count // 3) % 2 else 0
-                draw.rectangle([self.dino_x + leg_offset, 
-                              self.dino_y + self.dino_height - 2,
-                              self.dino_x + leg_offset + 1,
-                              self.dino_y + self.dino_height - 1], fill=255)
+            # Draw dino (running animation on the ground)
+            fb.blit(self._dino_sprite(), self.dino_x, self.dino_y)
                               
-            # Draw obstacles
+            # Draw obstacles (birds flap their wings)
             for obstacle in self.obstacles:
-                if obstacle['type'] == 'bird':
-                    # Draw bird (smaller, animated)
-                    bird_frame = (self.frame_count // 4) % 2
-                    if bird_frame:
-                        draw.rectangle([obstacle['x'], obstacle['y'], 
-                                      obstacle['x'] + obstacle['width'] - 1, 
-                                      obstacle['y'] + obstacle['height'] - 1], fill=255)
-                else:
-                    # Draw cactus
-                    draw.rectangle([obstacle['x'], obstacle['y'], 
-                                  obstacle['x'] + obstacle['width'] - 1, 
-                                  obstacle['y'] + obstacle['height'] - 1], fill=255)
-                    # Add spikes
-                    draw.point((obstacle['x'], obstacle['y'] + 2), fill=255)
-                    draw.point((obstacle['x'] + obstacle['width'] - 1, obstacle['y'] + 3), fill=255)
+                fb.blit(self._obstacle_sprite(obstacle), obstacle['x'], obstacle['y'])
                     
             # Draw score
-            draw.text((self.display.width - 30, 0), f"HI {self.score}", fill=255)
+            self.display.blit_text(f"HI {self.score}", self.display.width - 30, 0)
             
-            self.display.oled.image(image)
-            self.display.oled.show()
+            self.display.show()
             
         except Exception as e:
             print(f"Dino game draw error: {e}")
@@ -1,4 +1,5 @@
 import time
+from apps.menu import IDLE_TIMEOUT
 
 class GamesMenu:
     def __init__(self, display, buttons, games):
@@ -10,17 +11,27 @@ class GamesMenu:
         self.current_game = None
         
     def run(self):
+        self.buttons.set_app(self.name)
         while True:
             if self.current_game is None:
                 self._show_games_menu()
-                button = self.buttons.get_pressed()
+                button = self.buttons.wait_pressed(IDLE_TIMEOUT)
                 if self._handle_games_menu_input(button):
                     return  # Return to main menu
             else:
                 # Run the current game
+                self.buttons.set_app(self.current_game.name)
                 self.current_game.run()
                 self.current_game = None  # Return to games menu when game exits
+                self.buttons.set_profile('default')
+                self.buttons.set_app(self.name)
                 
+    def get_state(self):
+        return {'selected_index': self.selected_index}
+    
+    def restore_state(self, state):
+        self.selected_index = state.get('selected_index', 0) % len(self.games)
+        
     def _show_games_menu(self):
         game_name = self.games[self.selected_index].name
         # Show "Games:" prefix to indicate we're in the games submenu
@@ -1,15 +1,18 @@
 import time
-from datetime import datetime, timezone
+from datetime import datetime
 from zoneinfo import ZoneInfo
+from lib.pacer import FramePacer
 
 class HelloScreen:
     def __init__(self, display, buttons):
         self.display = display
         self.buttons = buttons
+        self.pacer = FramePacer(10, "Hello")
         self.last_update = 0
         
     def show(self):
         """Display the hello screen with date/time and wait for any button press"""
+        self.pacer.reset()
         while True:
             current_time = time.time()
             
@@ -26,12 +29,12 @@ class HelloScreen:
                 time.sleep(0.5)
                 return
             
-            time.sleep(0.1)  # Small delay to prevent CPU spinning
+            self.pacer.tick()  # Prevent CPU spinning
     
     def _update_display(self):
         """Update the display with current date and time"""
         # Get current time in EST/EDT
-        now = datetime.now(timezone.utc).astimezone(ZoneInfo("America/New_York"))
+        now = datetime.fromtimestamp(time.time(), ZoneInfo("America/New_York"))
 
         # Format the date and time
         date_str = now.strftime("%b %d, %Y")  # e.g., "Jan 15, 2025"
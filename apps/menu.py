@@ -3,6 +3,9 @@ from lib.buttons import ButtonHandler
 import time
 import subprocess
 
+# Longest a menu waits for input before redrawing
+IDLE_TIMEOUT = 1.0
+
 class Menu:
     def __init__(self, display, buttons, apps):
         self.display = display
@@ -12,15 +15,52 @@ class Menu:
         self.current_app = None
         
     def run(self):
+        self.buttons.set_app("Menu")
         while True:
             if self.current_app is None:
                 self._show_menu()
-                button = self.buttons.get_pressed()
+                # Sleep until a button is pressed instead of polling
+                button = self.buttons.wait_pressed(IDLE_TIMEOUT)
                 self._handle_menu_input(button)
             else:
                 # Run the current app
+                self.buttons.set_app(self.current_app.name)
                 self.current_app.run()
                 self.current_app = None  # Return to menu when app exits
+                self.buttons.set_profile('default')
+                self.buttons.set_app("Menu")
+    
+    async def run_async(self, runtime):
+        """run() as an asyncio task, see lib.runtime"""
+        self.buttons.set_app("Menu")
+        while True:
+            if self.current_app is None:
+                self._show_menu()
+                button = await runtime.buttons.get(IDLE_TIMEOUT)
+                if button == 'back':
+                    await runtime.run_sync(self._show_shutdown_confirmation)
+                else:
+                    self._handle_menu_input(button)
+            else:
+                self.buttons.set_app(self.current_app.name)
+                await runtime.run_app(self.current_app)
+                self.current_app = None
+                self.buttons.set_profile('default')
+                self.buttons.set_app("Menu")
+                
+    def get_state(self):
+        """Menu position and every app's state, for lib.state snapshots"""
+        return {
+            'selected_index': self.selected_index,
+            'apps': {app.name: app.get_state() for app in self.apps if hasattr(app, 'get_state')},
+        }
+    
+    def restore_state(self, state):
+        self.selected_index = state.get('selected_index', 0) % len(self.apps)
+        app_states = state.get('apps') or {}
+        for app in self.apps:
+            if app_states.get(app.name) and hasattr(app, 'restore_state'):
+                app.restore_state(app_states[app.name])
                 
     def _show_menu(self):
         self.display.draw_centered_text(self.apps[self.selected_index].name)
@@ -41,7 +81,7 @@ class Menu:
         while True:
             self.display.draw_centered_text("Shutdown Pi?\nSELECT=Yes BACK=No")
             
-            button = self.buttons.get_pressed()
+            button = self.buttons.wait_pressed(IDLE_TIMEOUT)
             if button == 'select':
                 # User confirmed shutdown
                 self.display.draw_centered_text("Shutting down...\nGoodbye!")
@@ -53,8 +93,6 @@ class Menu:
             elif button == 'back':
                 # User cancelled shutdown
                 return  # Go back to main menu
-            
-            time.sleep(0.1)
     
     def _clear_display_for_shutdown(self):
         """Simple display clear before shutdown"""
@@ -1,35 +1,69 @@
 import os
+import threading
 import time
+import config
 import spotipy
 from spotipy.oauth2 import SpotifyOAuth
+from lib.pacer import FramePacer
+from lib.marquee import ScrollingText
+from lib import http
+from lib.playback import PlaybackModel, CommandQueue, format_ms
+from lib.albumart import AlbumArt
 
 class SpotifyApp:
     def __init__(self, display, buttons):
         self.name = "Spotify"
         self.display = display
         self.buttons = buttons
+        self.pacer = FramePacer(10, self.name)
+        # Long track names / weather lines scroll instead of being cut off;
+        # the bottom rows are left for the progress bar
+        self.scroller = ScrollingText(display, height=display.height - 4)
         
         # DON'T authenticate in init - that's what's causing the startup issue
         self.auth_manager = None
         self.sp = None
-        self.current_track = None
-        self.is_playing = False
+        # Polled adaptively, extrapolated in between (lib/playback.py)
+        self.playback = PlaybackModel(clean=self._clean_text)
+        self._poll_thread = None
+        # Buttons update the screen straight away; the API calls are queued
+        # and sent by a worker, which has the real state polled when done
+        self.commands = CommandQueue(self._send_command, idle=self.playback.poll_soon)
+        # (text, until): message shown instead of the track for a moment
+        self.notice = None
+        # Album art left of the track text, as tall as the text area
+        self.art = None
+        self._thumbnail = (None, None)  # (image_url, thumbnail) of the current track
+        if config.ALBUM_ART:
+            self.art = AlbumArt(os.path.join(config.CACHE_DIR, 'albumart'), size=display.height - 4,
+                                disk_bytes=config.ALBUM_ART_CACHE_BYTES)
         
-    def run(self):
-        # Only set up Spotify when the app is actually run
+    def _connect(self):
+        # Only set up Spotify when the app is actually run. API calls and
+        # token refreshes share one keep-alive session; retries as spotipy's own
+        session = http.session('spotify', timeout=(3.05, 5), retries=3)
         self.auth_manager = SpotifyOAuth(
             client_id=os.getenv('SPOTIFY_CLIENT_ID'),
             client_secret=os.getenv('SPOTIFY_CLIENT_SECRET'),
             redirect_uri=os.getenv('SPOTIFY_REDIRECT_URI'),
             scope="user-read-playback-state,user-modify-playback-state",
-            open_browser=False
+            open_browser=False,
+            requests_session=session
         )
         
         # Initialize Spotify client - this will use cached token if available
-        self.sp = spotipy.Spotify(auth_manager=self.auth_manager)
+        self.sp = spotipy.Spotify(auth_manager=self.auth_manager, requests_session=session,
+                                  requests_timeout=session.timeout)
         
+    def run(self):
+        if self.sp is None:
+            self._connect()
+        self.pacer.reset()
+        self.playback.poll_soon(0)
         while True:
-            self._update_playback_state()
+            # No polling while commands are in flight: they'd be outdated
+            if self.playback.due() and not self.commands.busy():
+                self._poll()
             self._display_playback_info()
             
             button = self.buttons.get_pressed()
@@ -41,8 +75,41 @@ class SpotifyApp:
                 self._previous_track()
             elif button == 'down':
                 self._next_track()
+            if button:
+                # Show the press now rather than a frame later
+                self._display_playback_info()
+                
+            self.pacer.tick()
+    
+    async def run_async(self, runtime):
+        """run() as an asyncio task: playback polls run in the executor,
+        so the track info keeps scrolling and buttons aren't missed"""
+        if self.sp is None:
+            self._connect()
+        self.pacer.reset()
+        
+        self.playback.poll_soon(0)
+        poll = None
+        while True:
+            # At most one playback poll in flight, when the model asks
+            if (poll is None or poll.done()) and self.playback.due() and not self.commands.busy():
+                poll = runtime.background(self._update_playback_state)
+                
+            self._display_playback_info()
+            
+            button = runtime.buttons.get_nowait()
+            if button == 'back':
+                return
+            elif button == 'select':
+                self._toggle_playback()
+            elif button == 'up':
+                self._previous_track()
+            elif button == 'down':
+                self._next_track()
+            if button:
+                self._display_playback_info()
                 
-            time.sleep(0.1)
+            await self.pacer.tick_async()
             
     def _clean_text(self, text):
         """Remove problematic Unicode characters"""
@@ -78,80 +145,149 @@ class SpotifyApp:
         
         return cleaned
         
+    def prefetch(self):
+        """Background poll (lib.scheduler), so the app opens on the current track"""
+        if not os.getenv('SPOTIFY_CLIENT_ID'):
+            return  # Not set up, nothing to poll
+        if not self.playback.due():
+            return  # Polled by the app itself just now
+        if self.sp is None:
+            self._connect()
+        self._update_playback_state()
+        
+    def _poll(self):
+        """Poll on a background thread, so frames never wait on the network"""
+        if self._poll_thread is not None and self._poll_thread.is_alive():
+            return
+        self._poll_thread = threading.Thread(target=self._update_playback_state,
+                                             name="spotify-poll", daemon=True)
+        self._poll_thread.start()
+        
     def _update_playback_state(self):
+        token = self.playback.begin_poll()
         try:
-            current = self.sp.current_playback()
-            if current:
-                self.is_playing = current['is_playing']
-                self.current_track = {
-                    'name': self._clean_text(current['item']['name']),
-                    'artist': self._clean_text(current['item']['artists'][0]['name'])
-                }
+            self.playback.update(self.sp.current_playback(), token)
+            if self.playback.needs_queue():
+                # What's next, for skipping without waiting for a poll
+                self.playback.set_queue(self.sp.queue())
+            if self.art is not None:
+                # Dithered before it's needed: the current and the next track
+                self.art.prefetch(self.playback.track)
+                if self.playback.upcoming:
+                    self.art.prefetch(self.playback.upcoming[0])
         except Exception as e:
             print(f"Spotify error: {e}")
-            self.current_track = None
+            self.playback.failed()
             
+    def get_state(self):
+        return self.playback.get_state()
+    
+    def restore_state(self, state):
+        # Shown until the first playback poll answers
+        self.playback.restore_state(state)
+        
     def _display_playback_info(self):
-        if not self.current_track:
+        if self.notice and time.monotonic() < self.notice[1]:
+            self.display.draw_centered_text(self.notice[0])
+            return
+            
+        track = self.playback.track
+        if not track:
             self.display.draw_centered_text("No active playback")
             return
             
-        status = "PLAY" if self.is_playing else "PAUSE"
-        text = f"{status}\n{self.current_track['name']}\nby {self.current_track['artist']}"
+        # Names were cleaned when polled; only the position changes per frame
+        progress = self.playback.progress_ms()
+        duration = track['duration_ms']
+        status = "PLAY" if self.playback.is_playing else "PAUSE"
+        text = f"{track['name']} - {track['artist']}\n{status} {format_ms(progress)}/{format_ms(duration)}"
+        thumbnail = self._current_thumbnail(track)
+        
+        def overlay(fb):
+            if thumbnail is not None:
+                self.art.draw(fb, thumbnail)
+            self._draw_progress(fb, progress, duration)
+        self.scroller.draw(text, overlay=overlay, left=self.art.size + 2 if thumbnail else 0)
         
-        clean_text = self._clean_text(text)
-        self.display.draw_centered_text(clean_text)
+    def _current_thumbnail(self, track):
+        # Asks AlbumArt until the thumbnail has loaded, then keeps it
+        if self.art is None or not track.get('image_url'):
+            return None
+        url, thumbnail = self._thumbnail
+        if url != track['image_url'] or thumbnail is None:
+            thumbnail = self.art.get(track)
+            self._thumbnail = (track['image_url'], thumbnail)
+        return thumbnail
+        
+    def _draw_progress(self, fb, progress, duration):
+        # 3 pixel bar on a 1 pixel track along the bottom of the screen
+        width = self.display.width
+        y = self.display.height - 3
+        fb.hline(0, y + 1, width)
+        if duration:
+            fb.fill_rect(0, y, width * progress // duration, 3)
         
     def _toggle_playback(self):
+        """Play/pause on screen at once; the command follows in the background"""
+        playing = not self.playback.is_playing
+        self.playback.set_playing(playing)
+        self.commands.put('play' if playing else 'pause')
+        
+    def _next_track(self):
+        self.playback.skip(1)
+        self.commands.put('next')
+        
+    def _previous_track(self):
+        self.playback.skip(-1)
+        self.commands.put('previous')
+        
+    def _send_command(self, command, count):
+        """Runs on the command worker: the actual Web API calls"""
         try:
-            if self.is_playing:
+            if command == 'pause':
                 self.sp.pause_playback()
-                self.is_playing = False
-            else:
-                try:
-                    self.sp.start_playback()
-                    self.is_playing = True
-                except Exception as resume_error:
-                    print(f"Resume failed, trying to find device: {resume_error}")
-                    devices = self.sp.devices()
-                    
-                    if devices['devices']:
-                        active_device = None
-                        available_device = None
-                        
-                        for device in devices['devices']:
-                            if device['is_active']:
-                                active_device = device
-                                break
-                            elif available_device is None:
-                                available_device = device
-                        
-                        target_device = active_device or available_device
-                        
-                        if target_device:
-                            print(f"Trying device: {target_device['name']}")
-                            self.sp.start_playback(device_id=target_device['id'])
-                            self.is_playing = True
-                        else:
-                            raise Exception("No usable devices found")
-                    else:
-                        raise Exception("No devices available")
-                        
+            elif command == 'play':
+                self._start_playback()
+            elif command == 'next':
+                for _ in range(count):
+                    self.sp.next_track()
+            elif command == 'previous':
+                for _ in range(count):
+                    self.sp.previous_track()
         except Exception as e:
-            print(f"Playback toggle error: {e}")
+            print(f"Playback {command} error: {e}")
+            # Shown by _display_playback_info rather than drawn here: this
+            # runs off the UI thread. The next poll puts the real state back.
             if "No active device" in str(e) or "No devices" in str(e):
-                self.display.draw_centered_text("Open Spotify app\nand play something")
+                self.notice = ("Open Spotify app\nand play something", time.monotonic() + 2)
             else:
-                self.display.draw_centered_text("Playback error\nTry again")
+                self.notice = ("Playback error\nTry again", time.monotonic() + 2)
+            self.playback.poll_soon(0)
             
-    def _next_track(self):
+    def _start_playback(self):
         try:
-            self.sp.next_track()
-        except Exception as e:
-            print(f"Next track error: {e}")
+            self.sp.start_playback()
+        except Exception as resume_error:
+            print(f"Resume failed, trying to find device: {resume_error}")
+            devices = self.sp.devices()
             
-    def _previous_track(self):
-        try:
-            self.sp.previous_track()
-        except Exception as e:
-            print(f"Previous track error: {e}")
\ No newline at end of file
+            if devices['devices']:
+                active_device = None
+                available_device = None
+                
+                for device in devices['devices']:
+                    if device['is_active']:
+                        active_device = device
+                        break
+                    elif available_device is None:
+                        available_device = device
+                
+                target_device = active_device or available_device
+                
+                if target_device:
+                    print(f"Trying device: {target_device['name']}")
+                    self.sp.start_playback(device_id=target_device['id'])
+                else:
+                    raise Exception("No usable devices found")
+            else:
+                raise Exception("No devices available")
@@ -1,10 +1,16 @@
-import time
+from apps.menu import IDLE_TIMEOUT
+from lib.marquee import ScrollingText
+
+# Redraw interval while a long note scrolls
+FRAME_TIME = 0.05
 
 class NotesApp:
     def __init__(self, display, buttons):
         self.name = "Notes"
         self.display = display
         self.buttons = buttons
+        # Notes too long for two lines scroll as one line instead
+        self.scroller = ScrollingText(display)
         self.notes = [
             "I've put some motivational blurbs here,",
             "Kinda like fortune cookies,",
@@ -22,19 +28,30 @@ class NotesApp:
         
     def run(self):
         while True:
-            self.display.draw_centered_text(self.notes[self.current_note])
+            self.scroller.draw(self._layout(self.notes[self.current_note]))
             
-            button = self.buttons.get_pressed()
+            # Sleep until a press, or only until the next frame while scrolling
+            button = self.buttons.wait_pressed(FRAME_TIME if self.scroller.scrolling() else IDLE_TIMEOUT)
             if button == 'back':
                 return
             elif button == 'up':
                 self.current_note = (self.current_note - 1) % len(self.notes)
-                time.sleep(0.2)  # debounce
             elif button == 'down':
                 self.current_note = (self.current_note + 1) % len(self.notes)
-                time.sleep(0.2)
             elif button == 'select':
                 # Could implement adding new notes here
                 pass
                 
-            time.sleep(0.1)
+    def _layout(self, note):
+        """The note wrapped to two lines that fit the screen, or on one line
+        (which scrolls) if it needs more"""
+        font = self.display.bitmap_font
+        if not font.covers(note):
+            return note  # Wrapped by draw_centered_text as before
+        lines = []
+        for word in note.split():
+            if lines and font.text_width(f"{lines[-1]} {word}") <= self.display.width:
+                lines[-1] += f" {word}"
+            else:
+                lines.append(word)
+        return "\n".join(lines) if len(lines) <= 2 else note
@@ -0,0 +1,147 @@
+"""
+Lazy app registry.
+
+Apps are registered as descriptors (menu name, module path, factory name)
+instead of being imported up front. A module is imported and its app built
+the first time it is selected, or earlier by prewarm() while the device
+sits idle, so boot only pays for the hello screen and the menu.
+"""
+
+import importlib
+import threading
+import time
+
+class AppDescriptor:
+    """Where to find an app: factory(display, buttons) in module.
+
+    Apps with a prefetch_interval have a prefetch() method that the
+    background scheduler calls so their data is fresh when opened.
+    """
+
+    def __init__(self, name, module, factory, prefetch_interval=None, prefetch_priority=10):
+        self.name = name
+        self.module = module
+        self.factory = factory  # attribute name in module, or a callable
+        self.prefetch_interval = prefetch_interval
+        self.prefetch_priority = prefetch_priority
+        self.import_time = None  # seconds, once imported
+
+    def load(self):
+        """Import the module and return the factory"""
+        start = time.perf_counter()
+        module = importlib.import_module(self.module)
+        if self.import_time is None:
+            self.import_time = time.perf_counter() - start
+        if callable(self.factory):
+            return self.factory
+        return getattr(module, self.factory)
+
+
+class LazyApp:
+    """Menu entry that builds its app on first use and then stands in for it"""
+
+    def __init__(self, descriptor, display, buttons):
+        self.descriptor = descriptor
+        self.name = descriptor.name
+        self.display = display
+        self.buttons = buttons
+        self.app = None
+        self._state = None  # snapshot state waiting for the app to be built
+        self._lock = threading.Lock()
+
+    def get(self):
+        with self._lock:
+            if self.app is None:
+                factory = self.descriptor.load()
+                app = factory(self.display, self.buttons)
+                if self._state and hasattr(app, 'restore_state'):
+                    app.restore_state(self._state)
+                self.app = app
+            return self.app
+
+    def prefetch(self):
+        self.get().prefetch()
+
+    def get_state(self):
+        app = self.app
+        if app is not None and hasattr(app, 'get_state'):
+            return app.get_state()
+        return self._state  # Not built yet: keep the snapshot as it was
+
+    def restore_state(self, state):
+        self._state = state
+        if self.app is not None and hasattr(self.app, 'restore_state'):
+            self.app.restore_state(state)
+
+    def run(self):
+        self.get().run()
+
+    async def run_async(self, runtime):
+        # Imports can take a while on a Pi Zero: do them off the event loop
+        app = self.app or await runtime.run_blocking(self.get)
+        await runtime.run_app(app)
+
+
+class AppRegistry:
+    def __init__(self):
+        self.descriptors = []
+
+    def register(self, name, module, factory, **kwargs):
+        descriptor = AppDescriptor(name, module, factory, **kwargs)
+        self.descriptors.append(descriptor)
+        return descriptor
+
+    def lazy_apps(self, display, buttons, names=None):
+        """LazyApps for the registered apps (or just `names`), in order"""
+        return [LazyApp(d, display, buttons) for d in self.descriptors
+                if names is None or d.name in names]
+
+
+def prewarm(apps, idle=None, delay=2.0, pause=0.5):
+    """Build LazyApps one by one on a background thread.
+
+    Waits `delay` seconds first so boot isn't slowed down, and `pause`
+    seconds between apps so the UI thread gets the CPU in between. If
+    given, idle() must be true before each app is built, e.g. so a game
+    isn't starved while it's being played.
+    """
+    def warm():
+        time.sleep(delay)
+        for app in apps:
+            while idle is not None and not idle():
+                time.sleep(pause)
+            try:
+                app.get()
+            except Exception as e:
+                print(f"Prewarm of {app.name} failed: {e}")
+            time.sleep(pause)
+
+    thread = threading.Thread(target=warm, name="prewarm", daemon=True)
+    thread.start()
+    return thread
+
+
+def schedule_prefetch(scheduler, apps, delay=5.0):
+    """Register a prefetch job for every LazyApp whose descriptor asks for one"""
+    for app in apps:
+        descriptor = app.descriptor
+        if descriptor.prefetch_interval:
+            scheduler.register(app.name, app.prefetch, descriptor.prefetch_interval,
+                               priority=descriptor.prefetch_priority, delay=delay)
+
+
+def _games_menu(display, buttons):
+    from apps.games_menu import GamesMenu
+    return GamesMenu(display, buttons, games.lazy_apps(display, buttons))
+
+games = AppRegistry()
+games.register("Snake", 'apps.snake_game', 'SnakeGame')
+games.register("Dino Runner", 'apps.dino_game', 'DinoRunner')
+
+apps = AppRegistry()
+apps.register("Weather", 'apps.weather', 'WeatherApp', prefetch_interval=600, prefetch_priority=1)
+apps.register("Notes", 'apps.notes', 'NotesApp')
+apps.register("Spotify", 'apps.music_control', 'SpotifyApp', prefetch_interval=30, prefetch_priority=0)
+apps.register("Timer", 'apps.timer', 'TimerApp')
+apps.register("Games", 'apps.games_menu', _games_menu)  # Games submenu replaces individual games
+apps.register("System", 'apps.system_stats', 'SystemStatsApp')
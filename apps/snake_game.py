@@ -1,12 +1,28 @@
 import time
 import random
-from PIL import Image, ImageDraw
+from lib.sprites import Sprite
+from lib.pacer import FramePacer
+
+# 4x4 sprites, one per grid cell
+SNAKE_CELL = Sprite("""
+####
+####
+####
+####
+""")
+FOOD = Sprite("""
+ ## 
+####
+####
+ ## 
+""")
 
 class SnakeGame:
     def __init__(self, display, buttons):
         self.name = "Snake"
         self.display = display
         self.buttons = buttons
+        self.pacer = FramePacer(100, self.name)
         
         # Game settings
         self.grid_size = 4  # 4x4 pixel blocks
@@ -31,6 +47,8 @@ class SnakeGame:
         
     def run(self):
         self._reset_game()
+        self.buttons.set_profile('game')
+        self.pacer.reset()
         last_move_time = time.time()
         
         while True:
@@ -75,7 +93,7 @@ class SnakeGame:
                 
             # Draw game
             self._draw_game()
-            time.sleep(0.01)  # Faster loop for rapid input
+            self.pacer.tick()  # Fast loop for rapid input
             
     def _reset_game(self):
         self.snake = [(self.game_width // 2, self.game_height // 2)]
@@ -124,33 +142,26 @@ class SnakeGame:
             
     def _draw_game(self):
         try:
-            image = Image.new("1", (self.display.width, self.display.height))
-            draw = ImageDraw.Draw(image)
-            
             if self.game_over:
                 # Game over screen
                 self.display.draw_centered_text(f"Game Over!\nScore: {self.score}\nPress SELECT")
                 return
                 
+            fb = self.display.framebuf
+            fb.clear()
+            
             # Draw snake
             for segment in self.snake:
-                x = segment[0] * self.grid_size
-                y = segment[1] * self.grid_size
-                draw.rectangle([x, y, x + self.grid_size - 1, y + self.grid_size - 1], 
-                             fill=255)
+                fb.blit(SNAKE_CELL, segment[0] * self.grid_size, segment[1] * self.grid_size)
                 
             # Draw food (blinking effect)
             if int(time.time() * 3) % 2:  # Blink every ~0.33 seconds
-                fx = self.food[0] * self.grid_size
-                fy = self.food[1] * self.grid_size
-                draw.rectangle([fx, fy, fx + self.grid_size - 1, fy + self.grid_size - 1], 
-                             fill=255)
+                fb.blit(FOOD, self.food[0] * self.grid_size, self.food[1] * self.grid_size)
                 
             # Draw score in top-left corner
-            draw.text((0, 0), str(self.score), fill=255)
+            self.display.blit_text(str(self.score), 0, 0)
             
-            self.display.oled.image(image)
-            self.display.oled.show()
+            self.display.show()
             
         except Exception as e:
             print(f"Snake game draw error: {e}")
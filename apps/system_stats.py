@@ -0,0 +1,68 @@
+from lib.pacer import FramePacer
+from lib.metrics import metrics
+from lib.retry import STATES
+
+class SystemStatsApp:
+    """CPU, memory, temperature and load, then the gadget's own display,
+    per-app loop and API breaker metrics. Up/down pages through them."""
+
+    def __init__(self, display, buttons):
+        self.name = "System"
+        self.display = display
+        self.buttons = buttons
+        self.pacer = FramePacer(10, self.name)
+        self.page = 0
+
+    def run(self):
+        self.pacer.reset()
+        while True:
+            pages = self._pages()
+            self.page = min(self.page, len(pages) - 1)
+            self.display.draw_centered_text(pages[self.page])
+
+            button = self.buttons.get_pressed()
+            if button == 'back':
+                return
+            elif button == 'up':
+                self.page = (self.page - 1) % len(pages)
+            elif button == 'down':
+                self.page = (self.page + 1) % len(pages)
+
+            self.pacer.tick()
+
+    def _pages(self):
+        # metrics.sample() is cached for a second, so this is cheap at 10 fps
+        get = metrics.get
+        cpu = get('system_cpu_percent')
+        memory = get('system_memory_percent')
+        load = get('system_load1')
+        temperature = get('system_temperature_celsius')
+        system = (f"CPU {_fmt(cpu, '{:.0f}%')} Mem {_fmt(memory, '{:.0f}%')}\n"
+                  f"Load {_fmt(load, '{:.2f}')} {_fmt(temperature, '{:.1f}C')}")
+
+        display = (f"Out {get('display_frames_sent_per_second', 0):.1f}/s "
+                   f"skip {get('display_frames_skipped_per_second', 0):.1f}/s\n"
+                   f"I2C {get('display_i2c_bytes_per_second', 0) / 1024:.1f} kB/s")
+
+        pages = [system, display]
+        # Per app: its loop rate, and the frames it had sent or skipped as
+        # unchanged (the Menu has no loop, just frames). Rates come from the
+        # counters, so they drop to 0 once an app is left.
+        loops = metrics.by_label('app_loop_iterations_per_second', 'app')
+        sent = metrics.by_label('display_app_frames_sent_per_second', 'app')
+        skipped = metrics.by_label('display_app_frames_skipped_per_second', 'app')
+        for app in sorted(set(loops) | set(sent)):
+            loop = _fmt(loops.get(app), '{:.0f} loop/s')
+            pages.append(f"{app} {loop}\n"
+                         f"Out {sent.get(app, 0):.1f}/s skip {skipped.get(app, 0):.1f}/s")
+
+        # Circuit breakers of the web APIs
+        states = metrics.by_label('circuit_state', 'name')
+        failures = metrics.by_label('circuit_consecutive_failures', 'name')
+        for name in sorted(states):
+            pages.append(f"{name} API\n{STATES[int(states[name])]}, {failures.get(name, 0)} failed")
+        return pages
+
+
+def _fmt(value, pattern):
+    return "--" if value is None else pattern.format(value)
@@ -1,17 +1,23 @@
 import time
+from lib.pacer import FramePacer
 
 class TimerApp:
     def __init__(self, display, buttons):
         self.name = "Timer"
         self.display = display
         self.buttons = buttons
+        self.pacer = FramePacer(10, self.name)
         self.running = False
         self.start_time = 0
         self.duration = 300  # 5 minutes default
         self.saved_durations = [60, 300, 600, 1800, 3600]  # 1, 5, 10, 30, 60 minutes
+        self._resume = False  # keep a timer restored from a snapshot running
         
     def run(self):
-        self._reset_timer()
+        if not self._resume:
+            self._reset_timer()
+        self._resume = False
+        self.pacer.reset()
         while True:
             self._update_display()
             
@@ -25,7 +31,22 @@ class TimerApp:
             elif button == 'down':
                 self._decrease_duration()
                 
-            time.sleep(0.1)
+            self.pacer.tick()
+            
+    def get_state(self):
+        # The deadline is wall-clock time, so it survives a restart
+        return {
+            'duration': self.duration,
+            'running': self.running,
+            'deadline': self.start_time + self.duration if self.running else None,
+        }
+    
+    def restore_state(self, state):
+        self.duration = state.get('duration', self.duration)
+        if state.get('running') and state.get('deadline'):
+            self.start_time = state['deadline'] - self.duration
+            self.running = True
+            self._resume = True
             
     def _update_display(self):
         if self.running:
@@ -1,39 +1,92 @@
 import requests
+import threading
 import time
 import os
+import config
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime, timezone
 from dotenv import load_dotenv
+from lib.pacer import FramePacer
+from lib.marquee import ScrollingText
+from lib.diskcache import JsonCache, format_age
+from lib import http
+from lib.retry import RetryPolicy, CircuitBreaker
 
 # Load environment variables
 load_dotenv()
 
+# Shown while a fetch is running in the asyncio runtime
+SPINNER = "|/-\\"
+
+API_URL = "http://api.openweathermap.org/data/2.5/"
+VIEWS = ('weather', 'forecast')  # per city: current conditions, then forecast
+FORECAST_STEPS = 4  # forecast lines, 6 hours apart
+
+class WeatherError(Exception):
+    """API answered with an error: (short note, *lines to show)"""
+
+
 class WeatherApp:
     def __init__(self, display, buttons):
         self.name = "Weather"
         self.display = display
         self.buttons = buttons
+        self.pacer = FramePacer(10, self.name)
+        # Long track names / weather lines scroll instead of being cut off
+        self.scroller = ScrollingText(display)
         self.city = os.getenv("WEATHER_CITY", "New York")
+        # WEATHER_CITIES="New York,London,Tokyo" shows several
+        self.cities = [c.strip() for c in os.getenv("WEATHER_CITIES", self.city).split(',') if c.strip()]
+        self.city = self.cities[0]
+        self.fetch_timeout = 10  # one deadline for all cities together
         self.api_key = os.getenv("WEATHER_API_KEY")
         self.refresh_interval = 600  # 10 minutes to reduce API calls
         self.last_update = 0
         self.current_weather = "Loading..."
-        self.retry_count = 0
-        self.max_retries = 3
+        # Failed fetches back off (5 s, 10 s, 20 s ... up to the refresh
+        # interval); after 5 in a row the breaker stops them for 10 minutes
+        self.retry = RetryPolicy(base=5, max_delay=self.refresh_interval)
+        self.breaker = CircuitBreaker(self.name, failure_threshold=5, reset_timeout=self.refresh_interval)
+        self.failures = 0
+        self.next_attempt = 0  # time.monotonic() before which no automatic fetch starts
         
         # Scrolling variables
         self.scroll_position = 0
         self.weather_lines = []
         
+        # (city, view) -> (API response, fetched_at), and the display lines
+        # built from them once per fetch: [{'lines': [...], 'fetched_at': t}]
+        self.readings = {}
+        self.views = []
+        self.page = 0
+        
+        # Last good reading on disk: shown straight away after a restart,
+        # and kept on screen (with its age) while offline
+        self.cache = JsonCache(os.path.join(config.CACHE_DIR, 'weather.json'), self.refresh_interval)
+        self.has_data = False
+        self.error = None  # why the last refresh failed, while older data is shown
+        # Held by whichever fetch is running: the app's refresh thread, the
+        # async executor or the scheduler's prefetch. Others skip theirs.
+        self._fetch_lock = threading.Lock()
+        self.http = http.session('weather')  # keep-alive, shared with prefetch
+        self.pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="weather")
+        for city in self.cities:
+            for view in VIEWS:
+                data, fetched_at = self.cache.get(self._cache_key(city, view))
+                if data:
+                    self.readings[(city, view)] = (data, fetched_at)
+        if self.readings:
+            self.last_update = max(fetched_at for _, fetched_at in self.readings.values())
+            self._build_views()
+        if not self.api_key and not self.has_data:
+            # Nothing to fetch with, so nothing is ever due (see _due)
+            self._show_error("no key", "No API key", "set in .env")
+        
     def run(self):
-        # Initial weather fetch
-        if not self.current_weather or self.current_weather == "Loading...":
-            self._fetch_weather()
-            
+        self.pacer.reset()
         while True:
-            current_time = time.time()
-            
-            # Auto-refresh weather data
-            if current_time - self.last_update > self.refresh_interval:
-                self._fetch_weather()
+            # Initial fetch and auto-refresh, in the background
+            self._refresh(self._in_thread)
                 
             self._display_weather()
             
@@ -42,22 +95,65 @@ class WeatherApp:
                 return
             elif button == 'select':
                 # Manual refresh
-                self.current_weather = "Refreshing..."
-                self.display.draw_centered_text(self.current_weather)
-                self._fetch_weather()
+                if not self.has_data:
+                    self.current_weather = "Refreshing..."
+                self._refresh(self._in_thread, probe=True)
             elif button == 'up':
-                # Scroll up
-                if self.scroll_position > 0:
-                    self.scroll_position -= 1
-                time.sleep(0.2)
+                # Scroll up, or to the previous city/forecast at the top
+                self._scroll(-1)
             elif button == 'down':
-                # Scroll down
-                max_scroll = max(0, len(self.weather_lines) - 2)
-                if self.scroll_position < max_scroll:
-                    self.scroll_position += 1
-                time.sleep(0.2)
+                # Scroll down, or to the next city/forecast at the bottom
+                self._scroll(1)
                 
-            time.sleep(0.1)
+            self.pacer.tick()
+    
+    async def run_async(self, runtime):
+        """run() as an asyncio task: fetches run in the executor while the
+        screen animates and buttons stay responsive"""
+        fetch = None
+        self.pacer.reset()
+        frame = 0
+        while True:
+            # Initial fetch and auto-refresh, one at a time, as in run()
+            if fetch is None:
+                fetch = self._refresh(runtime.background)
+            if fetch is not None and fetch.done():
+                fetch = None
+                
+            if fetch is not None and (not self.weather_lines or self.current_weather == "Refreshing..."):
+                self.display.draw_centered_text(f"Refreshing {SPINNER[frame // 2 % len(SPINNER)]}")
+            else:
+                self._display_weather()
+            frame += 1
+            
+            button = runtime.buttons.get_nowait()
+            if button == 'back':
+                return  # A running fetch finishes in the background
+            elif button == 'select':
+                # Manual refresh
+                if fetch is None:
+                    self.current_weather = "Refreshing..."
+                    fetch = self._refresh(runtime.background, probe=True)
+            elif button == 'up':
+                self._scroll(-1)
+            elif button == 'down':
+                self._scroll(1)
+                
+            await self.pacer.tick_async()
+    
+    def prefetch(self):
+        """Background refresh (lib.scheduler), so the app opens on fresh data"""
+        if self._due():
+            self._fetch_weather()
+    
+    def get_state(self):
+        """The city and view on screen; the readings are in the weather cache"""
+        return {'cities': self.cities, 'page': self.page}
+    
+    def restore_state(self, state):
+        if state.get('cities') != self.cities:
+            return  # Configured for other cities since
+        self._show_page(state.get('page', 0))
     
     def _display_weather(self):
         if not self.weather_lines:
@@ -66,71 +162,222 @@ class WeatherApp:
         
         # Show 2 lines at a time based on scroll position
         visible_lines = self.weather_lines[self.scroll_position:self.scroll_position + 2]
+        if not visible_lines:
+            return
+        note = self._status_note()
+        if note and self.scroll_position == 0:
+            visible_lines = [f"{visible_lines[0]} ({note})"] + visible_lines[1:]
         scroll_text = "\n".join(visible_lines)
-        self.display.draw_centered_text(scroll_text)
+        self.scroller.draw(scroll_text)
+    
+    def _scroll(self, step):
+        """Scroll the lines on screen; past either end, page to the next or
+        previous view (current weather / forecast of each city)"""
+        max_scroll = max(0, len(self.weather_lines) - 2)
+        position = self.scroll_position + step
+        if 0 <= position <= max_scroll:
+            self.scroll_position = position
+        elif len(self.views) > 1:
+            self._show_page(self.page + step)
+            if step < 0:
+                self.scroll_position = max(0, len(self.weather_lines) - 2)
+    
+    def _show_page(self, page):
+        if not self.views:
+            return
+        self.page = page % len(self.views)
+        self.weather_lines = self.views[self.page]['lines']
+        self.scroll_position = 0
+    
+    def _status_note(self):
+        # Marks data that is being refreshed, out of date or couldn't be refreshed
+        if not self.has_data or not self.views:
+            return None
+        if self._fetch_lock.locked():
+            return "updating"
+        fetched_at = self.views[self.page % len(self.views)]['fetched_at']
+        age = format_age(time.time() - fetched_at)
+        if self.error:
+            return f"{self.error} {age} ago"
+        if self.cache.is_stale(fetched_at):
+            return f"{age} ago"
+        return None
+    
+    def _due(self):
+        """Whether an automatic refresh should start: the data is old and
+        neither a backoff nor an open breaker says to wait"""
+        if not self.api_key:
+            return False
+        return (time.time() - self.last_update > self.refresh_interval
+                and time.monotonic() >= self.next_attempt and self.breaker.ready())
+    
+    def _refresh(self, background, probe=False):
+        """Start a fetch if one is due (or asked for: probe) and none is
+        running; current data stays up meanwhile. background(func, *args)
+        runs it off the UI loop: _in_thread for run(), the runtime's
+        executor for run_async(). Returns its handle, or None."""
+        if (not probe and not self._due()) or self._fetch_lock.locked():
+            return None
+        return background(self._fetch_weather, probe)
+    
+    def _in_thread(self, func, *args):
+        thread = threading.Thread(target=func, args=args, name="weather", daemon=True)
+        thread.start()
+        return thread
+    
+    def _build_views(self):
+        """Turn the readings into display lines, once per fetch rather than
+        every frame"""
+        views = []
+        for city in self.cities:
+            for view in VIEWS:
+                reading = self.readings.get((city, view))
+                if reading is None:
+                    continue
+                data, fetched_at = reading
+                if view == 'weather':
+                    lines = self._current_lines(city, data)
+                else:
+                    lines = self._forecast_lines(city, data)
+                views.append({'lines': lines, 'fetched_at': fetched_at})
+        
+        on_screen = self.scroll_position
+        self.views = views
+        self.has_data = bool(views)
+        self.error = None
+        self._show_page(self.page)
+        self.scroll_position = min(on_screen, max(0, len(self.weather_lines) - 2))
+        
+        # Create the old format for fallback
+        self.current_weather = "\n".join(self.weather_lines)
+    
+    def _current_lines(self, city, data):
+        temp = data["main"]["temp"]
+        feels_like = data["main"]["feels_like"]
+        desc = data["weather"][0]["description"]
+        humidity = data["main"]["humidity"]
+        return [
+            f"{city}",
+            f"{temp:.0f}°F (feels {feels_like:.0f}°F)",
+            f"{desc.title()}",
+            f"{humidity}% humid"
+        ]
+    
+    def _forecast_lines(self, city, data):
+        # 3-hourly entries; every other one, in the city's local time
+        offset = data.get("city", {}).get("timezone", 0)
+        lines = [f"{city} forecast"]
+        for entry in data["list"][::2][:FORECAST_STEPS]:
+            local = datetime.fromtimestamp(entry["dt"] + offset, timezone.utc)
+            hour = f"{local.hour % 12 or 12}{'am' if local.hour < 12 else 'pm'}"
+            lines.append(f"{local:%a} {hour} {entry['main']['temp']:.0f}°F {entry['weather'][0]['main']}")
+        return lines
+    
+    def _cache_key(self, city, view):
+        return city if view == 'weather' else f"{city}/{view}"
+    
+    def _failed(self, error, *message):
+        """Back off before the next automatic attempt, and show why"""
+        self.failures += 1
+        self.next_attempt = time.monotonic() + self.retry.delay(self.failures)
+        self.breaker.record_failure(error)
+        self._show_error(*message)
+    
+    def _show_error(self, error, *lines):
+        # With good data to show, keep it up and just note the error
+        if self.has_data:
+            self.error = error
+            return
+        self.current_weather = "\n".join(lines)
+        self.weather_lines = list(lines)
             
-    def _fetch_weather(self):
+    def _fetch_weather(self, probe=False):
+        """probe: a manual refresh, which skips the backoff and may try
+        the API even while the breaker is open. Does nothing if a fetch
+        is already running."""
+        if not self._fetch_lock.acquire(blocking=False):
+            return
+        try:
+            self._fetch(probe)
+        finally:
+            self._fetch_lock.release()
+            
+    def _fetch(self, probe):
         if not self.api_key:
             self.current_weather = "No API key\nset in .env"
             self.weather_lines = ["No API key", "set in .env"]
             return
+        if not self.breaker.allow(probe):
+            return
             
         try:
-            url = f"http://api.openweathermap.org/data/2.5/weather"
-            params = {
-                'q': self.city,
-                'appid': self.api_key,
-                'units': 'imperial'
-            }
+            # Every city's current weather and forecast at once, under one
+            # deadline; whatever hasn't answered by then keeps its last reading
+            deadline = time.monotonic() + self.fetch_timeout
+            requests_sent = {}
+            for city in self.cities:
+                for view in VIEWS:
+                    future = self.pool.submit(self._get, view, city, deadline)
+                    requests_sent[future] = (city, view)
+            done, not_done = wait(requests_sent, timeout=max(0.0, deadline - time.monotonic()))
+            for future in not_done:
+                future.cancel()
             
-            response = requests.get(url, params=params, timeout=10)
+            fetched_at = time.time()
+            errors = []
+            for future, (city, view) in requests_sent.items():
+                if future in not_done:
+                    errors.append(requests.exceptions.Timeout())
+                    continue
+                try:
+                    data = future.result()
+                except Exception as e:
+                    errors.append(e)
+                    continue
+                self.readings[(city, view)] = (data, fetched_at)
+                self.cache.put(self._cache_key(city, view), data)
             
-            if response.status_code == 200:
-                data = response.json()
-                temp = data["main"]["temp"]
-                feels_like = data["main"]["feels_like"]
-                desc = data["weather"][0]["description"]
-                humidity = data["main"]["humidity"]
-                
-                # Create the old format for fallback
-                self.current_weather = f"{self.city}\n{temp:.0f}°F (feels {feels_like:.0f}°F)\n{desc.title()}\n{humidity}% humid"
-                
-                # Create scrollable lines from the same data
-                self.weather_lines = [
-                    f"{self.city}",
-                    f"{temp:.0f}°F (feels {feels_like:.0f}°F)",
-                    f"{desc.title()}",
-                    f"{humidity}% humid"
-                ]
-                
-                self.last_update = time.time()
-                self.retry_count = 0
-                self.scroll_position = 0
-                
-            elif response.status_code == 401:
-                self.current_weather = "Invalid API key"
-                self.weather_lines = ["Invalid API key"]
-            elif response.status_code == 404:
-                self.current_weather = f"City '{self.city}'\nnot found"
-                self.weather_lines = [f"City '{self.city}'", "not found"]
+            if len(errors) < len(requests_sent):
+                # Partly answered still means the API is reachable
+                self.last_update = fetched_at
+                self.failures = 0
+                self.next_attempt = 0
+                self.breaker.record_success()
+                self._build_views()
             else:
-                self.current_weather = f"Weather error\n{response.status_code}"
-                self.weather_lines = ["Weather error", f"Code: {response.status_code}"]
+                raise errors[0]
                 
-        except requests.exceptions.Timeout:
-            self.current_weather = "Connection\ntimeout"
-            self.weather_lines = ["Connection", "timeout"]
-        except requests.exceptions.ConnectionError:
-            self.current_weather = "No internet\nconnection"
-            self.weather_lines = ["No internet", "connection"]
+        except WeatherError as e:
+            self._failed(e, *e.args)
+        except requests.exceptions.Timeout as e:
+            self._failed(e, "timeout", "Connection", "timeout")
+        except requests.exceptions.ConnectionError as e:
+            self._failed(e, "offline", "No internet", "connection")
         except Exception as e:
-            self.retry_count += 1
-            if self.retry_count <= self.max_retries:
-                self.current_weather = f"Retrying...\n({self.retry_count}/{self.max_retries})"
-                self.weather_lines = ["Retrying...", f"({self.retry_count}/{self.max_retries})"]
-                time.sleep(2)
-                self._fetch_weather()
-            else:
-                self.current_weather = f"Weather error:\n{str(e)[:20]}"
-                self.weather_lines = ["Weather error:", str(e)[:20]]
-                print(f"Weather error: {e}")
\ No newline at end of file
+            self._failed(e, "error", "Weather error:", str(e)[:20])
+            print(f"Weather error: {e}")
+    
+    def _get(self, view, city, deadline):
+        """One API request (view is 'weather' or 'forecast'), given whatever
+        time is left until the deadline"""
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise requests.exceptions.Timeout()
+        params = {
+            'q': city,
+            'appid': self.api_key,
+            'units': 'imperial'
+        }
+        if view == 'forecast':
+            params['cnt'] = FORECAST_STEPS * 2
+        response = self.http.get(API_URL + view, params=params,
+                                 timeout=(min(http.DEFAULT_TIMEOUT[0], remaining), remaining))
+        
+        if response.status_code == 200:
+            return response.json()
+        elif response.status_code == 401:
+            raise WeatherError("bad key", "Invalid API key")
+        elif response.status_code == 404:
+            raise WeatherError("not found", f"City '{city}'", "not found")
+        else:
+            raise WeatherError(f"error {response.status_code}", "Weather error", f"Code: {response.status_code}")
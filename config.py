@@ -1,13 +1,67 @@
+import os
+
+# Files the gadget writes (state, caches) go here, next to this file
+# rather than wherever it was started from
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache')
+
 # Hardware config
 OLED_WIDTH = 128
 OLED_HEIGHT = 32
 OLED_ADDRESS = 0x3C
+# Push frames to the panel from a background thread (latest frame wins)
+OLED_ASYNC_FLUSH = True
+# Run the menu and apps on the asyncio runtime (lib/runtime.py), so network
+# calls don't freeze the screen or drop button presses
+ASYNC_RUNTIME = False
+# Import and build apps in the background once the menu is up, instead of
+# when they're first selected
+APP_PREWARM = True
+
+# Warm restart: UI and app state are saved here on shutdown and every
+# STATE_SAVE_INTERVAL seconds (None disables it). A snapshot younger than
+# WARM_RESTART_MAX_AGE seconds puts its last frame straight back on the
+# screen and skips the hello screen.
+STATE_FILE = os.path.join(CACHE_DIR, 'state.json')
+STATE_SAVE_INTERVAL = 30
+WARM_RESTART_MAX_AGE = 600
+
+# Background data prefetch (lib/scheduler.py): worker threads, and seconds
+# without a button press after which jobs pause until the device is used
+SCHEDULER_WORKERS = 2
+SCHEDULER_IDLE_AFTER = 900
 
 # Button pins (using BCM numbering)
 BUTTON_UP = 17
 BUTTON_DOWN = 27
 BUTTON_SELECT = 22
 BUTTON_BACK = 23
+# Queue button edges from GPIO interrupts instead of polling the pins
+BUTTON_EDGE_DETECT = True
+# Seconds between two accepted presses of the same button, per input profile
+DEBOUNCE_PROFILES = {
+    'default': 0.2,
+    'game': 0.05,  # Snake and Dino want fast repeated input
+}
+
+# Measure button-to-panel latency per app, written to the file on exit
+LATENCY_TRACE = True
+LATENCY_TRACE_FILE = os.path.join(CACHE_DIR, 'latency.json')
+
+# Spotify album art thumbnails: dithered once, then kept in CACHE_DIR
+ALBUM_ART = True
+ALBUM_ART_CACHE_BYTES = 512 * 1024
+
+# Print every Weather/Spotify HTTP request with its latency and size
+HTTP_LOG = False
+
+# Metrics (lib/metrics.py) in Prometheus text format: served on this Unix
+# socket and/or rewritten every METRICS_FILE_INTERVAL seconds to this file
+# (None disables either). Sources are sampled at most every
+# METRICS_MIN_INTERVAL seconds however often they're read.
+METRICS_SOCKET = '/tmp/oled-metrics.sock'
+METRICS_FILE = None
+METRICS_FILE_INTERVAL = 15
+METRICS_MIN_INTERVAL = 1.0
 
 # App config
 MENU_OPTIONS = ["Weather", "Sweet Notes", "Spotify", "Timer", "Games"]
\ No newline at end of file
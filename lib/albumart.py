@@ -0,0 +1,157 @@
+"""
+Album art as small 1-bit thumbnails for the Spotify screen.
+
+Decoding a JPEG and dithering it is far too slow for a frame on a Pi
+Zero, so each album is converted once, on a worker thread, and kept in
+page layout: in memory (an LRUCache) in front of a size-bounded DiskLRU
+that survives restarts. Drawing a thumbnail is then a few draw_row calls.
+
+Sources are image URLs from the Web API or local image paths (for
+testing without Spotify).
+"""
+
+import hashlib
+import io
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .diskcache import DiskLRU
+from .framebuf import pack_image
+from .lru import LRUCache
+from .retry import RetryPolicy
+
+class AlbumArt:
+    """size x size thumbnails keyed by album ID. get() never blocks: a
+    missing thumbnail is loaded in the background and shows up on a later
+    frame."""
+
+    def __init__(self, directory, size=28, disk_bytes=512 * 1024, memory_bytes=16 * 1024):
+        self.size = size
+        self.pages = (size + 7) // 8
+        self.memory = LRUCache(memory_bytes)
+        self.disk = DiskLRU(directory, disk_bytes)
+        self.pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="album-art")
+        self._pending = set()
+        # key -> (failures in a row, time.monotonic() of the next try): a
+        # cover that failed to load is tried again 30 s, 1 min ... 1 h later
+        self._failed = {}
+        self.retry = RetryPolicy(base=30, max_delay=3600)
+        self._lock = threading.Lock()
+        self.stats = {
+            'loaded': 0,  # decoded and dithered
+            'failed': 0,
+            'load_seconds_total': 0.0,
+        }
+        art[directory] = self
+
+    def get(self, track):
+        """The packed thumbnail for a track, or None while it's loading"""
+        key = self._key(track)
+        if key is None:
+            return None
+        with self._lock:
+            thumbnail = self.memory.get(key)
+        if thumbnail is None:
+            self._request(key, track.get('image_url'))
+        return thumbnail
+
+    def prefetch(self, track):
+        """Load a track's art ahead of time, e.g. the next track in the queue"""
+        key = self._key(track)
+        if key is not None and key not in self.memory:
+            self._request(key, track.get('image_url'))
+
+    def draw(self, fb, thumbnail, x=0):
+        """Draw a thumbnail at the top of the screen, column x"""
+        size = self.size
+        for page in range(self.pages):
+            fb.draw_row(page, x, thumbnail[page * size:(page + 1) * size])
+
+    def _key(self, track):
+        source = track.get('image_url') if track else None
+        if not source:
+            return None
+        album_id = track.get('album_id')
+        if album_id:
+            name = re.sub(r'[^A-Za-z0-9_-]', '_', album_id)
+        else:
+            name = hashlib.sha1(source.encode()).hexdigest()[:16]
+        # The size is part of the key, so a different size never gets old art
+        return f"{name}-{self.size}.bin"
+
+    def _request(self, key, source):
+        with self._lock:
+            failed = self._failed.get(key)
+            if key in self._pending or (failed is not None and time.monotonic() < failed[1]):
+                return
+            self._pending.add(key)
+        self.pool.submit(self._load, key, source)
+
+    def _load(self, key, source):
+        try:
+            thumbnail = self.disk.get(key)
+            if thumbnail is None:
+                start = time.perf_counter()
+                thumbnail = dither(_open(source), self.size)
+                self.stats['load_seconds_total'] += time.perf_counter() - start
+                self.stats['loaded'] += 1
+                self.disk.put(key, thumbnail)
+            with self._lock:
+                self.memory.put(key, thumbnail)
+                self._failed.pop(key, None)
+        except Exception as e:
+            print(f"Album art error: {e}")
+            self.stats['failed'] += 1
+            with self._lock:
+                failures = self._failed.get(key, (0, 0))[0] + 1
+                self._failed[key] = (failures, time.monotonic() + self.retry.delay(failures))
+        finally:
+            with self._lock:
+                self._pending.discard(key)
+
+
+def _open(source):
+    from PIL import Image
+
+    if source.startswith(('http://', 'https://')):
+        from . import http
+        response = http.session('albumart').get(source)
+        response.raise_for_status()
+        return Image.open(io.BytesIO(response.content))
+    if source.startswith('file://'):
+        source = source[len('file://'):]
+    return Image.open(os.path.expanduser(source))
+
+def dither(image, size):
+    """Fit an image into size x size and Floyd-Steinberg dither it to 1-bit,
+    packed in page layout for FrameBuffer.draw_row"""
+    from PIL import Image, ImageOps
+
+    # JPEGs can decode straight to grayscale at 1/2../1/8 scale, which is
+    # most of the work saved on 300px or 640px cover art
+    image.draft('L', (size, size))
+    image = ImageOps.fit(image.convert('L'), (size, size), Image.Resampling.BILINEAR)
+    # Stretch the levels first, or dark covers dither to almost nothing
+    image = ImageOps.autocontrast(image, cutoff=2)
+    return pack_image(image.convert('1', dither=Image.Dither.FLOYDSTEINBERG))
+
+
+# Every AlbumArt by cache directory, for lib.metrics
+art = {}
+
+def metrics_source():
+    samples = []
+    for album_art in list(art.values()):
+        memory = album_art.memory.stats
+        disk = album_art.disk.stats
+        samples.append(('albumart_memory_hits_total', {}, memory['hits']))
+        samples.append(('albumart_memory_misses_total', {}, memory['misses']))
+        samples.append(('albumart_disk_hits_total', {}, disk['hits']))
+        samples.append(('albumart_disk_bytes', {}, disk['bytes']))
+        samples.append(('albumart_loaded_total', {}, album_art.stats['loaded']))
+        samples.append(('albumart_failed_total', {}, album_art.stats['failed']))
+        samples.append(('albumart_load_seconds_total', {}, album_art.stats['load_seconds_total']))
+    return samples
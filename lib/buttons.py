@@ -1,10 +1,27 @@
-import RPi.GPIO as GPIO
+import queue
 import time
+from collections import namedtuple
+
+# A button edge: pressed is True on press, False on release.
+# timestamp is time.monotonic() when the edge was seen.
+ButtonEvent = namedtuple('ButtonEvent', ['button', 'pressed', 'timestamp'])
+
+# Hardware glitch filter for edge detection, in milliseconds
+EDGE_BOUNCE_MS = 5
+# Queued edges at most, and the age (seconds) after which a queued press is
+# dropped: it piled up while the app was busy and would act late
+EVENT_QUEUE_SIZE = 32
+MAX_PRESS_AGE = 0.5
 
 class ButtonHandler:
-    def __init__(self, config):
-        GPIO.setmode(GPIO.BCM)
-        GPIO.setwarnings(False)
+    def __init__(self, config, gpio=None, edge_detect=None):
+        # RPi.GPIO by default; pass lib.virtual.VirtualGPIO to run headless
+        if gpio is None:
+            import RPi.GPIO as gpio
+        self.gpio = gpio
+        
+        self.gpio.setmode(self.gpio.BCM)
+        self.gpio.setwarnings(False)
         
         self.button_pins = {
             'up': config.BUTTON_UP,
@@ -12,26 +29,161 @@ class ButtonHandler:
             'select': config.BUTTON_SELECT,
             'back': config.BUTTON_BACK
         }
+        self.pin_buttons = {pin: name for name, pin in self.button_pins.items()}
         
         # Setup buttons with pull-up resistors
         for pin in self.button_pins.values():
-            GPIO.setup(pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
+            self.gpio.setup(pin, self.gpio.IN, pull_up_down=self.gpio.PUD_UP)
         
         self.last_press_time = {}
-        self.debounce_delay = 0.2
+        self.started = time.monotonic()
+        # Minimum time between two accepted presses of the same button,
+        # switched per app with set_profile()
+        self.debounce_profiles = dict(config.DEBOUNCE_PROFILES)
+        self.profile = 'default'
+        self.debounce_delay = self.debounce_profiles['default']
+        
+        # Edge-triggered mode: GPIO callbacks feed a queue of ButtonEvents
+        if edge_detect is None:
+            edge_detect = config.BUTTON_EDGE_DETECT
+        self.edge_detect = edge_detect
+        self.events = queue.Queue(maxsize=EVENT_QUEUE_SIZE)
+        self._down = set()
+        self.dropped = 0  # stale presses and edges that didn't fit in the queue
+        # Optional lib.latency.LatencyTracer, told about every delivered press
+        self.tracer = None
+        # Optional lib.replay.InputRecorder, to replay this session later
+        self.recorder = None
+        # Optional Display, to count its frames per app
+        self.display = None
+        if self.edge_detect:
+            for pin in self.button_pins.values():
+                self.gpio.add_event_detect(pin, self.gpio.BOTH, callback=self._on_edge,
+                                           bouncetime=EDGE_BOUNCE_MS)
+    
+    def set_profile(self, profile):
+        """Switch debounce profile, e.g. 'game' for fast repeated input"""
+        self.profile = profile
+        self.debounce_delay = self.debounce_profiles.get(profile, self.debounce_profiles['default'])
+    
+    def idle_time(self):
+        """Seconds since the last accepted press, or since startup"""
+        last = max(self.last_press_time.values(), default=self.started)
+        return time.monotonic() - last
+    
+    def set_app(self, name):
+        """Attribute the following presses (in latency traces) and frames to app `name`"""
+        if self.tracer is not None:
+            self.tracer.set_app(name)
+        if self.display is not None:
+            self.display.app = name
+    
+    def _on_edge(self, pin):
+        # Runs on the GPIO library's callback thread
+        name = self.pin_buttons.get(pin)
+        if name is None:
+            return
+        now = time.monotonic()
+        pressed = not self.gpio.input(pin)
         
+        if pressed:
+            last = self.last_press_time.get(name)
+            if name in self._down or (last is not None and now - last <= self.debounce_delay):
+                return
+            self.last_press_time[name] = now
+            self._down.add(name)
+        elif name in self._down:
+            self._down.discard(name)
+        else:
+            return  # Release of a press that was debounced away
+        try:
+            self.events.put_nowait(ButtonEvent(name, pressed, now))
+        except queue.Full:
+            self.dropped += 1
+            if pressed:
+                self._down.discard(name)  # so its release is ignored, not the next press
+    
     def get_pressed(self):
-        current_time = time.time()
+        if self.edge_detect:
+            # Next queued press; releases are only of interest to wait_event()
+            while True:
+                event = self._next_event(block=False)
+                if event is None:
+                    return None
+                if event.pressed:
+                    return event.button
+        
+        current_time = time.monotonic()
         
         for name, pin in self.button_pins.items():
             # Button is pressed when pin reads LOW (due to pull-up)
-            if not GPIO.input(pin):
+            if not self.gpio.input(pin):
                 # Check debounce
                 if name not in self.last_press_time or \
                    (current_time - self.last_press_time[name]) > self.debounce_delay:
                     self.last_press_time[name] = current_time
-                    return name
+                    return self._deliver(name, current_time)
         return None
     
+    def _deliver(self, button, timestamp):
+        if self.tracer is not None:
+            self.tracer.input(button, timestamp)
+        if self.recorder is not None:
+            self.recorder.record(button, timestamp)
+        return button
+    
+    def wait_event(self, timeout=None, poll_interval=0.02):
+        """Block until the next ButtonEvent, or return None after timeout seconds.
+        
+        In polling mode presses are sampled every poll_interval and
+        reported without matching release events.
+        """
+        if self.edge_detect:
+            return self._next_event(timeout)
+        
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            button = self.get_pressed()
+            if button:
+                return ButtonEvent(button, True, time.monotonic())
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                time.sleep(min(poll_interval, remaining))
+            else:
+                time.sleep(poll_interval)
+    
+    def wait_pressed(self, timeout=None):
+        """Block until a button is pressed and return its name, or None on timeout"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0, deadline - time.monotonic())
+            event = self.wait_event(remaining)
+            if event is None:
+                return None
+            if event.pressed:
+                return event.button
+    
+    def _next_event(self, timeout=None, block=True):
+        # Next queued edge, passing presses through _deliver() and dropping
+        # those older than MAX_PRESS_AGE
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0, deadline - time.monotonic())
+            try:
+                event = self.events.get(block, remaining)
+            except queue.Empty:
+                return None
+            if event.pressed:
+                if time.monotonic() - event.timestamp > MAX_PRESS_AGE:
+                    self.dropped += 1
+                    continue
+                self._deliver(event.button, event.timestamp)
+            return event
+    
     def cleanup(self):
-        GPIO.cleanup()
\ No newline at end of file
+        if self.edge_detect:
+            for pin in self.button_pins.values():
+                self.gpio.remove_event_detect(pin)
+        self.gpio.cleanup()
@@ -0,0 +1,152 @@
+import json
+import os
+import threading
+import time
+
+class JsonCache:
+    """Values that should survive a restart (last good API responses), kept
+    in one small JSON file with the time each was stored.
+
+    Entries are returned however old they are, along with their age, so
+    callers can show stale data while they fetch fresh data.
+    """
+
+    def __init__(self, path, ttl):
+        self.path = path
+        self.ttl = ttl  # seconds until an entry is stale
+        self._entries = None
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """(value, stored_at), or (None, None) if there's no entry"""
+        with self._lock:
+            entry = self._load().get(key)
+        if not entry:
+            return None, None
+        return entry['value'], entry['stored_at']
+
+    def is_stale(self, stored_at):
+        return stored_at is None or time.time() - stored_at > self.ttl
+
+    def put(self, key, value):
+        with self._lock:
+            entries = self._load()
+            entries[key] = {'value': value, 'stored_at': time.time()}
+            directory = os.path.dirname(self.path)
+            tmp = self.path + '.tmp'
+            try:
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                with open(tmp, 'w') as f:
+                    json.dump(entries, f, separators=(',', ':'))
+                os.replace(tmp, self.path)
+            except OSError as e:
+                print(f"Cache save error: {e}")
+
+    def _load(self):
+        if self._entries is None:
+            try:
+                with open(self.path) as f:
+                    self._entries = json.load(f)
+            except FileNotFoundError:
+                self._entries = {}
+            except (OSError, ValueError) as e:
+                print(f"Cache load error: {e}")
+                self._entries = {}
+        return self._entries
+
+
+class DiskLRU:
+    """Small binary blobs, one file each, capped at max_bytes in total.
+
+    A file's mtime is its last use: get() touches it, and put() removes
+    the least recently used files once the directory is over the cap.
+    """
+
+    def __init__(self, directory, max_bytes=512 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._index = None  # name -> [size, last used]
+        self._lock = threading.Lock()
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'bytes': 0,
+        }
+
+    def get(self, name):
+        path = os.path.join(self.directory, name)
+        with self._lock:
+            try:
+                with open(path, 'rb') as f:
+                    data = f.read()
+                os.utime(path)
+            except OSError:
+                self.stats['misses'] += 1
+                return None
+            self.stats['hits'] += 1
+            entry = self._load().get(name)
+            if entry is not None:
+                entry[1] = time.time()
+            return data
+
+    def put(self, name, data):
+        path = os.path.join(self.directory, name)
+        with self._lock:
+            index = self._load()
+            tmp = path + '.tmp'
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                with open(tmp, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp, path)
+            except OSError as e:
+                print(f"Cache save error: {e}")
+                return
+            index[name] = [len(data), time.time()]
+            self._evict(index)
+
+    def _evict(self, index):
+        total = sum(size for size, _ in index.values())
+        for name in sorted(index, key=lambda name: index[name][1]):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+            total -= index.pop(name)[0]
+            self.stats['evictions'] += 1
+        self.stats['bytes'] = total
+
+    def _load(self):
+        # Sizes and last use of what's on disk, read once
+        if self._index is None:
+            self._index = {}
+            try:
+                names = os.listdir(self.directory)
+            except FileNotFoundError:
+                names = []
+            for name in names:
+                if name.endswith('.tmp'):
+                    continue
+                try:
+                    info = os.stat(os.path.join(self.directory, name))
+                except OSError:
+                    continue
+                self._index[name] = [info.st_size, info.st_mtime]
+            self.stats['bytes'] = sum(size for size, _ in self._index.values())
+        return self._index
+
+
+def format_age(seconds):
+    """'45s', '12m', '3h', '2d'"""
+    seconds = max(0, int(seconds))
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m"
+    if seconds < 86400:
+        return f"{seconds // 3600}h"
+    return f"{seconds // 86400}d"
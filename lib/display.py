@@ -1,19 +1,93 @@
-from PIL import Image, ImageDraw, ImageFont
-import adafruit_ssd1306
 import textwrap
+import threading
+import time
+from .lru import LRUCache
+from .font import BitmapFont
+from .framebuf import FrameBuffer, pack_image, pack_bytes
+
+# SSD1306 commands used for partial updates
+SET_COL_ADDR = 0x21
+SET_PAGE_ADDR = 0x22
+SET_DISP_OFF = 0xAE
+
+# I2C control bytes: a stream of commands, or a stream of GDDRAM data
+CONTROL_CMD = 0x00
+CONTROL_DATA = 0x40
+
+FONT_PATH = '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf'
+# Precompiled atlas of FONT_PATH at 10px, see scripts/build_font.py
+FONT_ATLAS = 'dejavusans_10'
+
+# Bus bytes spent on one addressing transaction (address + control + 6 cmds).
+# Used to decide when two dirty windows are cheaper to send as one.
+WINDOW_OVERHEAD = 8
 
 class Display:
-    def __init__(self, i2c, width=128, height=32, address=0x3C):
+    def __init__(self, i2c, width=128, height=32, address=0x3C, text_cache_bytes=256 * 1024, oled=None):
         try:
-            self.oled = adafruit_ssd1306.SSD1306_I2C(width, height, i2c, addr=address)
+            # The real panel by default; pass lib.virtual.VirtualSSD1306 to run headless
+            if oled is None:
+                import adafruit_ssd1306
+                oled = adafruit_ssd1306.SSD1306_I2C(width, height, i2c, addr=address)
+            self.oled = oled
             self.width = width
             self.height = height
+            self.pages = height // 8
+            # Narrow panels are mapped to the centre of the 128 column GDDRAM
+            self.col_offset = (128 - width) // 2 if width != 128 else 0
             
-            # Try to load a better font, fall back to default
+            # Frame being composed, in SSD1306 page layout (page * width + x)
+            self.buffer = bytearray(width * self.pages)
+            # Sprite/rectangle drawing straight into the buffer, for games
+            self.framebuf = FrameBuffer(self.buffer, width, height)
+            # Copy of what is actually on the panel, used to send only changes
+            self._shadow = bytearray(width * self.pages)
+            self._force_full = True
+            # Last frame handed to the panel (or to the writer thread), so
+            # identical frames are dropped before any diffing or I2C traffic
+            self._last_frame = None
+            
+            # Optional background writer, see start_writer()
+            self._writer = None
+            self._writer_running = False
+            self._writer_busy = False
+            self._pending = None  # (frame, full, traces) waiting for the writer
+            self._cond = threading.Condition()
+            self._bus_lock = threading.Lock()
+            
+            # Arguments of the draw call that produced the current buffer, so
+            # a repeated draw_*_text call can skip rendering altogether
+            self._last_draw = None
+            
+            # Laid out and packed frames for draw_centered_text, keyed by
+            # (text, font, alignment). 256 KB holds ~500 full 128x32 screens.
+            self.text_cache = LRUCache(text_cache_bytes, sizeof=self._text_entry_size)
+            
+            # Optional lib.latency.LatencyTracer, completed when a frame lands
+            self.tracer = None
+            
+            # App on screen (set through ButtonHandler.set_app), and the
+            # frames sent/skipped while each app was: app -> [sent, skipped]
+            self.app = None
+            self.app_frames = {}
+            
+            self.stats = {
+                'frames_sent': 0,
+                'frames_skipped': 0,  # identical frame, nothing sent
+                'renders_skipped': 0,  # identical draw call, nothing rendered
+                'frames_dropped': 0,  # replaced by a newer frame before being sent
+                'bytes_sent': 0,
+                'transfer_time': 0.0,  # total seconds spent on I2C
+                'transfer_time_max': 0.0,
+            }
+            
+            # Text is blitted from a precompiled glyph atlas. The TrueType
+            # font is only loaded if the atlas is missing or lacks a glyph.
+            self._font = None
             try:
-                self.font = ImageFont.truetype('/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf', 10)
-            except:
-                self.font = ImageFont.load_default()
+                self.bitmap_font = BitmapFont.load(FONT_ATLAS)
+            except ImportError:
+                self.bitmap_font = BitmapFont.from_pil(self.font, FONT_ATLAS)
                 
             self.clear()
             
@@ -21,15 +95,27 @@ class Display:
             print(f"Display initialization error: {e}")
             raise
         
+    @property
+    def font(self):
+        if self._font is None:
+            from PIL import ImageFont
+            
+            # Try to load a better font, fall back to default
+            try:
+                self._font = ImageFont.truetype(FONT_PATH, 10)
+            except:
+                self._font = ImageFont.load_default()
+        return self._font
+        
     def clear(self):
         try:
-            # Clear the display buffer
-            self.oled.fill(0)
-            self.oled.show()
-            
-            # Force a second clear to ensure it's really off
-            self.oled.fill(0)
-            self.oled.show()
+            # Blank the buffer and force a full write so the panel is really off,
+            # whatever state it was left in by a previous run
+            self.buffer[:] = bytes(len(self.buffer))
+            self._force_full = True
+            self._last_frame = None
+            self._last_draw = None
+            self._flush()
             
         except Exception as e:
             print(f"Display clear error: {e}")
@@ -37,64 +123,306 @@ class Display:
     def power_off(self):
         """More aggressive clear for shutdown"""
         try:
-            # Clear multiple times
-            for _ in range(5):
-                self.oled.fill(0)
-                self.oled.show()
+            self.clear()
+            self.wait_idle()
             
             # Try to turn off the display entirely if possible
             try:
                 # Some displays support this command
-                self.oled.write_cmd(0xAE)  # Display OFF command
+                with self._bus_lock:
+                    self.oled.write_cmd(SET_DISP_OFF)
             except:
                 pass
                 
         except Exception as e:
             print(f"Display power off error: {e}")
         
+    def show_image(self, image):
+        """Load a 1-bit PIL image into the framebuffer and flush it"""
+        self.load_image(image)
+        self.show()
+
+    def show(self):
+        """Send the parts of the framebuffer that differ from the panel"""
+        # The buffer may have been drawn into directly, so the next
+        # draw_*_text call can't assume it still holds its output
+        self._last_draw = None
+        self._flush()
+
+    def current_frame(self):
+        """The last frame sent (or queued) to the panel in page layout, or
+        None if the panel's contents aren't known"""
+        return self._last_frame
+
+    def _flush(self):
+        if self._last_frame is not None and self.buffer == self._last_frame:
+            self.stats['frames_skipped'] += 1
+            self._app_counts()[1] += 1
+            if self.tracer is not None:
+                self.tracer.unchanged()
+            return
+        
+        frame = bytes(self.buffer)
+        full = self._force_full
+        traces = self.tracer.take() if self.tracer is not None else None
+        
+        if self._writer is None:
+            try:
+                self._transfer(frame, full, traces, self.app)
+            except Exception:
+                self._transfer_failed()
+                raise
+            self._force_full = False
+            self._last_frame = frame
+            return
+        
+        with self._cond:
+            # Repeats of a queued frame are skipped; the writer undoes this
+            # if the frame can't be sent
+            self._force_full = False
+            self._last_frame = frame
+            if self._pending is not None:
+                # Still waiting and already stale: the latest frame wins,
+                # and carries the inputs of the frame it replaces
+                self.stats['frames_dropped'] += 1
+                full = full or self._pending[1]
+                if self._pending[2]:
+                    traces = self._pending[2] + (traces or [])
+            self._pending = (frame, full, traces, self.app)
+            self._cond.notify_all()
+    
+    def start_writer(self):
+        """Send frames from a background thread so show() never waits on I2C"""
+        if self._writer is not None:
+            return
+        self._writer_running = True
+        self._writer = threading.Thread(target=self._writer_loop, name="display-writer", daemon=True)
+        self._writer.start()
+    
+    def stop_writer(self):
+        """Send any pending frame, then return to synchronous flushing"""
+        if self._writer is None:
+            return
+        self.wait_idle()
+        with self._cond:
+            self._writer_running = False
+            self._cond.notify_all()
+        self._writer.join()
+        self._writer = None
+    
+    def wait_idle(self, timeout=None):
+        """Block until every submitted frame has reached the panel"""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: self._pending is None and not self._writer_busy, timeout)
+    
+    def _writer_loop(self):
+        while True:
+            with self._cond:
+                self._writer_busy = False
+                self._cond.notify_all()
+                self._cond.wait_for(lambda: self._pending is not None or not self._writer_running)
+                if self._pending is None:
+                    return
+                frame, full, traces, app = self._pending
+                self._pending = None
+                self._writer_busy = True
+            
+            try:
+                self._transfer(frame, full, traces, app)
+            except Exception as e:
+                print(f"Display writer error: {e}")
+                with self._cond:
+                    self._transfer_failed()
+    
+    def _transfer_failed(self):
+        # The panel may show anything now: send the next frame in full,
+        # even if it's the same as the one that failed
+        self._last_frame = None
+        self._force_full = True
+    
+    def _app_counts(self, app=None):
+        return self.app_frames.setdefault(app or self.app, [0, 0])
+    
+    def _transfer(self, frame, full=False, traces=None, app=None):
+        start = time.monotonic()
+        if full:
+            windows = [(0, self.pages - 1, 0, self.width - 1)]
+        else:
+            windows = self._dirty_windows(frame)
+        
+        with self._bus_lock:
+            for page0, page1, col0, col1 in windows:
+                self._send_window(frame, page0, page1, col0, col1)
+        self._shadow[:] = frame
+        
+        elapsed = time.monotonic() - start
+        self.stats['frames_sent'] += 1
+        self._app_counts(app)[0] += 1
+        self.stats['transfer_time'] += elapsed
+        self.stats['transfer_time_max'] = max(self.stats['transfer_time_max'], elapsed)
+        if traces:
+            self.tracer.complete(traces)
+    
+    def _dirty_windows(self, frame):
+        """Return (page0, page1, col0, col1) windows covering every changed byte"""
+        width = self.width
+        windows = []
+        for page in range(self.pages):
+            start = page * width
+            new = frame[start:start + width]
+            old = self._shadow[start:start + width]
+            if new == old:
+                continue
+            
+            # XOR the rows as big integers to find the first and last changed
+            # column without a per-byte Python loop
+            diff = int.from_bytes(new, 'big') ^ int.from_bytes(old, 'big')
+            col0 = width - 1 - (diff.bit_length() - 1) // 8
+            col1 = width - 1 - ((diff & -diff).bit_length() - 1) // 8
+            
+            if windows and windows[-1][1] == page - 1:
+                # Merge with the window above when the extra unchanged bytes
+                # cost less than a second addressing transaction
+                prev0, prev1, pcol0, pcol1 = windows[-1]
+                mcol0, mcol1 = min(pcol0, col0), max(pcol1, col1)
+                merged = (page - prev0 + 1) * (mcol1 - mcol0 + 1)
+                separate = (page - prev0) * (pcol1 - pcol0 + 1) + (col1 - col0 + 1)
+                if merged - separate < WINDOW_OVERHEAD:
+                    windows[-1] = (prev0, page, mcol0, mcol1)
+                    continue
+            
+            windows.append((page, page, col0, col1))
+        return windows
+    
+    def _send_window(self, frame, page0, page1, col0, col1):
+        # With horizontal addressing the panel fills col0..col1 of page0,
+        # then wraps to the next page, so data goes out page by page
+        data = bytearray([CONTROL_DATA])
+        for page in range(page0, page1 + 1):
+            start = page * self.width
+            data += frame[start + col0:start + col1 + 1]
+        
+        self._write(bytes([CONTROL_CMD,
+                           SET_COL_ADDR, col0 + self.col_offset, col1 + self.col_offset,
+                           SET_PAGE_ADDR, page0, page1]))
+        self._write(data)
+        self.stats['bytes_sent'] += len(data) + WINDOW_OVERHEAD - 1
+    
+    def _write(self, data):
+        with self.oled.i2c_device:
+            self.oled.i2c_device.write(data)
+    
+    def load_image(self, image):
+        """Replace the framebuffer contents with a 1-bit PIL image"""
+        self.buffer[:] = pack_image(image, self.width, self.height)
+        
+    def load_bytes(self, data):
+        """Replace the framebuffer contents with raw row-major 1bpp pixels"""
+        self.buffer[:] = pack_bytes(data, self.width, self.height)
+        
+    def blit_text(self, text, x=0, y=0):
+        """Draw text over the framebuffer from the glyph atlas, without flushing"""
+        self.bitmap_font.blit(self.buffer, self.width, x, y, text)
+        
+    def _unchanged(self, key):
+        # True when the panel already shows the output of this exact draw call
+        if key == self._last_draw and self._last_frame is not None:
+            self.stats['renders_skipped'] += 1
+            if self.tracer is not None:
+                self.tracer.unchanged()
+            return True
+        self._last_draw = key
+        return False
+        
     def draw_text(self, text, x=0, y=0):
         try:
-            image = Image.new("1", (self.width, self.height))
-            draw = ImageDraw.Draw(image)
-            draw.text((x, y), text, font=self.font, fill=255)
-            self.oled.image(image)
-            self.oled.show()
+            if self._unchanged(('text', text, x, y)):
+                return
+            if self.bitmap_font.covers(text):
+                self.buffer[:] = bytes(len(self.buffer))
+                self.blit_text(text, x, y)
+            else:
+                # PIL is only imported for text the atlas can't draw
+                from PIL import Image, ImageDraw
+                
+                image = Image.new("1", (self.width, self.height))
+                draw = ImageDraw.Draw(image)
+                draw.text((x, y), text, font=self.font, fill=255)
+                self.load_image(image)
+            self._flush()
         except Exception as e:
+            self._last_draw = None
             print(f"Display draw error: {e}")
         
     def draw_centered_text(self, text):
         try:
-            image = Image.new("1", (self.width, self.height))
-            draw = ImageDraw.Draw(image)
-            
-            # Handle multi-line text
-            lines = text.split('\n')
-            if len(lines) == 1:
-                # Wrap long single lines
-                wrapped = textwrap.fill(text, width=20)
-                lines = wrapped.split('\n')
-            
-            # Calculate total text height
-            line_height = 12
-            total_height = len(lines) * line_height
-            start_y = max(0, (self.height - total_height) // 2)
-            
-            for i, line in enumerate(lines):
-                if i * line_height + start_y >= self.height:
-                    break  # Don't draw off-screen
+            if self._unchanged(('centered', text)):
+                return
+            
+            use_atlas = self.bitmap_font.covers(text)
+            font = self.bitmap_font if use_atlas else self.font
+            key = (text, font, 'center')
+            entry = self.text_cache.get(key)
+            if entry is None:
+                if use_atlas:
+                    layout = self._layout_centered(text, self.bitmap_font.text_width)
+                    self.buffer[:] = bytes(len(self.buffer))
+                    for x, y, line in layout:
+                        self.blit_text(line, x, y)
+                else:
+                    from PIL import Image, ImageDraw
                     
-                # Get text width for centering
-                bbox = draw.textbbox((0, 0), line, font=self.font)
-                text_width = bbox[2] - bbox[0]
-                x = max(0, (self.width - text_width) // 2)
-                y = start_y + i * line_height
-                
-                draw.text((x, y), line, font=self.font, fill=255)
+                    image = Image.new("1", (self.width, self.height))
+                    draw = ImageDraw.Draw(image)
+                    
+                    def measure(line):
+                        bbox = draw.textbbox((0, 0), line, font=self.font)
+                        return bbox[2] - bbox[0]
+                    
+                    layout = self._layout_centered(text, measure)
+                    for x, y, line in layout:
+                        draw.text((x, y), line, font=self.font, fill=255)
+                    self.load_image(image)
+                self.text_cache.put(key, (layout, bytes(self.buffer)))
+            else:
+                # Repeated screen: a buffer copy instead of a full render
+                self.buffer[:] = entry[1]
             
-            self.oled.image(image)
-            self.oled.show()
+            self._flush()
             
         except Exception as e:
             print(f"Display centered text error: {e}")
             # Fallback to simple text
-            self.draw_text(str(text)[:20], 0, 0)
\ No newline at end of file
+            self.draw_text(str(text)[:20], 0, 0)
+    
+    def _layout_centered(self, text, measure):
+        """Return (x, y, line) for each line of text that fits on screen"""
+        # Handle multi-line text
+        lines = text.split('\n')
+        if len(lines) == 1:
+            # Wrap long single lines
+            wrapped = textwrap.fill(text, width=20)
+            lines = wrapped.split('\n')
+        
+        # Calculate total text height
+        line_height = 12
+        total_height = len(lines) * line_height
+        start_y = max(0, (self.height - total_height) // 2)
+        
+        layout = []
+        for i, line in enumerate(lines):
+            if i * line_height + start_y >= self.height:
+                break  # Don't draw off-screen
+                
+            # Get text width for centering
+            text_width = measure(line)
+            x = max(0, (self.width - text_width) // 2)
+            y = start_y + i * line_height
+            layout.append((x, y, line))
+        return layout
+    
+    @staticmethod
+    def _text_entry_size(entry):
+        layout, frame = entry
+        return len(frame) + sum(len(line) + 64 for _, _, line in layout)
@@ -0,0 +1,192 @@
+import importlib
+
+# Characters compiled into an atlas by default: printable ASCII plus Latin-1,
+# which covers everything SpotifyApp._clean_text lets through and the ° sign
+DEFAULT_CHARS = ''.join(chr(c) for c in list(range(32, 127)) + list(range(160, 256)))
+
+class BitmapFont:
+    """Pre-rasterized font whose glyphs are stored in SSD1306 page format.
+
+    Each glyph is (advance, left, data) where data holds `pages` rows of
+    column bytes (bit 0 = top pixel), the same layout as the framebuffer,
+    so text can be blitted with byte operations instead of FreeType.
+    """
+
+    def __init__(self, name, height, glyphs):
+        self.name = name
+        self.height = height
+        self.pages = (height + 7) // 8
+        self.glyphs = glyphs
+        # Glyph rows as little-endian ints, ready to be shifted into place
+        self._rows = {}
+        for code, (advance, left, data) in glyphs.items():
+            width = len(data) // self.pages
+            self._rows[code] = [
+                int.from_bytes(data[k * width:(k + 1) * width], 'little')
+                for k in range(self.pages)
+            ]
+
+    @classmethod
+    def load(cls, name):
+        """Load a compiled atlas from lib/fonts/<name>.py"""
+        module = importlib.import_module(f'{__package__}.fonts.{name}')
+        return cls(module.NAME, module.HEIGHT, module.GLYPHS)
+
+    @classmethod
+    def from_pil(cls, font, name, chars=DEFAULT_CHARS):
+        """Rasterize a PIL font (TrueType or bitmap) into an atlas"""
+        from PIL import Image, ImageDraw
+
+        if hasattr(font, 'getmetrics'):
+            ascent, descent = font.getmetrics()
+            height = ascent + descent
+        else:
+            height = font.getbbox(chars)[3]
+
+        glyphs = {}
+        for ch in chars:
+            # Monochrome hinted advance, matching what PIL uses for mode "1"
+            advance = round(font.getlength(ch, mode="1"))
+            # Pad so glyphs that overhang their advance aren't clipped
+            pad = 4
+            image = Image.new("1", (advance + 2 * pad, height))
+            ImageDraw.Draw(image).text((pad, 0), ch, font=font, fill=255)
+            bbox = image.getbbox()
+            if bbox is None:
+                glyphs[ord(ch)] = (advance, 0, b'')
+                continue
+
+            x0, x1 = bbox[0], bbox[2]
+            pixels = image.load()
+            data = bytearray()
+            for page in range((height + 7) // 8):
+                for x in range(x0, x1):
+                    byte = 0
+                    for bit in range(8):
+                        y = page * 8 + bit
+                        if y < height and pixels[x, y]:
+                            byte |= 1 << bit
+                    data.append(byte)
+            glyphs[ord(ch)] = (advance, x0 - pad, bytes(data))
+        return cls(name, height, glyphs)
+
+    @classmethod
+    def from_bdf(cls, path, name=None, chars=DEFAULT_CHARS):
+        """Convert a BDF bitmap font into an atlas"""
+        wanted = {ord(ch) for ch in chars}
+        ascent = descent = 0
+        raw = {}
+        with open(path) as f:
+            lines = iter(f.read().splitlines())
+            for line in lines:
+                parts = line.split()
+                if not parts:
+                    continue
+                if parts[0] == 'FONT' and name is None:
+                    name = parts[1]
+                elif parts[0] == 'FONT_ASCENT':
+                    ascent = int(parts[1])
+                elif parts[0] == 'FONT_DESCENT':
+                    descent = int(parts[1])
+                elif parts[0] == 'STARTCHAR':
+                    code = advance = None
+                    bbx = (0, 0, 0, 0)
+                    for line in lines:
+                        parts = line.split()
+                        if not parts:
+                            continue
+                        if parts[0] == 'ENCODING':
+                            code = int(parts[1])
+                        elif parts[0] == 'DWIDTH':
+                            advance = int(parts[1])
+                        elif parts[0] == 'BBX':
+                            bbx = tuple(int(p) for p in parts[1:5])
+                        elif parts[0] == 'BITMAP':
+                            rows = [int(row, 16) for row in
+                                    iter(lambda: next(lines).strip(), 'ENDCHAR')]
+                            break
+                    if code in wanted:
+                        raw[code] = (advance, bbx, rows)
+
+        height = ascent + descent
+        pages = (height + 7) // 8
+        glyphs = {}
+        for code, (advance, (w, h, xoff, yoff), rows) in raw.items():
+            row_bits = ((w + 7) // 8) * 8
+            top = ascent - (yoff + h)
+            data = bytearray(pages * w)
+            for r, row in enumerate(rows):
+                y = top + r
+                if not 0 <= y < height:
+                    continue
+                for x in range(w):
+                    if row >> (row_bits - 1 - x) & 1:
+                        data[(y // 8) * w + x] |= 1 << (y % 8)
+            glyphs[code] = (advance, xoff, bytes(data))
+        return cls(name, height, glyphs)
+
+    def covers(self, text):
+        """True if every character apart from line breaks has a glyph"""
+        glyphs = self.glyphs
+        return all(ord(ch) in glyphs or ch == '\n' for ch in text)
+
+    def text_width(self, text):
+        """Width of text in pixels, including glyphs that overhang the pen"""
+        pen = right = 0
+        for ch in text:
+            glyph = self.glyphs.get(ord(ch))
+            if glyph is None:
+                continue
+            advance, left, data = glyph
+            if data:
+                right = max(right, pen + left + len(data) // self.pages)
+            pen += advance
+        return max(pen, right)
+
+    def render_line(self, text):
+        """Return (width, rows): the text as one little-endian int per page"""
+        rows = [0] * self.pages
+        pen = 0
+        for ch in text:
+            code = ord(ch)
+            glyph = self.glyphs.get(code)
+            if glyph is None:
+                continue
+            shift = 8 * (pen + glyph[1])
+            for k, row in enumerate(self._rows[code]):
+                rows[k] |= row << shift if shift >= 0 else row >> -shift
+            pen += glyph[0]
+        return pen, rows
+
+    def blit(self, buffer, buffer_width, x, y, text):
+        """OR text into a page-format buffer with its top-left corner at (x, y)"""
+        _, rows = self.render_line(text)
+        self.blit_rows(buffer, buffer_width, x, y, rows)
+
+    def blit_rows(self, buffer, buffer_width, x, y, rows):
+        buffer_pages = len(buffer) // buffer_width
+        row_mask = (1 << (8 * buffer_width)) - 1
+        page0, shift = divmod(y, 8)
+
+        # Per-byte masks so a vertical shift moves bits into the page below
+        # instead of into the neighbouring column
+        ones = int.from_bytes(b'\x01' * (buffer_width + 1), 'little')
+        keep_mask = ones * ((0xFF << shift) & 0xFF)
+        carry_mask = ones * ((1 << shift) - 1)
+
+        parts = {}
+        for k, row in enumerate(rows):
+            row = row << (8 * x) if x >= 0 else row >> (-8 * x)
+            if not row:
+                continue
+            parts[page0 + k] = parts.get(page0 + k, 0) | ((row << shift) & keep_mask)
+            if shift:
+                parts[page0 + k + 1] = parts.get(page0 + k + 1, 0) | ((row >> (8 - shift)) & carry_mask)
+
+        for page, bits in parts.items():
+            bits &= row_mask
+            if not bits or not 0 <= page < buffer_pages:
+                continue
+            start = page * buffer_width
+            current = int.from_bytes(buffer[start:start + buffer_width], 'little')
+            buffer[start:start + buffer_width] = (current | bits).to_bytes(buffer_width, 'little')
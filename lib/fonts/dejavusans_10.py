@@ -0,0 +1,198 @@
+# Generated by scripts/build_font.py from DejaVuSans.ttf - do not edit
+NAME = 'dejavusans_10'
+HEIGHT = 13
+
+# code point: (advance, left offset, column bytes page by page)
+GLYPHS = {
+    32: (3, 0, b''),
+    33: (4, 2, b'\xf8\x02'),
+    34: (5, 1, b'8\x008\x00\x00\x00'),
+    35: (8, 1, b'\x80\xa0\xf8\xa0\xe0\xb8 \x00\x03\x00\x00\x03\x00\x00'),
+    36: (6, 1, b'`P\xf8\x90\x90\x02\x02\x07\x02\x01'),
+    37: (10, 1, b'xHx\xc0`\xd8@\xc0\x00\x00\x03\x00\x00\x03\x02\x03'),
+    38: (9, 1, b'\xc00HH\x90\x00\xc0\x01\x03\x02\x02\x01\x01\x02'),
+    39: (3, 1, b'8\x00'),
+    40: (4, 1, b'\xf8\x04\x03\x04'),
+    41: (4, 1, b'\x0c\xf0\x06\x01'),
+    42: (5, 0, b'H0x0H\x00\x00\x00\x00\x00'),
+    43: (8, 1, b'@@@\xf8@@@\x00\x00\x00\x03\x00\x00\x00'),
+    44: (3, 1, b'\x00\x06'),
+    45: (4, 1, b'\x80\x80\x80\x00\x00\x00'),
+    46: (3, 1, b'\x00\x02'),
+    47: (3, 0, b'\x00\xe0\x18\x06\x01\x00'),
+    48: (6, 1, b'\xf0\x08\x08\x08\xf0\x01\x02\x02\x02\x01'),
+    49: (6, 1, b'\x08\x08\xf8\x00\x00\x02\x02\x03\x02\x02'),
+    50: (6, 1, b'\x10\x08\x88H0\x02\x03\x02\x02\x02'),
+    51: (6, 1, b'\x10HHH\xb0\x01\x02\x02\x02\x01'),
+    52: (6, 1, b'\xc0\xa0\x90\xf8\x80\x00\x00\x00\x03\x00'),
+    53: (6, 1, b'8(((\xc0\x02\x02\x02\x02\x01'),
+    54: (6, 1, b'\xf0XHH\x88\x01\x02\x02\x02\x01'),
+    55: (6, 1, b'\x08\x08\x88h\x18\x00\x02\x01\x00\x00'),
+    56: (6, 1, b'\xb0HHH\xb0\x01\x02\x02\x02\x01'),
+    57: (6, 1, b'0HHH\xf0\x02\x02\x02\x03\x01'),
+    58: (3, 1, b' \x02'),
+    59: (3, 1, b' \x06'),
+    60: (8, 1, b'@@\xa0\xa0\xa0\x10\x00\x00\x00\x00\x00\x01'),
+    61: (8, 1, b'\xa0\xa0\xa0\xa0\xa0\xa0\x00\x00\x00\x00\x00\x00'),
+    62: (8, 1, b'\x10\xa0\xa0\xa0@@\x01\x00\x00\x00\x00\x00'),
+    63: (5, 1, b'\x08\xc8(\x18\x00\x02\x00\x00'),
+    64: (11, 1, b'\xe00\x18\xc8H\xc8\x08\x90\xe0\x03\x06\x0c\t\t\t\x05\x01\x00'),
+    65: (7, 0, b'\x00\xc0\xb0\x88\xb0\xc0\x00\x02\x01\x00\x00\x00\x01\x02'),
+    66: (7, 1, b'\xf8HHH\xb0\x03\x02\x02\x02\x01'),
+    67: (8, 1, b'\xe0\x10\x08\x08\x08\x10\x00\x01\x02\x02\x02\x01'),
+    68: (8, 1, b'\xf8\x08\x08\x08\x18\xf0\x03\x02\x02\x02\x03\x01'),
+    69: (7, 1, b'\xf8HHHH\x03\x02\x02\x02\x02'),
+    70: (6, 1, b'\xf8HHH\x03\x00\x00\x00'),
+    71: (8, 1, b'\xf0\x18\x08HH\xd0\x01\x03\x02\x02\x02\x01'),
+    72: (8, 1, b'\xf8@@@@\xf8\x03\x00\x00\x00\x00\x03'),
+    73: (3, 1, b'\xf8\x03'),
+    74: (3, -1, b'\x00\x00\xf8\x08\x08\x07'),
+    75: (7, 1, b'\xf8@\xa0\x10\x08\x03\x00\x00\x01\x02'),
+    76: (6, 1, b'\xf8\x00\x00\x00\x00\x03\x02\x02\x02\x02'),
+    77: (9, 1, b'\xf80\xc0\x00\xc00\xf8\x03\x00\x00\x01\x00\x00\x03'),
+    78: (8, 1, b'\xf8\x10`\x80\x00\xf8\x03\x00\x00\x00\x01\x03'),
+    79: (8, 1, b'\xf0\x18\x08\x08\x18\xf0\x01\x03\x02\x02\x03\x01'),
+    80: (7, 1, b'\xf8HHH0\x03\x00\x00\x00\x00'),
+    81: (8, 1, b'\xf0\x18\x08\x08\x18\xf0\x01\x03\x02\x02\x05\x00'),
+    82: (7, 1, b'\xf8HH\xc80\x00\x03\x00\x00\x00\x01\x02'),
+    83: (7, 1, b'0HHH\x90\x01\x02\x02\x02\x01'),
+    84: (5, 0, b'\x08\x08\xf8\x08\x08\x00\x00\x03\x00\x00'),
+    85: (8, 1, b'\xf8\x00\x00\x00\x00\xf8\x01\x02\x02\x02\x02\x01'),
+    86: (7, -1, b'\x18`\x80\x00\x80`\x18\x00\x00\x01\x02\x01\x00\x00'),
+    87: (9, 0, b'\x18\xe0\x00\xe0\x18\xe0\x00\xe0\x18\x00\x00\x03\x00\x00\x00\x03\x00\x00'),
+    88: (6, 0, b'\x08\x18\xe0\xe0\x18\x08\x02\x03\x00\x00\x03\x02'),
+    89: (7, 0, b'\x08\x10 \xc0 \x10\x08\x00\x00\x00\x03\x00\x00\x00'),
+    90: (6, 0, b'\x08\x08\xc8h\x18\x08\x02\x03\x02\x02\x02\x02'),
+    91: (4, 1, b'\xfc\x04\x07\x04'),
+    92: (3, 0, b'\x18\xe0\x00\x00\x01\x06'),
+    93: (4, 1, b'\x04\xfc\x04\x07'),
+    94: (8, 1, b' \x10\x08\x08\x10 \x00\x00\x00\x00\x00\x00'),
+    95: (5, 0, b'\x00\x00\x00\x00\x00\x08\x08\x08\x08\x08'),
+    96: (5, 1, b'\x04\x08\x00\x00'),
+    97: (6, 1, b'\x00\xa0\xa0\xa0\xc0\x03\x02\x02\x02\x03'),
+    98: (6, 1, b'\xfc   \xc0\x03\x02\x02\x02\x01'),
+    99: (5, 1, b'\xc0   \x01\x02\x02\x02'),
+    100: (6, 1, b'\xc0   \xfc\x01\x02\x02\x02\x03'),
+    101: (6, 1, b'\xc0\xa0\xa0\xa0\xc0\x01\x02\x02\x02\x02'),
+    102: (4, 1, b' \xfc$\x04\x00\x03\x00\x00'),
+    103: (6, 1, b'\xc0   \xe0\x01\n\n\n\x07'),
+    104: (6, 1, b'\xfc   \xc0\x03\x00\x00\x00\x03'),
+    105: (2, 1, b'\xe4\x03'),
+    106: (2, 0, b'\x00\xe4\x08\x0f'),
+    107: (5, 1, b'\xfc\x80@ \x03\x00\x01\x02'),
+    108: (2, 1, b'\xfc\x03'),
+    109: (10, 1, b'\xe0   \xc0   \xc0\x03\x00\x00\x00\x03\x00\x00\x00\x03'),
+    110: (6, 1, b'\xe0   \xc0\x03\x00\x00\x00\x03'),
+    111: (6, 1, b'\xc0   \xc0\x01\x02\x02\x02\x01'),
+    112: (6, 1, b'\xe0   \xc0\x0f\x02\x02\x02\x01'),
+    113: (6, 1, b'\xc0   \xe0\x01\x02\x02\x02\x0f'),
+    114: (4, 1, b'\xe0  \x03\x00\x00'),
+    115: (5, 1, b'`\xa0\xa0\xa0\x02\x02\x02\x03'),
+    116: (4, 0, b' \xf8  \x00\x03\x02\x02'),
+    117: (6, 1, b'\xe0\x00\x00\x00\xe0\x01\x02\x02\x02\x03'),
+    118: (6, 1, b'`\x80\x00\x80`\x00\x01\x02\x01\x00'),
+    119: (8, 1, b'\xe0\x00\xc0 \xc0\x00\xe0\x00\x03\x00\x00\x00\x03\x00'),
+    120: (6, 1, b' @\x80@ \x02\x01\x00\x01\x02'),
+    121: (6, 1, b'`\x80\x00\x80`\x08\t\x06\x01\x00'),
+    122: (5, 1, b'  \xa0`\x02\x03\x02\x02'),
+    123: (6, 1, b'@@\xbc\x04\x00\x00\x07\x04'),
+    124: (3, 1, b'\xfc\x0f'),
+    125: (6, 1, b'\x04\xbc@@\x04\x07\x00\x00'),
+    126: (8, 1, b'@  @@ \x00\x00\x00\x00\x00\x00'),
+    160: (3, 0, b''),
+    161: (4, 2, b'\xa0\x0f'),
+    162: (6, 1, b'\xc0 \xf0 \x01\x02\x07\x02'),
+    163: (6, 1, b'@\xf0HH\x10\x02\x03\x02\x02\x02'),
+    164: (6, 0, b'\x08\xf0\x90\x90\xf0\x08\x01\x00\x00\x00\x00\x01'),
+    165: (6, 1, b'\xa8\xb0\xc0\xb0\xa8\x00\x00\x03\x00\x00'),
+    166: (3, 1, b'x\x0f'),
+    167: (5, 0, b'\xd8\xa8h\xc8\x04\x04\x05\x06'),
+    168: (5, 1, b'\x08\x00\x08\x00\x00\x00'),
+    169: (10, 1, b'\xe0\x10\xe8\xa8\xa8\x10\xe0\x00\x01\x02\x02\x02\x01\x00'),
+    170: (5, 1, b'pXXx\x01\x01\x01\x01'),
+    171: (6, 1, b'\xc0\xe0\xc0\xe0\x00\x01\x00\x01'),
+    172: (8, 1, b'@@@@@\xc0\x00\x00\x00\x00\x00\x01'),
+    173: (4, 1, b'\x80\x80\x80\x00\x00\x00'),
+    174: (10, 1, b'\xe0\x10\xe8h\xe8\x10\xe0\x00\x01\x02\x02\x02\x01\x00'),
+    175: (5, 1, b'\x08\x08\x08\x00\x00\x00'),
+    176: (5, 1, b'8(8\x00\x00\x00'),
+    177: (8, 1, b'@@@\xf0@@@\x02\x02\x02\x03\x02\x02\x02'),
+    178: (4, 1, b'HhX\x00\x00\x00'),
+    179: (4, 1, b'HXh\x00\x00\x00'),
+    180: (5, 2, b'\x08\x04\x00\x00'),
+    181: (7, 1, b'\xe0\x00\x00\x00\xe0\x00\x0f\x02\x02\x02\x03\x02'),
+    182: (6, 1, b'px\xf8\x08\xf8\x00\x00\x07\x00\x07'),
+    183: (3, 1, b'@\x00'),
+    184: (5, 1, b'\x00\x00\x08\x0c'),
+    185: (4, 1, b'Hx@\x00\x00\x00'),
+    186: (5, 1, b'0HH0\x01\x01\x01\x01'),
+    187: (6, 1, b'\xe0\xc0\xe0\xc0\x01\x00\x01\x00'),
+    188: (10, 1, b'Hx\xc0\xe00\x08\x80\xc0\x00\x00\x02\x01\x00\x00\x01\x01\x03\x01'),
+    189: (10, 1, b'Hx\xc0\xe00\x08@@\xc0\x00\x02\x01\x00\x00\x00\x02\x03\x02'),
+    190: (10, 1, b'HX\xe8\xe00\x08\x80\xc0\x00\x00\x02\x01\x00\x00\x01\x01\x03\x01'),
+    191: (5, 1, b'\x00\x00\xa0\x00\x0c\n\t\x08'),
+    192: (7, 0, b'\x00\xc0\xb1\x8a\xb0\xc0\x00\x02\x01\x00\x00\x00\x01\x02'),
+    193: (7, 0, b'\x00\xc0\xb0\x8a\xb1\xc0\x00\x02\x01\x00\x00\x00\x01\x02'),
+    194: (7, 0, b'\x00\xc0\xb2\x89\xb2\xc0\x00\x02\x01\x00\x00\x00\x01\x02'),
+    195: (7, 0, b'\x00\xc0\xb2\x8b\xb1\xc0\x00\x02\x01\x00\x00\x00\x01\x02'),
+    196: (7, 0, b'\x00\xc0\xb2\x88\xb2\xc0\x00\x02\x01\x00\x00\x00\x01\x02'),
+    197: (7, 0, b'\x00\x80\xf6\x8a\xf6\x80\x00\x02\x01\x00\x00\x00\x01\x02'),
+    198: (10, 0, b'\x00\xc0\xb0\x88\xf8HHHH\x02\x01\x00\x00\x03\x02\x02\x02\x02'),
+    199: (8, 1, b'\xe0\x10\x08\x08\x08\x10\x00\t\x0e\x02\x02\x01'),
+    200: (7, 1, b'\xf8IJHH\x03\x02\x02\x02\x02'),
+    201: (7, 1, b'\xf8HJIH\x03\x02\x02\x02\x02'),
+    202: (7, 1, b'\xf8JIJH\x03\x02\x02\x02\x02'),
+    203: (7, 1, b'\xf8JHJH\x03\x02\x02\x02\x02'),
+    204: (3, 0, b'\x01\xfa\x00\x03'),
+    205: (3, 1, b'\xfa\x01\x03\x00'),
+    206: (3, 0, b'\x02\xf9\x02\x00\x03\x00'),
+    207: (3, 0, b'\x02\xf8\x02\x00\x03\x00'),
+    208: (8, 0, b'@\xf8HH\x08\x18\xf0\x00\x03\x02\x02\x02\x03\x01'),
+    209: (8, 1, b'\xf8\x12a\x82\x01\xf8\x03\x00\x00\x00\x01\x03'),
+    210: (8, 1, b'\xf0\x19\n\x08\x18\xf0\x01\x03\x02\x02\x03\x01'),
+    211: (8, 1, b'\xf0\x18\n\t\x18\xf0\x01\x03\x02\x02\x03\x01'),
+    212: (8, 1, b'\xf0\x1a\t\t\x1a\xf0\x01\x03\x02\x02\x03\x01'),
+    213: (8, 1, b'\xf0\x1a\t\n\x19\xf0\x01\x03\x02\x02\x03\x01'),
+    214: (8, 1, b'\xf0\x1a\x08\x08\x1a\xf0\x01\x03\x02\x02\x03\x01'),
+    215: (8, 1, b'\x10 \xc0\xc0 \x10\x02\x01\x00\x00\x01\x02'),
+    216: (8, 1, b'x\x8cd\x14\x88\xf4\x01\x00\x01\x01\x01\x00'),
+    217: (8, 1, b'\xf8\x01\x02\x00\x00\xf8\x01\x02\x02\x02\x02\x01'),
+    218: (8, 1, b'\xf8\x00\x02\x01\x00\xf8\x01\x02\x02\x02\x02\x01'),
+    219: (8, 1, b'\xf8\x02\x01\x01\x02\xf8\x01\x02\x02\x02\x02\x01'),
+    220: (8, 1, b'\xf8\x02\x00\x00\x02\xf8\x01\x02\x02\x02\x02\x01'),
+    221: (7, 0, b'\x08\x10 \xc2!\x10\x08\x00\x00\x00\x03\x00\x00\x00'),
+    222: (7, 1, b'\xf8\x90\x90\x90`\x03\x00\x00\x00\x00'),
+    223: (6, 1, b'\xf8\x04tX\x80\x03\x00\x02\x02\x03'),
+    224: (6, 1, b'\x00\xa4\xa8\xa0\xc0\x03\x02\x02\x02\x03'),
+    225: (6, 1, b'\x00\xa0\xa8\xa4\xc0\x03\x02\x02\x02\x03'),
+    226: (6, 1, b'\x00\xa8\xa4\xa8\xc0\x03\x02\x02\x02\x03'),
+    227: (6, 1, b'\x0c\xa4\xac\xa8\xcc\x03\x02\x02\x02\x03'),
+    228: (6, 1, b'\x00\xa8\xa0\xa8\xc0\x03\x02\x02\x02\x03'),
+    229: (6, 1, b'\x00\xae\xaa\xae\xc0\x03\x02\x02\x02\x03'),
+    230: (10, 1, b'\x00\xa0\xa0\xa0\xc0\xa0\xa0\xa0\xc0\x03\x02\x02\x02\x01\x02\x02\x02\x02'),
+    231: (5, 1, b'\xc0   \x01\n\x0e\x02'),
+    232: (6, 1, b'\xc0\xa4\xa8\xa0\xc0\x01\x02\x02\x02\x02'),
+    233: (6, 1, b'\xc0\xa0\xa8\xa4\xc0\x01\x02\x02\x02\x02'),
+    234: (6, 1, b'\xc0\xa8\xa4\xa8\xc0\x01\x02\x02\x02\x02'),
+    235: (6, 1, b'\xc0\xa8\xa0\xa8\xc0\x01\x02\x02\x02\x02'),
+    236: (2, 0, b'\x04\xe8\x00\x03'),
+    237: (2, 1, b'\xe8\x04\x03\x00'),
+    238: (2, 0, b'\x08\xe4\x08\x00\x03\x00'),
+    239: (2, 0, b'\x08\xe0\x08\x00\x03\x00'),
+    240: (6, 1, b'\xe0\x16\x14\x1a\xe0\x00\x01\x01\x01\x00'),
+    241: (6, 1, b'\xec$(,\xc0\x03\x00\x00\x00\x03'),
+    242: (6, 1, b'\xc0$( \xc0\x01\x02\x02\x02\x01'),
+    243: (6, 1, b'\xc0 ($\xc0\x01\x02\x02\x02\x01'),
+    244: (6, 1, b'\xc0($(\xc0\x01\x02\x02\x02\x01'),
+    245: (6, 1, b'\xcc$,(\xcc\x01\x02\x02\x02\x01'),
+    246: (6, 1, b'\xc0( (\xc0\x01\x02\x02\x02\x01'),
+    247: (8, 1, b'@@@P@@@\x00\x00\x00\x01\x00\x00\x00'),
+    248: (6, 1, b'\xe0\x90P0\xf0\x01\x01\x01\x01\x00'),
+    249: (6, 1, b'\xe0\x04\x08\x00\xe0\x01\x02\x02\x02\x03'),
+    250: (6, 1, b'\xe0\x00\x08\x04\xe0\x01\x02\x02\x02\x03'),
+    251: (6, 1, b'\xe0\x08\x04\x08\xe0\x01\x02\x02\x02\x03'),
+    252: (6, 1, b'\xe0\x08\x00\x08\xe0\x01\x02\x02\x02\x03'),
+    253: (6, 1, b'`\x88\x04\x80`\x08\t\x06\x01\x00'),
+    254: (6, 1, b'\xfc   \xc0\x0f\x02\x02\x02\x01'),
+    255: (6, 1, b'`\x88\x00\x88`\x08\t\x06\x01\x00'),
+}
@@ -0,0 +1,92 @@
+def pack_image(image, width=None, height=None):
+    """Pack a PIL image into SSD1306 page layout (page * width + x, bit 0 on top).
+
+    Transposing makes every display column a row, and the "1;R" raw packer
+    then stores each run of 8 vertical pixels LSB-first - exactly one
+    SSD1306 byte. All of that happens in C, unlike the driver's per-pixel
+    Python loop.
+    """
+    from PIL import Image
+
+    if image.mode != "1":
+        image = image.convert("1")
+    if width is not None and image.size != (width, height):
+        raise ValueError(f"Image must be {width}x{height}, got {image.size[0]}x{image.size[1]}")
+
+    width, height = image.size
+    pages = (height + 7) // 8
+    # Column-major: column x holds its pages at data[x * pages:(x + 1) * pages]
+    data = image.transpose(Image.Transpose.TRANSPOSE).tobytes("raw", "1;R")
+    if pages == 1:
+        return data
+    return b''.join(data[page::pages] for page in range(pages))
+
+def pack_bytes(data, width, height):
+    """Pack raw row-major 1bpp bytes (as from Image.tobytes()) into page layout"""
+    from PIL import Image
+
+    return pack_image(Image.frombytes("1", (width, height), bytes(data)))
+
+class FrameBuffer:
+    """Drawing surface over a page-layout bytearray (e.g. Display.buffer).
+
+    Every primitive works a page row at a time on little-endian ints, so a
+    sprite or rectangle costs a handful of big-int operations per page
+    instead of a PIL call per shape plus a repack of the whole frame.
+    """
+
+    def __init__(self, buffer, width, height):
+        self.buffer = buffer
+        self.width = width
+        self.height = height
+        self.pages = (height + 7) // 8
+        self._ones = int.from_bytes(b'\x01' * width, 'little')
+
+    def clear(self):
+        self.buffer[:] = bytes(len(self.buffer))
+
+    def _apply(self, page, x, width, set_bits, clear_bits=0):
+        # Clip columns to the screen, then update bytes x..x+width of a page
+        if not 0 <= page < self.pages or width <= 0:
+            return
+        if x < 0:
+            set_bits >>= -8 * x
+            clear_bits >>= -8 * x
+            width += x
+            x = 0
+        width = min(width, self.width - x)
+        if width <= 0:
+            return
+        limit = (1 << (8 * width)) - 1
+        start = page * self.width + x
+        current = int.from_bytes(self.buffer[start:start + width], 'little')
+        current = (current & ~clear_bits & limit) | (set_bits & limit)
+        self.buffer[start:start + width] = current.to_bytes(width, 'little')
+
+    def draw_row(self, page, x, data):
+        """OR a run of column bytes into one page starting at column x"""
+        self._apply(page, x, len(data), int.from_bytes(data, 'little'))
+
+    def fill_rect(self, x, y, width, height, on=True):
+        y0, y1 = max(y, 0), min(y + height, self.height)
+        for page in range(y0 // 8, (y1 + 7) // 8):
+            top = max(y0, page * 8) - page * 8
+            bottom = min(y1, page * 8 + 8) - page * 8
+            if bottom <= top:
+                continue
+            bits = ((1 << bottom) - 1) & ~((1 << top) - 1)
+            row = (self._ones & ((1 << (8 * width)) - 1)) * bits if width > 0 else 0
+            if on:
+                self._apply(page, x, width, row)
+            else:
+                self._apply(page, x, width, 0, row)
+
+    def hline(self, x, y, width, on=True):
+        self.fill_rect(x, y, width, 1, on)
+
+    def blit(self, sprite, x, y):
+        """Draw a sprite: masked pixels are replaced, the rest left untouched"""
+        x, y = int(x), int(y)
+        page0, shift = y >> 3, y & 7
+        for k, (pixels, mask) in enumerate(sprite.rows(shift)):
+            self._apply(page0 + k, x, sprite.width, pixels, mask)
@@ -0,0 +1,170 @@
+"""
+Shared HTTP sessions for the apps' web APIs.
+
+Each service (weather, spotify) gets one keep-alive requests session, so
+refreshes reuse the TCP/TLS connection instead of paying DNS, connect and
+handshake each time. GET responses are revalidated with If-None-Match /
+If-Modified-Since when the API sent an ETag or Last-Modified, and served
+without a request at all while Cache-Control max-age says they're fresh.
+Every request is timed and counted for lib.metrics.
+"""
+
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .lru import LRUCache
+
+DEFAULT_TIMEOUT = (3.05, 10)  # connect, read (seconds)
+RETRY_STATUS = (429, 500, 502, 503, 504)
+
+# Print one line per request (set from config.HTTP_LOG)
+log = False
+
+class CachedResponse:
+    def __init__(self, response, etag, last_modified, expires):
+        self.response = response
+        self.size = len(response.content)  # already read: streamed responses aren't cached
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires = expires  # monotonic time, 0 to always revalidate
+
+
+class MeteredSession(requests.Session):
+    """requests.Session that times, counts and conditionally caches requests,
+    including those made by libraries it's handed to (spotipy)"""
+
+    def __init__(self, service, timeout=DEFAULT_TIMEOUT, retries=0, pool_size=4,
+                 cache_bytes=64 * 1024):
+        super().__init__()
+        self.service = service
+        self.timeout = timeout
+        self.headers['Accept-Encoding'] = 'gzip, deflate'
+        # Only idempotent methods are retried (urllib3's default): a POST
+        # like Spotify's next_track must not be sent twice
+        retry = Retry(total=retries, read=False, status=retries, backoff_factor=0.3,
+                      status_forcelist=RETRY_STATUS, raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+        self.mount('https://', adapter)
+        self.mount('http://', adapter)
+        self.cache = LRUCache(cache_bytes, sizeof=lambda entry: entry.size)
+        self._lock = threading.Lock()
+        self.stats = {
+            'requests': 0,  # sent over the network
+            'errors': 0,  # connection errors and timeouts
+            'not_modified': 0,  # 304s answered from the cache
+            'fresh_hits': 0,  # served from the cache without a request
+            'bytes': 0,  # response bytes received, compressed size where known
+            'latency_total': 0.0,  # seconds
+            'latency_max': 0.0,
+        }
+
+    def request(self, method, url, params=None, headers=None, timeout=None, **kwargs):
+        key = None
+        cached = None
+        if method.upper() == 'GET' and not kwargs.get('stream'):
+            # The URL with its query string: hashable whatever params holds
+            prepared = requests.PreparedRequest()
+            prepared.prepare_url(url, sorted(params.items()) if isinstance(params, dict) else params)
+            key = prepared.url
+            with self._lock:
+                cached = self.cache.get(key)
+                if cached is not None and time.monotonic() < cached.expires:
+                    self.stats['fresh_hits'] += 1
+                    return cached.response
+            if cached is not None:
+                headers = dict(headers or {})
+                if cached.etag:
+                    headers['If-None-Match'] = cached.etag
+                if cached.last_modified:
+                    headers['If-Modified-Since'] = cached.last_modified
+
+        start = time.perf_counter()
+        try:
+            response = super().request(method, url, params=params, headers=headers,
+                                       timeout=timeout or self.timeout, **kwargs)
+        except requests.exceptions.RequestException:
+            self.stats['errors'] += 1
+            raise
+        elapsed = time.perf_counter() - start
+        size = _wire_size(response)
+        status = response.status_code
+
+        with self._lock:
+            stats = self.stats
+            stats['requests'] += 1
+            stats['bytes'] += size
+            stats['latency_total'] += elapsed
+            stats['latency_max'] = max(stats['latency_max'], elapsed)
+            if status == 304 and cached is not None:
+                stats['not_modified'] += 1
+                cached.expires = _expires(response) or 0
+                response = cached.response
+            elif key is not None and status == 200:
+                self._store(key, response)
+        if log:
+            print(f"HTTP {self.service} {method} {url.split('?', 1)[0]} "
+                  f"{status} {elapsed * 1000:.0f} ms {size} B")
+        return response
+
+    def _store(self, key, response):
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        expires = _expires(response)
+        cache_control = response.headers.get('Cache-Control', '').lower()
+        # Stored only if it can be served fresh or revalidated, never no-store
+        if 'no-store' in cache_control or not (etag or last_modified or expires):
+            return
+        self.cache.put(key, CachedResponse(response, etag, last_modified, expires or 0))
+
+
+def _expires(response):
+    # Monotonic time a response stops being fresh, from Cache-Control max-age;
+    # None if it's never fresh (max-age=0 included)
+    cache_control = response.headers.get('Cache-Control', '').lower()
+    if 'no-cache' in cache_control or 'no-store' in cache_control:
+        return None
+    for directive in cache_control.split(','):
+        name, _, value = directive.strip().partition('=')
+        if name == 'max-age' and value.isdigit() and int(value) > 0:
+            return time.monotonic() + int(value)
+    return None
+
+def _wire_size(response):
+    # urllib3 counts the (gzipped) bytes read off the socket
+    raw = response.raw
+    if raw is not None and hasattr(raw, 'tell'):
+        try:
+            return raw.tell() or len(response.content)
+        except Exception:
+            pass
+    return len(response.content)
+
+
+sessions = {}
+_sessions_lock = threading.Lock()
+
+def session(service, **kwargs):
+    """The shared MeteredSession for a service, created on first use"""
+    with _sessions_lock:
+        if service not in sessions:
+            sessions[service] = MeteredSession(service, **kwargs)
+        return sessions[service]
+
+def metrics_source():
+    """Per-service request counts, bytes and latency for lib.metrics"""
+    samples = []
+    for service, client in list(sessions.items()):
+        stats = client.stats
+        labels = {'service': service}
+        samples.append(('http_requests_total', labels, stats['requests']))
+        samples.append(('http_errors_total', labels, stats['errors']))
+        samples.append(('http_not_modified_total', labels, stats['not_modified']))
+        samples.append(('http_cache_hits_total', labels, stats['fresh_hits']))
+        samples.append(('http_bytes_total', labels, stats['bytes']))
+        samples.append(('http_latency_seconds_total', labels, stats['latency_total']))
+        samples.append(('http_latency_seconds_max', labels, stats['latency_max']))
+    return samples
@@ -0,0 +1,156 @@
+import json
+import math
+import os
+import threading
+import time
+
+# Histogram buckets grow by 10% from 0.1 ms, so percentiles are within 10%
+BUCKET_BASE_MS = 0.1
+BUCKET_GROWTH = 1.1
+_LOG_GROWTH = math.log(BUCKET_GROWTH)
+# Seconds an input waits for a frame that changes the panel before it's
+# counted as having changed nothing
+UNCHANGED_TIMEOUT = 1.0
+
+class LatencyHistogram:
+    """Log-bucketed histogram of latencies in milliseconds"""
+
+    def __init__(self):
+        self.buckets = {}  # bucket index -> count
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, ms):
+        if ms <= BUCKET_BASE_MS:
+            index = 0
+        else:
+            index = int(math.log(ms / BUCKET_BASE_MS) / _LOG_GROWTH) + 1
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += ms
+        self.max = max(self.max, ms)
+
+    def percentile(self, p):
+        """Upper bound of the bucket holding the p-th percentile"""
+        if not self.count:
+            return 0.0
+        rank = p / 100.0 * self.count
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(BUCKET_BASE_MS * BUCKET_GROWTH ** index, self.max)
+        return self.max
+
+    def summary(self):
+        return {
+            'count': self.count,
+            'mean_ms': round(self.total / self.count, 3) if self.count else 0.0,
+            'p50_ms': round(self.percentile(50), 3),
+            'p95_ms': round(self.percentile(95), 3),
+            'p99_ms': round(self.percentile(99), 3),
+            'max_ms': round(self.max, 3),
+        }
+
+
+class LatencyTracer:
+    """Measures input-to-photon latency: from a button edge to the end of the
+    I2C transfer of the first frame flushed after the app consumed it.
+
+    ButtonHandler calls input() when it hands a press to the app, Display
+    calls take() when a frame is flushed and complete() once that frame is on
+    the panel. Each step is a list append or a few float operations, cheap
+    enough to leave on all the time.
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.app = None
+        self._open = []  # [app, button, edge time, consumed time]
+        self._lock = threading.Lock()
+        self.histograms = {}  # app -> LatencyHistogram of the full latency
+        # app -> summed seconds per stage: waiting in the input queue,
+        # app update and render, and handing the frame to the panel
+        self.stages = {}
+        self.stats = {
+            'traced': 0,
+            'unchanged': 0,  # inputs followed by no changed frame within UNCHANGED_TIMEOUT
+        }
+
+    def set_app(self, name):
+        """Attribute inputs from now on to app `name`"""
+        self.app = name
+
+    def input(self, button, timestamp):
+        # The asyncio runtime calls this from its button thread, while the
+        # UI loop takes the open inputs
+        with self._lock:
+            self._open.append([self.app, button, timestamp, self.clock()])
+
+    def take(self):
+        """Inputs that the frame being flushed now reflects"""
+        with self._lock:
+            if not self._open:
+                return None
+            traces, self._open = self._open, []
+        now = self.clock()
+        for trace in traces:
+            trace.append(now)
+        return traces
+
+    def unchanged(self):
+        """The app redrew without changing the panel. Its inputs stay open
+        for the next changed frame (a Snake turn or a Dino jump shows a tick
+        later); only those older than UNCHANGED_TIMEOUT are given up on."""
+        with self._lock:
+            if self._open:
+                cutoff = self.clock() - UNCHANGED_TIMEOUT
+                kept = [trace for trace in self._open if trace[3] > cutoff]
+                self.stats['unchanged'] += len(self._open) - len(kept)
+                self._open = kept
+
+    def complete(self, traces):
+        now = self.clock()
+        with self._lock:
+            for app, button, edge, consumed, flushed in traces:
+                histogram = self.histograms.get(app)
+                if histogram is None:
+                    histogram = self.histograms[app] = LatencyHistogram()
+                    self.stages[app] = [0.0, 0.0, 0.0]
+                histogram.add((now - edge) * 1000)
+                stages = self.stages[app]
+                stages[0] += consumed - edge
+                stages[1] += flushed - consumed
+                stages[2] += now - flushed
+                self.stats['traced'] += 1
+
+    def summary(self):
+        with self._lock:
+            result = {}
+            for app, histogram in self.histograms.items():
+                entry = histogram.summary()
+                queue_time, app_time, flush_time = self.stages[app]
+                entry['mean_stage_ms'] = {
+                    'input': round(queue_time / histogram.count * 1000, 3),
+                    'app': round(app_time / histogram.count * 1000, 3),
+                    'flush': round(flush_time / histogram.count * 1000, 3),
+                }
+                result[str(app)] = entry
+            return result
+
+    def dump(self, path):
+        """Write per-app percentiles and raw buckets to a JSON file"""
+        with self._lock:
+            buckets = {str(app): {str(k): v for k, v in sorted(h.buckets.items())}
+                       for app, h in self.histograms.items()}
+        data = {
+            'apps': self.summary(),
+            'buckets': buckets,
+            'bucket_base_ms': BUCKET_BASE_MS,
+            'bucket_growth': BUCKET_GROWTH,
+            'stats': dict(self.stats),
+        }
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
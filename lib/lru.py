@@ -0,0 +1,53 @@
+from collections import OrderedDict
+
+class LRUCache:
+    """Least-recently-used cache capped by the total size of its values"""
+
+    def __init__(self, max_bytes=256 * 1024, sizeof=len):
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self._entries = OrderedDict()  # key -> (value, size)
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'entries': 0,
+            'bytes': 0,
+        }
+
+    def get(self, key, default=None):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats['misses'] += 1
+            return default
+        self._entries.move_to_end(key)
+        self.stats['hits'] += 1
+        return entry[0]
+
+    def put(self, key, value):
+        size = self.sizeof(value)
+        if size > self.max_bytes:
+            return  # Would evict everything else and still not fit
+
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.stats['bytes'] -= old[1]
+        self._entries[key] = (value, size)
+        self.stats['bytes'] += size
+
+        while self.stats['bytes'] > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.stats['bytes'] -= evicted_size
+            self.stats['evictions'] += 1
+        self.stats['entries'] = len(self._entries)
+
+    def clear(self):
+        self._entries.clear()
+        self.stats['entries'] = 0
+        self.stats['bytes'] = 0
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
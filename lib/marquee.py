@@ -0,0 +1,133 @@
+import time
+
+class Marquee:
+    """One line of text scrolling horizontally, rendered only once.
+
+    The line is blitted twice, one period apart, into an off-screen strip
+    in page layout. Every frame is then a slice of that strip per page.
+    No glyphs are rasterized after construction, and the dirty-page flush
+    only sends the pages the line covers.
+
+    The SSD1306 hardware scroll commands are not used: they rotate whole
+    pages of the 128 GDDRAM columns, so they can't show text wider than
+    the screen and would scroll anything else sharing those pages.
+    """
+
+    def __init__(self, display, text, y, speed=20, gap=24, pause=1.5, clock=None, x=0):
+        self.display = display
+        self.text = text
+        self.y = y
+        self.x = x  # the line scrolls in columns x..width
+        self.speed = speed  # pixels per second
+        self.pause = pause  # seconds to hold the start of the line each cycle
+        self.clock = clock or time.monotonic
+        self.start = self.clock()
+
+        font = display.bitmap_font
+        self.height = font.height
+        self.text_width = font.text_width(text)
+        self.period = self.text_width + gap
+
+        # Two copies so any window [offset, offset + width) is contiguous
+        shift = y & 7
+        self.pages = (font.height + shift + 7) // 8
+        strip_width = self.period + display.width
+        strip = bytearray(strip_width * self.pages)
+        font.blit(strip, strip_width, 0, shift, text)
+        font.blit(strip, strip_width, self.period, shift, text)
+        self._strip = [bytes(strip[k * strip_width:(k + 1) * strip_width]) for k in range(self.pages)]
+
+    def offset(self):
+        cycle = self.period / self.speed + self.pause
+        t = (self.clock() - self.start) % cycle
+        if t < self.pause:
+            return 0
+        return min(int((t - self.pause) * self.speed), self.period - 1)
+
+    def reset(self):
+        self.start = self.clock()
+
+    def draw(self):
+        """Draw the current window into the framebuffer (without flushing)"""
+        fb = self.display.framebuf
+        width = self.display.width - self.x
+        fb.fill_rect(self.x, self.y, width, self.height, on=False)
+        offset = self.offset()
+        page0 = self.y >> 3
+        for k, row in enumerate(self._strip):
+            fb.draw_row(page0 + k, self.x, row[offset:offset + width])
+
+
+class ScrollingText:
+    """Centered multi-line text where lines too wide for the screen scroll.
+
+    Lines that fit are drawn once per layout; only Marquee lines change
+    from frame to frame. Text that fits entirely goes through
+    draw_centered_text and its caches.
+
+    With `height`, text is centered in the top `height` rows, leaving the
+    rest for an overlay(framebuf) callback passed to draw(), e.g. a
+    progress bar. With `left`, text goes in the columns right of it and
+    the overlay can draw e.g. a picture there. A line that is the same as
+    in the previous text keeps scrolling where it was.
+    """
+
+    line_height = 12
+
+    def __init__(self, display, speed=20, height=None):
+        self.display = display
+        self.speed = speed
+        self.height = height or display.height
+        self._text = None
+        self._left = 0
+        self._marquees = []
+        self._static = None  # frame with the non-scrolling lines
+
+    def draw(self, text, overlay=None, left=0):
+        display = self.display
+        font = display.bitmap_font
+        lines = text.split('\n')
+        fits = all(font.text_width(line) <= display.width - left for line in lines)
+        if not font.covers(text) or (fits and overlay is None):
+            # Text the atlas can't draw is rendered with PIL, without overlay
+            self._text = None
+            display.draw_centered_text(text)
+            return
+
+        if text != self._text or left != self._left:
+            self._layout(text, lines, left)
+
+        display.buffer[:] = self._static
+        for marquee in self._marquees:
+            marquee.draw()
+        if overlay is not None:
+            overlay(display.framebuf)
+        display.show()
+
+    def scrolling(self):
+        """Whether the text drawn last has moving lines, so needs redrawing every frame"""
+        return self._text is not None and bool(self._marquees)
+
+    def _layout(self, text, lines, left=0):
+        display = self.display
+        font = display.bitmap_font
+        self._text = text
+        self._left = left
+        scrolling = {(m.text, m.y, m.x): m for m in self._marquees}
+        self._marquees = []
+
+        total_height = len(lines) * self.line_height
+        start_y = max(0, (self.height - total_height) // 2)
+        display.framebuf.clear()
+        for i, line in enumerate(lines):
+            y = start_y + i * self.line_height
+            if y >= self.height:
+                break  # Don't draw off-screen
+            width = font.text_width(line)
+            if width > display.width - left:
+                marquee = (scrolling.get((line, y, left))
+                           or Marquee(display, line, y, speed=self.speed, x=left))
+                self._marquees.append(marquee)
+            else:
+                display.blit_text(line, left + (display.width - left - width) // 2, y)
+        self._static = bytes(display.buffer)
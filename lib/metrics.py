@@ -0,0 +1,283 @@
+"""
+Device and system metrics for the System app and for scraping.
+
+Sources are callables returning (name, labels, value) samples. Metrics
+samples them at most once per min_interval, whoever asks, so the System
+app, the Unix socket and the text file never cost more than one cheap
+pass over some stats dicts and psutil's non-blocking counters. Counters
+(names ending in _total) also get a per-second rate.
+"""
+
+import os
+import socket
+import sys
+import threading
+import time
+import weakref
+
+from .pacer import pacers
+
+THERMAL_ZONE = '/sys/class/thermal/thermal_zone0/temp'
+PREFIX = 'gadget_'
+
+class Metrics:
+    def __init__(self, min_interval=1.0, clock=time.monotonic):
+        self.min_interval = min_interval
+        self.clock = clock
+        self.sources = {}
+        self._lock = threading.Lock()
+        self._sampled_at = None
+        self._samples = []
+        self._previous = {}  # (name, labels) -> (time, value) for counter rates
+
+    def add_source(self, name, source):
+        self.sources[name] = source
+
+    def sample(self):
+        """[(name, labels, value)], re-sampled at most every min_interval"""
+        with self._lock:
+            now = self.clock()
+            if self._sampled_at is not None and now - self._sampled_at < self.min_interval:
+                return self._samples
+
+            samples = []
+            for name, source in list(self.sources.items()):
+                try:
+                    samples.extend(source())
+                except Exception as e:
+                    print(f"Metrics source {name} failed: {e}")
+
+            rates = []
+            previous = {}
+            for name, labels, value in samples:
+                if not name.endswith('_total'):
+                    continue
+                key = (name, tuple(sorted(labels.items())))
+                previous[key] = (now, value)
+                if key in self._previous:
+                    then, old = self._previous[key]
+                    if now > then:
+                        rates.append((name[:-len('_total')] + '_per_second', labels,
+                                      max(0.0, (value - old) / (now - then))))
+            self._previous = previous
+            self._samples = samples + rates
+            self._sampled_at = now
+            return self._samples
+
+    def get(self, name, default=None, **labels):
+        for sample_name, sample_labels, value in self.sample():
+            if sample_name == name and sample_labels == labels:
+                return value
+        return default
+
+    def by_label(self, name, label):
+        """{label value: value} for a labelled metric, e.g. per-app fps"""
+        return {labels[label]: value for sample_name, labels, value in self.sample()
+                if sample_name == name and label in labels}
+
+    def prometheus(self):
+        """All samples in the Prometheus text exposition format"""
+        lines = []
+        typed = set()
+        for name, labels, value in sorted(self.sample(), key=lambda s: s[0]):
+            full = PREFIX + name
+            if full not in typed:
+                typed.add(full)
+                kind = 'counter' if name.endswith('_total') else 'gauge'
+                lines.append(f"# TYPE {full} {kind}")
+            if labels:
+                label_text = ','.join(f'{k}="{_escape(v)}"' for k, v in sorted(labels.items()))
+                lines.append(f"{full}{{{label_text}}} {_number(value)}")
+            else:
+                lines.append(f"{full} {_number(value)}")
+        return '\n'.join(lines) + '\n'
+
+
+def _number(value):
+    return str(value) if isinstance(value, int) else repr(float(value))
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+# Sources
+
+def system_source():
+    """CPU, memory, load and SoC temperature. psutil is optional."""
+    samples = []
+    try:
+        import psutil
+    except ImportError:
+        psutil = None
+    if psutil is not None:
+        # Non-blocking: CPU use since the previous call
+        samples.append(('system_cpu_percent', {}, psutil.cpu_percent(interval=None)))
+        memory = psutil.virtual_memory()
+        samples.append(('system_memory_percent', {}, memory.percent))
+        samples.append(('system_memory_used_bytes', {}, memory.total - memory.available))
+    load1, load5, load15 = os.getloadavg()
+    samples.append(('system_load1', {}, load1))
+    samples.append(('system_load5', {}, load5))
+    temperature = read_temperature()
+    if temperature is not None:
+        samples.append(('system_temperature_celsius', {}, temperature))
+    return samples
+
+def read_temperature():
+    try:
+        with open(THERMAL_ZONE) as f:
+            return int(f.read().strip()) / 1000.0
+    except (OSError, ValueError):
+        return None
+
+def display_source(display):
+    display = weakref.proxy(display)
+
+    def source():
+        stats = display.stats
+        cache = display.text_cache.stats
+        return [
+            ('display_frames_sent_total', {}, stats['frames_sent']),
+            ('display_frames_skipped_total', {}, stats['frames_skipped']),
+            ('display_renders_skipped_total', {}, stats['renders_skipped']),
+            ('display_frames_dropped_total', {}, stats['frames_dropped']),
+            ('display_i2c_bytes_total', {}, stats['bytes_sent']),
+            ('display_transfer_seconds_total', {}, stats['transfer_time']),
+            ('display_transfer_seconds_max', {}, stats['transfer_time_max']),
+            ('text_cache_hits_total', {}, cache['hits']),
+            ('text_cache_misses_total', {}, cache['misses']),
+            ('text_cache_bytes', {}, cache['bytes']),
+        ] + [
+            (name, {'app': app}, counts[i])
+            for app, counts in list(display.app_frames.items()) if app is not None
+            for i, name in enumerate(('display_app_frames_sent_total', 'display_app_frames_skipped_total'))
+        ]
+    return source
+
+def pacer_source():
+    """Loop rate of every app's FramePacer"""
+    samples = []
+    for pacer in list(pacers):
+        if pacer.name is None:
+            continue
+        labels = {'app': pacer.name}
+        samples.append(('app_loop_iterations_total', labels, pacer.stats['frames']))
+        samples.append(('app_loop_overruns_total', labels, pacer.stats['overruns']))
+        samples.append(('app_loop_jitter_seconds', labels, pacer.stats['jitter_avg']))
+    return samples
+
+def http_source():
+    # Only once an app has imported lib.http: importing requests at boot is slow
+    http = sys.modules.get('lib.http')
+    return http.metrics_source() if http is not None else []
+
+def retry_source():
+    retry = sys.modules.get('lib.retry')
+    return retry.metrics_source() if retry is not None else []
+
+def albumart_source():
+    albumart = sys.modules.get('lib.albumart')
+    return albumart.metrics_source() if albumart is not None else []
+
+def latency_source(tracer):
+    def source():
+        samples = []
+        for app, summary in tracer.summary().items():
+            labels = {'app': app}
+            samples.append(('input_latency_p50_ms', labels, summary['p50_ms']))
+            samples.append(('input_latency_p95_ms', labels, summary['p95_ms']))
+            samples.append(('input_latency_p99_ms', labels, summary['p99_ms']))
+        return samples
+    return source
+
+def scheduler_source(scheduler):
+    def source():
+        stats = scheduler.stats
+        samples = [
+            ('scheduler_queue_depth', {}, stats['queue_depth']),
+            ('scheduler_running', {}, stats['running']),
+            ('scheduler_dispatched_total', {}, stats['dispatched']),
+            ('scheduler_paused', {}, 1 if stats['paused'] else 0),
+        ]
+        for job in list(scheduler.jobs.values()):
+            labels = {'job': job.name}
+            samples.append(('job_runs_total', labels, job.stats['runs']))
+            samples.append(('job_failures_total', labels, job.stats['failures']))
+            samples.append(('job_duration_seconds', labels, job.stats['avg_duration']))
+        return samples
+    return source
+
+
+# Exporters
+
+class MetricsExporter:
+    """Serves metrics.prometheus() on a Unix socket (one scrape per
+    connection, e.g. `socat - UNIX-CONNECT:<path>`) and/or rewrites a text
+    file every `interval` seconds, for node_exporter's textfile collector."""
+
+    def __init__(self, metrics, socket_path=None, file_path=None, interval=15):
+        self.metrics = metrics
+        self.socket_path = socket_path
+        self.file_path = file_path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._threads = []
+        self._server = None
+
+    def start(self):
+        if self.socket_path:
+            try:
+                os.unlink(self.socket_path)
+            except FileNotFoundError:
+                pass
+            self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._server.bind(self.socket_path)
+            self._server.listen(2)
+            self._spawn(self._serve)
+        if self.file_path:
+            self._spawn(self._write_loop)
+
+    def stop(self):
+        self._stop.set()
+        if self._server is not None:
+            self._server.close()
+            try:
+                os.unlink(self.socket_path)
+            except OSError:
+                pass
+
+    def _spawn(self, target):
+        thread = threading.Thread(target=target, name="metrics", daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def _serve(self):
+        while not self._stop.is_set():
+            try:
+                conn, _ = self._server.accept()
+            except OSError:
+                return  # Closed by stop()
+            with conn:
+                try:
+                    conn.sendall(self.metrics.prometheus().encode())
+                except OSError:
+                    pass
+
+    def _write_loop(self):
+        while not self._stop.wait(self.interval):
+            tmp = self.file_path + '.tmp'
+            try:
+                with open(tmp, 'w') as f:
+                    f.write(self.metrics.prometheus())
+                os.replace(tmp, self.file_path)
+            except OSError as e:
+                print(f"Metrics file error: {e}")
+
+
+# Shared by main.py, which adds the sources, and the System app
+metrics = Metrics()
+metrics.add_source('system', system_source)
+metrics.add_source('pacers', pacer_source)
+metrics.add_source('http', http_source)
+metrics.add_source('retry', retry_source)
+metrics.add_source('albumart', albumart_source)
@@ -0,0 +1,80 @@
+import time
+import weakref
+
+# Every live pacer, for per-app loop rates in lib.metrics
+pacers = weakref.WeakSet()
+
+class FramePacer:
+    """Paces an app loop to a target frame rate on the monotonic clock.
+
+    Call tick() once per loop iteration instead of time.sleep(). It sleeps
+    only for what is left of the frame budget after input, update, render
+    and I2C, so the real frame rate holds regardless of how long those took.
+    """
+
+    def __init__(self, fps, name=None, clock=None, sleep=None):
+        self.fps = fps
+        self.name = name
+        self.interval = 1.0 / fps
+        # Looked up at construction so lib.replay's virtual clock applies
+        self.clock = clock or time.monotonic
+        self.sleep = sleep or time.sleep
+        self._deadline = None
+        self._last_tick = None
+        self.stats = {
+            'frames': 0,
+            'overruns': 0,  # frames that took longer than the budget
+            'fps': 0.0,  # smoothed actual frame rate
+            'jitter_avg': 0.0,  # smoothed |wake-up time - deadline| in seconds
+            'jitter_max': 0.0,
+        }
+        pacers.add(self)
+
+    def reset(self):
+        """Start a fresh schedule, e.g. when an app is (re)entered"""
+        self._deadline = None
+        self._last_tick = None
+
+    def tick(self):
+        remaining = self._remaining()
+        if remaining is not None:
+            if remaining > 0:
+                self.sleep(remaining)
+            self._advance(remaining)
+
+    async def tick_async(self):
+        """tick() for asyncio apps: other tasks run while this one waits"""
+        import asyncio
+
+        remaining = self._remaining()
+        if remaining is not None:
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+            self._advance(remaining)
+
+    def _remaining(self):
+        # Seconds left in this frame, or None on the first tick
+        now = self.clock()
+        if self._deadline is None:
+            self._deadline = now + self.interval
+            self._last_tick = now
+            return None
+        return self._deadline - now
+
+    def _advance(self, remaining):
+        now = self.clock()
+        if remaining > 0:
+            jitter = abs(now - self._deadline)
+            self.stats['jitter_avg'] += 0.1 * (jitter - self.stats['jitter_avg'])
+            self.stats['jitter_max'] = max(self.stats['jitter_max'], jitter)
+            self._deadline += self.interval
+        else:
+            # Over budget: schedule from now rather than bursting to catch up
+            self.stats['overruns'] += 1
+            self._deadline = now + self.interval
+
+        frame_time = now - self._last_tick
+        if frame_time > 0:
+            self.stats['fps'] += 0.1 * (1.0 / frame_time - self.stats['fps'])
+        self._last_tick = now
+        self.stats['frames'] += 1
@@ -0,0 +1,248 @@
+import threading
+import time
+from collections import deque
+
+class PlaybackModel:
+    """Spotify playback as of the last poll, and where it should be by now.
+
+    Between polls the track position is extrapolated from the time of the
+    poll, so elapsed time and a progress bar move without any requests.
+    next_poll adapts to what is going on: rarely while a track plays
+    steadily, soon after a button press, and just after the current track
+    should have ended.
+
+    Button presses change the model straight away (set_playing, skip);
+    a poll sent before such a local change is discarded when it answers,
+    so it can't put the old state back.
+    """
+
+    PLAYING_INTERVAL = 15.0  # seconds between polls while a track plays
+    PAUSED_INTERVAL = 10.0  # playback may be resumed from another device
+    IDLE_INTERVAL = 30.0  # nothing playing anywhere
+    ERROR_INTERVAL = 20.0
+    AFTER_ACTION = 0.6  # commands take a moment to show up in the API
+    TRACK_END_MARGIN = 0.8
+
+    def __init__(self, clean=str, clock=time.monotonic):
+        self.clean = clean  # applied to track and artist names once per poll
+        self.clock = clock
+        self.track = None  # {'id', 'name', 'artist', 'album_id', 'image_url', 'duration_ms'}
+        self.upcoming = []  # tracks in the play queue, from queue()
+        self._queue_track_id = None  # track playing when upcoming was fetched
+        self.is_playing = False
+        self._progress_ms = 0
+        self._progress_at = None  # clock() when _progress_ms was true
+        self.next_poll = 0.0
+        self._requested = None  # poll_soon() time asked for during a poll
+        self._version = 0  # bumped by local changes
+        self.stats = {
+            'polls': 0,
+            'errors': 0,
+            'discarded': 0,  # poll answers overtaken by a button press
+        }
+
+    def begin_poll(self):
+        """A poll is being sent: not due again until it has answered.
+        Returns a token for update()."""
+        self.next_poll = float('inf')
+        self._requested = None
+        return self._version
+
+    def update(self, current, token=None):
+        """Take a current_playback() response; None means nothing is playing"""
+        now = self.clock()
+        self.stats['polls'] += 1
+        if token is not None and token != self._version:
+            # The buttons changed things while this poll was out: ask again
+            self.stats['discarded'] += 1
+            self._schedule(now + self.AFTER_ACTION)
+            return
+        if not current or not current.get('item'):
+            self.clear()
+            self._schedule(now + self.IDLE_INTERVAL)
+            return
+
+        self.track = self._parse_track(current['item'])
+        if self.upcoming and self.upcoming[0]['id'] == self.track['id']:
+            self.upcoming.pop(0)
+        self.is_playing = current['is_playing']
+        self._progress_ms = current.get('progress_ms') or 0
+        self._progress_at = now
+        self._schedule(now + self._interval())
+
+    def set_queue(self, queue):
+        """Take a queue() response"""
+        self.upcoming = [self._parse_track(item) for item in (queue or {}).get('queue') or []
+                         if item and item.get('name')]
+        self._queue_track_id = self.track['id'] if self.track else None
+
+    def needs_queue(self):
+        # Once per track: the queue moves on when the track changes
+        return self.track is not None and self.track['id'] != self._queue_track_id
+
+    def _parse_track(self, item):
+        album = item.get('album') or {}
+        images = album.get('images') or [{}]
+        return {
+            'id': item.get('id'),
+            'name': self.clean(item['name']),
+            'artist': self.clean(item['artists'][0]['name']) if item.get('artists') else '',
+            'album_id': album.get('id'),
+            'image_url': images[-1].get('url'),  # smallest
+            'duration_ms': item.get('duration_ms') or 0,
+        }
+
+    def failed(self):
+        """A poll failed: show nothing rather than stale data, retry later"""
+        self.stats['errors'] += 1
+        self.clear()
+        self._schedule(self.clock() + self.ERROR_INTERVAL)
+
+    def _schedule(self, at):
+        # A button pressed while the poll was in flight still gets its poll
+        if self._requested is not None:
+            at = min(at, self._requested)
+            self._requested = None
+        self.next_poll = at
+
+    def clear(self):
+        self.track = None
+        self.is_playing = False
+        self._progress_ms = 0
+        self._progress_at = None
+
+    def _interval(self):
+        if self.track is None:
+            return self.IDLE_INTERVAL
+        if not self.is_playing:
+            return self.PAUSED_INTERVAL
+        remaining = (self.track['duration_ms'] - self._progress_ms) / 1000
+        return max(0.0, min(self.PLAYING_INTERVAL, remaining + self.TRACK_END_MARGIN))
+
+    def due(self):
+        return self.clock() >= self.next_poll
+
+    def poll_soon(self, delay=AFTER_ACTION):
+        """Poll shortly, e.g. to confirm a command"""
+        at = self.clock() + delay
+        if self.next_poll == float('inf'):
+            self._requested = at if self._requested is None else min(self._requested, at)
+        else:
+            self.next_poll = min(self.next_poll, at)
+
+    def progress_ms(self):
+        """Position in the track now, extrapolated since the last poll"""
+        if self.track is None or self._progress_at is None:
+            return 0
+        progress = self._progress_ms
+        if self.is_playing:
+            progress += (self.clock() - self._progress_at) * 1000
+        return int(min(progress, self.track['duration_ms'] or progress))
+
+    def set_playing(self, playing):
+        """Play/pause locally, keeping the extrapolated position"""
+        self._version += 1
+        self._progress_ms = self.progress_ms()
+        self._progress_at = self.clock()
+        self.is_playing = playing
+
+    def skip(self, count):
+        """Next (count > 0) or previous (count < 0) track, locally. The next
+        tracks are known from the queue; going back restarts the track."""
+        self._version += 1
+        self._progress_ms = 0
+        self._progress_at = self.clock()
+        if count > 0 and len(self.upcoming) >= count:
+            self.track = self.upcoming[count - 1]
+            self.upcoming = self.upcoming[count:]
+
+    def get_state(self):
+        return {'current_track': self.track, 'is_playing': self.is_playing}
+
+    def restore_state(self, state):
+        # Shown until the first poll answers; the position isn't known
+        self.track = state.get('current_track')
+        if self.track is not None:
+            self.track.setdefault('duration_ms', 0)
+        self.is_playing = state.get('is_playing', False)
+        self._progress_ms = 0
+        self._progress_at = None
+
+
+def format_ms(ms):
+    """'3:05' for 185000"""
+    seconds = int(ms // 1000)
+    return f"{seconds // 60}:{seconds % 60:02d}"
+
+
+class CommandQueue:
+    """Playback commands, sent one at a time by a worker thread so the
+    buttons never wait on the network.
+
+    Commands still waiting are merged: repeated 'next' or 'previous'
+    presses become one command with a count, and a 'play' or 'pause'
+    replaces a 'play' or 'pause' that hasn't been sent yet.
+
+    The worker waits `window` seconds before sending the first command of
+    a burst, so quick presses merge. send(command, count) does the API
+    calls; idle() is called whenever the queue runs empty, e.g. to poll
+    the real state.
+    """
+
+    def __init__(self, send, idle=None, window=0.15):
+        self.send = send
+        self.idle = idle
+        self.window = window
+        self._queue = deque()  # [command, count]
+        self._lock = threading.Lock()
+        self._busy = False
+        self._running = False  # worker thread alive
+        self.stats = {
+            'commands': 0,  # presses queued
+            'sent': 0,  # send() calls
+            'merged': 0,
+        }
+
+    def put(self, command):
+        with self._lock:
+            self.stats['commands'] += 1
+            last = self._queue[-1] if self._queue else None
+            if last is not None and last[0] == command and command in ('next', 'previous'):
+                last[1] += 1
+                self.stats['merged'] += 1
+            elif last is not None and last[0] in ('play', 'pause') and command in ('play', 'pause'):
+                last[0] = command
+                self.stats['merged'] += 1
+            else:
+                self._queue.append([command, 1])
+            start = not self._running
+            self._running = True
+        if start:
+            threading.Thread(target=self._run, name="playback-commands", daemon=True).start()
+
+    def busy(self):
+        """Commands waiting or being sent"""
+        with self._lock:
+            return self._busy or bool(self._queue)
+
+    def _run(self):
+        time.sleep(self.window)
+        while True:
+            with self._lock:
+                if not self._queue:
+                    # The next put() starts a new worker
+                    self._busy = False
+                    self._running = False
+                    return
+                command, count = self._queue.popleft()
+                self._busy = True
+            try:
+                self.send(command, count)
+            except Exception as e:
+                print(f"Playback command {command} failed: {e}")
+            self.stats['sent'] += 1
+            with self._lock:
+                empty = not self._queue
+            if empty and self.idle is not None:
+                self.idle()
+
@@ -0,0 +1,230 @@
+"""
+Record a session's button presses and replay them against any app,
+deterministically, on the virtual display.
+
+InputRecorder hooks into ButtonHandler and writes the presses it delivers
+as a button script (the same "<seconds> <button>" format main.py --script
+reads). replay() runs an app against that script on a virtual clock: time
+only advances when the app sleeps or waits for input, random is seeded,
+threads the app starts run to completion inline and frames are flushed
+synchronously, so the same script always produces the same frames. It
+reports the CPU time spent, frames sent and bytes flushed, plus a digest
+of every frame to catch rendering changes.
+"""
+
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+
+from .buttons import ButtonEvent
+from .display import Display
+from .virtual import VirtualSSD1306
+
+# Wall-clock time the virtual clock starts at: 2024-01-01 00:00 UTC
+VIRTUAL_EPOCH = 1704067200.0
+
+class ReplayFinished(BaseException):
+    """Raised into the app once the script has played out. Like
+    KeyboardInterrupt it isn't an Exception, so app error handling
+    doesn't swallow it."""
+
+
+class InputRecorder:
+    """Collects delivered presses; set as ButtonHandler.recorder"""
+
+    def __init__(self, clock=time.monotonic):
+        self.start = clock()
+        self.events = []  # (offset seconds, button)
+
+    def record(self, button, timestamp):
+        self.events.append((timestamp - self.start, button))
+
+    def save(self, path):
+        with open(path, 'w') as f:
+            f.write("# Recorded button presses: <seconds> <button>\n")
+            for offset, button in self.events:
+                f.write(f"{offset:.3f} {button}\n")
+
+
+class VirtualClock:
+    """Stand-in for time.time/monotonic/sleep that only moves when slept on"""
+
+    def __init__(self, end=None):
+        self.now = 0.0
+        self.end = end  # ReplayFinished is raised once time passes this
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return VIRTUAL_EPOCH + self.now
+
+    def sleep(self, seconds):
+        self.advance_to(self.now + max(0.0, seconds))
+
+    def advance_to(self, t):
+        if self.end is not None and t > self.end:
+            self.now = self.end
+            raise ReplayFinished()
+        self.now = max(self.now, t)
+
+    @contextmanager
+    def patched(self):
+        """Route the time module through this clock while the app runs"""
+        saved = time.time, time.monotonic, time.sleep
+        time.time, time.monotonic, time.sleep = self.time, self.monotonic, self.sleep
+        try:
+            yield self
+        finally:
+            time.time, time.monotonic, time.sleep = saved
+
+
+class ReplayButtons:
+    """ButtonHandler stand-in that delivers scripted presses on a VirtualClock"""
+
+    def __init__(self, script, clock, button_pins=None):
+        self.clock = clock
+        self.presses = sorted((event[0], event[1]) for event in script)
+        self.button_pins = button_pins or {'up': 0, 'down': 1, 'select': 2, 'back': 3}
+        self.profile = 'default'
+        self.tracer = None
+        self.recorder = None
+        self.display = None
+
+    def set_profile(self, profile):
+        self.profile = profile
+
+    def set_app(self, name):
+        if self.tracer is not None:
+            self.tracer.set_app(name)
+        if self.display is not None:
+            self.display.app = name
+
+    def get_pressed(self):
+        if self.presses and self.presses[0][0] <= self.clock.now:
+            at, button = self.presses.pop(0)
+            if self.tracer is not None:
+                self.tracer.input(button, at)
+            return button
+        if not self.presses and self.clock.end is not None and self.clock.now >= self.clock.end:
+            raise ReplayFinished()  # Nothing left and the app never sleeps
+        return None
+
+    def wait_event(self, timeout=None, poll_interval=0.02):
+        if not self.presses or (timeout is not None and self.presses[0][0] > self.clock.now + timeout):
+            if timeout is None:
+                raise ReplayFinished()
+            self.clock.sleep(timeout)
+            return None
+        self.clock.advance_to(self.presses[0][0])
+        return ButtonEvent(self.get_pressed(), True, self.clock.now)
+
+    def wait_pressed(self, timeout=None):
+        event = self.wait_event(timeout)
+        return event.button if event else None
+
+    def cleanup(self):
+        pass
+
+
+@contextmanager
+def http_fixtures(fixtures):
+    """Answer requests made through the requests library from a fixture dict.
+
+    fixtures maps a URL (without query string) to {"status": code, "json": body}.
+    Anything else fails with a ConnectionError, as if the device were offline.
+    """
+    import requests
+
+    def request(session, method, url, *args, **kwargs):
+        fixture = fixtures.get(url.split('?', 1)[0])
+        if fixture is None:
+            raise requests.exceptions.ConnectionError(f"No replay fixture for {url}")
+        response = requests.Response()
+        response.status_code = fixture.get('status', 200)
+        response.url = url
+        response._content = json.dumps(fixture.get('json')).encode()
+        response.headers['Content-Type'] = 'application/json'
+        return response
+
+    saved = requests.Session.request
+    requests.Session.request = request
+    try:
+        yield
+    finally:
+        requests.Session.request = saved
+
+
+def _submit_inline(executor, fn, *args, **kwargs):
+    future = Future()
+    try:
+        future.set_result(fn(*args, **kwargs))
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+@contextmanager
+def inline_threads():
+    """Run threads and thread pool work to completion when they are started
+    or submitted, e.g. Weather's background refresh, so they can't race the
+    app loop"""
+    saved = threading.Thread.start, ThreadPoolExecutor.submit
+    threading.Thread.start = threading.Thread.run
+    ThreadPoolExecutor.submit = _submit_inline
+    try:
+        yield
+    finally:
+        threading.Thread.start, ThreadPoolExecutor.submit = saved
+
+
+def replay(app_factory, script, seed=0, width=128, height=32, tail=2.0, fixtures=None, env=None):
+    """Run app_factory(display, buttons).run() against a button script.
+
+    The app is stopped `tail` virtual seconds after the last press. Returns
+    a dict of cpu_time, virtual_time, frames, bytes, transactions and digest,
+    with the VirtualSSD1306 under 'oled' for dumping frames.
+    """
+    last = max((event[0] for event in script), default=0.0)
+    clock = VirtualClock(end=last + tail)
+    saved_env = {key: os.environ.get(key) for key in (env or {})}
+    os.environ.update(env or {})
+
+    try:
+        with clock.patched(), http_fixtures(fixtures or {}), inline_threads():
+            random.seed(seed)
+            oled = VirtualSSD1306(width, height, record_frames=True)
+            display = Display(None, width, height, oled=oled)
+            buttons = ReplayButtons(script, clock)
+            buttons.display = display
+            app = app_factory(display, buttons)
+
+            cpu_start = time.process_time()
+            try:
+                app.run()
+            except ReplayFinished:
+                pass
+            cpu_time = time.process_time() - cpu_start
+    finally:
+        for key, value in saved_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+    digest = hashlib.sha256()
+    for frame in oled.frames:
+        digest.update(frame)
+    return {
+        'cpu_time': cpu_time,
+        'virtual_time': clock.now,
+        'frames': display.stats['frames_sent'],
+        'bytes': oled.stats['bytes'],
+        'transactions': oled.stats['transactions'],
+        'digest': digest.hexdigest(),
+        'oled': oled,
+    }
@@ -0,0 +1,118 @@
+"""
+Backoff and circuit breaking for calls to web APIs.
+
+Neither class sleeps: they only say when the next attempt may happen, so
+callers on the UI thread (or the scheduler) check them and carry on
+drawing until then.
+"""
+
+import random
+import threading
+import time
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+STATES = (CLOSED, HALF_OPEN, OPEN)
+
+class RetryPolicy:
+    """Exponential backoff with jitter: base, base * factor, ... up to
+    max_delay seconds, each spread by +/- jitter (a fraction) so devices
+    that failed together don't retry together"""
+
+    def __init__(self, base=5.0, factor=2.0, max_delay=600.0, jitter=0.2):
+        self.base = base
+        self.factor = factor
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+    def delay(self, attempt):
+        """Seconds to wait after the attempt-th consecutive failure (from 1)"""
+        delay = min(self.max_delay, self.base * self.factor ** max(0, attempt - 1))
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+
+class CircuitBreaker:
+    """Stops calls to a failing API for a while.
+
+    After failure_threshold consecutive failures the breaker opens and
+    allow() says no for reset_timeout seconds. Then one trial call is let
+    through (half-open): success closes the breaker, failure opens it again.
+    """
+
+    def __init__(self, name, failure_threshold=5, reset_timeout=300.0, clock=time.monotonic):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.state = CLOSED
+        self.opened_at = None
+        self._lock = threading.Lock()
+        self.stats = {
+            'consecutive_failures': 0,
+            'failures': 0,
+            'successes': 0,
+            'trips': 0,  # times the breaker opened
+            'rejected': 0,  # calls refused while open
+            'last_error': None,
+        }
+        breakers[name] = self
+
+    def ready(self):
+        """Whether allow() would let a call through, without claiming it"""
+        with self._lock:
+            if self.state == OPEN:
+                return self.clock() - self.opened_at >= self.reset_timeout
+            return self.state == CLOSED
+
+    def allow(self, probe=False):
+        """Claim a call. probe (e.g. a manual refresh) may make the trial
+        call before reset_timeout is up."""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and (probe or self.clock() - self.opened_at >= self.reset_timeout):
+                self.state = HALF_OPEN
+                return True
+            self.stats['rejected'] += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = CLOSED
+            self.opened_at = None
+            self.stats['consecutive_failures'] = 0
+            self.stats['successes'] += 1
+
+    def record_failure(self, error=None):
+        with self._lock:
+            self.stats['failures'] += 1
+            self.stats['consecutive_failures'] += 1
+            self.stats['last_error'] = str(error)[:80] if error is not None else None
+            if self.state == HALF_OPEN or self.stats['consecutive_failures'] >= self.failure_threshold:
+                if self.state != OPEN:
+                    self.stats['trips'] += 1
+                self.state = OPEN
+                self.opened_at = self.clock()
+
+    def retry_in(self):
+        """Seconds until an open breaker lets a trial call through"""
+        with self._lock:
+            if self.state != OPEN:
+                return 0.0
+            return max(0.0, self.opened_at + self.reset_timeout - self.clock())
+
+
+# Every breaker by name, for diagnostics (lib.metrics, the System app)
+breakers = {}
+
+def metrics_source():
+    samples = []
+    for name, breaker in list(breakers.items()):
+        labels = {'name': name}
+        samples.append(('circuit_state', labels, STATES.index(breaker.state)))
+        samples.append(('circuit_consecutive_failures', labels, breaker.stats['consecutive_failures']))
+        samples.append(('circuit_failures_total', labels, breaker.stats['failures']))
+        samples.append(('circuit_trips_total', labels, breaker.stats['trips']))
+        samples.append(('circuit_rejected_total', labels, breaker.stats['rejected']))
+    return samples
@@ -0,0 +1,140 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+class ButtonStream:
+    """Button presses from a ButtonHandler as an asyncio stream.
+
+    A thread blocks in ButtonHandler.wait_pressed() and hands each press to
+    the event loop, so no task ever waits on GPIO. Also usable as
+    `async for button in stream`.
+    """
+
+    def __init__(self, buttons, loop, poll_timeout=0.05):
+        self.buttons = buttons
+        self.loop = loop
+        self.poll_timeout = poll_timeout  # how quickly stop() takes effect
+        self.queue = asyncio.Queue()
+        self._thread = None
+        self._running = False
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self.clear()
+        self._running = True
+        self._thread = threading.Thread(target=self._pump, name="button-stream", daemon=True)
+        self._thread.start()
+
+    async def stop(self):
+        """Stop reading ButtonHandler, e.g. while a blocking app uses it
+        directly. The join (up to poll_timeout) is awaited in the executor
+        rather than blocking the loop; it makes sure the thread can't take
+        a press meant for that app."""
+        if self._thread is None:
+            return
+        thread, self._thread = self._thread, None
+        self._running = False
+        await self.loop.run_in_executor(None, thread.join)
+
+    def clear(self):
+        """Drop presses queued but not read, so they don't reach the next app late"""
+        while not self.queue.empty():
+            self.queue.get_nowait()
+
+    def _pump(self):
+        while self._running:
+            button = self.buttons.wait_pressed(self.poll_timeout)
+            if button:
+                self.loop.call_soon_threadsafe(self.queue.put_nowait, button)
+
+    def get_nowait(self):
+        """The next press, or None if there is none queued"""
+        try:
+            return self.queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return None
+
+    async def get(self, timeout=None):
+        """Wait for the next press, or return None after timeout seconds"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        return await self.queue.get()
+
+
+class Runtime:
+    """Cooperative runtime: Menu and apps run as asyncio tasks.
+
+    Apps with a run_async(runtime) coroutine read input from runtime.buttons
+    and push blocking work (network calls) to the executor with
+    runtime.background() or runtime.run_blocking(), so the screen keeps
+    animating while they wait. Apps that only have run() still work: they
+    are run in the executor with the button stream paused.
+    """
+
+    def __init__(self, buttons, max_workers=4):
+        self.handler = buttons
+        self.executor = ThreadPoolExecutor(max_workers, thread_name_prefix="runtime")
+        self.loop = None
+        self.buttons = None  # ButtonStream, once running
+
+    def run(self, app):
+        """Run app (usually the Menu) until it returns"""
+        asyncio.run(self._main(app))
+
+    async def _main(self, app):
+        self.loop = asyncio.get_running_loop()
+        self.loop.set_default_executor(self.executor)
+        self.buttons = ButtonStream(self.handler, self.loop)
+        self.buttons.start()
+        try:
+            await self.run_app(app)
+        finally:
+            await self.buttons.stop()
+            self.executor.shutdown(wait=False)
+
+    def background(self, func, *args):
+        """Start func(*args) in the executor; returns an asyncio future"""
+        return self.loop.run_in_executor(self.executor, func, *args)
+
+    async def run_blocking(self, func, *args):
+        """Await func(*args) without blocking the event loop"""
+        return await self.background(func, *args)
+
+    async def run_sync(self, func, *args):
+        """Run blocking UI code that reads ButtonHandler itself.
+
+        It gets a daemon thread of its own rather than an executor worker:
+        a game loop never returns by itself, and the interpreter waits for
+        executor workers on exit.
+        """
+        future = self.loop.create_future()
+
+        def target():
+            try:
+                result = func(*args)
+            except BaseException as e:
+                self.loop.call_soon_threadsafe(future.set_exception, e)
+            else:
+                self.loop.call_soon_threadsafe(future.set_result, result)
+
+        await self.buttons.stop()
+        self.buttons.clear()
+        try:
+            threading.Thread(target=target, name="sync-app", daemon=True).start()
+            return await future
+        finally:
+            self.buttons.start()
+
+    async def run_app(self, app):
+        if hasattr(app, 'run_async'):
+            await app.run_async(self)
+        else:
+            await self.run_sync(app.run)
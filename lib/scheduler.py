@@ -0,0 +1,155 @@
+import heapq
+import itertools
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+class Job:
+    """A function run every `interval` seconds, +/- `jitter` (a fraction)"""
+
+    def __init__(self, name, func, interval, jitter=0.1, priority=10):
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self.jitter = jitter
+        self.priority = priority  # lower runs first when workers are busy
+        self.next_run = 0.0
+        self.running = False
+        self.stats = {
+            'runs': 0,
+            'failures': 0,
+            'last_run': None,  # monotonic time the last run started
+            'last_duration': 0.0,
+            'avg_duration': 0.0,  # smoothed, seconds
+            'max_duration': 0.0,
+            'avg_wait': 0.0,  # smoothed time from due to started
+        }
+
+    def delay(self):
+        spread = self.interval * self.jitter
+        return self.interval + random.uniform(-spread, spread)
+
+
+class JobScheduler:
+    """Runs periodic background jobs (data prefetch) on a bounded thread pool.
+
+    A dispatcher thread sleeps until the next job is due and submits due
+    jobs by priority while fewer than max_workers are running. A job is
+    never run twice at the same time: it is rescheduled when it finishes.
+    While idle() returns true (nobody has touched the buttons for a while)
+    nothing is dispatched; due jobs run once the device is in use again.
+    """
+
+    def __init__(self, max_workers=2, idle=None, idle_poll=1.0, clock=time.monotonic):
+        self.max_workers = max_workers
+        self.idle = idle
+        self.idle_poll = idle_poll
+        self.clock = clock
+        self.jobs = {}
+        self._executor = None
+        self._heap = []  # (next_run, priority, seq, job)
+        self._seq = itertools.count()
+        self._running = 0
+        self._cond = threading.Condition()
+        self._thread = None
+        self._stopping = False
+        self.stats = {
+            'dispatched': 0,
+            'queue_depth': 0,  # jobs due but waiting for a worker
+            'queue_depth_max': 0,
+            'running': 0,
+            'paused': False,  # True while the device is idle
+        }
+
+    def register(self, name, func, interval, jitter=0.1, priority=10, delay=0.0):
+        """Run func every interval seconds, the first time after `delay`"""
+        job = Job(name, func, interval, jitter, priority)
+        with self._cond:
+            self.jobs[name] = job
+            self._schedule(job, self.clock() + delay)
+        return job
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stopping = False
+        self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="job")
+        self._thread = threading.Thread(target=self._dispatch_loop, name="scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop dispatching; jobs already running finish in the background"""
+        if self._thread is None:
+            return
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        self._thread.join()
+        self._thread = None
+        self._executor.shutdown(wait=False)
+
+    def _schedule(self, job, at):
+        job.next_run = at
+        heapq.heappush(self._heap, (at, job.priority, next(self._seq), job))
+        self._cond.notify_all()
+
+    def _dispatch_loop(self):
+        with self._cond:
+            while not self._stopping:
+                now = self.clock()
+                paused = self.idle is not None and self.idle()
+                self.stats['paused'] = paused
+                due = [entry for entry in self._heap if entry[0] <= now]
+                self.stats['queue_depth'] = len(due)
+                self.stats['queue_depth_max'] = max(self.stats['queue_depth_max'], len(due))
+
+                if paused:
+                    self._cond.wait(self.idle_poll)
+                    continue
+                if due and self._running < self.max_workers:
+                    # Highest priority first, then the one due longest
+                    entry = min(due, key=lambda e: (e[1], e[0], e[2]))
+                    self._heap.remove(entry)
+                    heapq.heapify(self._heap)
+                    self._submit(entry[3], now)
+                    continue
+
+                if due or not self._heap:
+                    timeout = None  # woken when a worker frees up or a job is added
+                else:
+                    timeout = self._heap[0][0] - now
+                if self.idle is not None:
+                    timeout = self.idle_poll if timeout is None else min(timeout, self.idle_poll)
+                self._cond.wait(timeout)
+
+    def _submit(self, job, now):
+        job.running = True
+        self._running += 1
+        self.stats['running'] = self._running
+        self.stats['dispatched'] += 1
+        wait = now - job.next_run
+        job.stats['avg_wait'] += 0.2 * (wait - job.stats['avg_wait'])
+        self._executor.submit(self._run_job, job)
+
+    def _run_job(self, job):
+        start = self.clock()
+        job.stats['last_run'] = start
+        try:
+            job.func()
+        except Exception as e:
+            job.stats['failures'] += 1
+            print(f"Job {job.name} failed: {e}")
+        duration = self.clock() - start
+
+        with self._cond:
+            stats = job.stats
+            stats['runs'] += 1
+            stats['last_duration'] = duration
+            stats['avg_duration'] += 0.2 * (duration - stats['avg_duration'])
+            stats['max_duration'] = max(stats['max_duration'], duration)
+            job.running = False
+            self._running -= 1
+            self.stats['running'] = self._running
+            if not self._stopping:
+                self._schedule(job, self.clock() + job.delay())
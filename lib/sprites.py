@@ -0,0 +1,51 @@
+class Sprite:
+    """Pre-baked 1-bit bitmap with a mask, for FrameBuffer.blit.
+
+    Built from ASCII art: '#' is a lit pixel, '.' an opaque dark pixel and
+    ' ' is transparent. Page rows for all 8 vertical alignments are computed
+    up front, so blitting never touches individual pixels.
+    """
+
+    def __init__(self, art):
+        lines = [line for line in art.strip('\n').split('\n')]
+        self.height = len(lines)
+        self.width = max(len(line) for line in lines)
+        # Per-column bit masks, bit y = row y of the sprite
+        self.columns = [0] * self.width
+        self.mask_columns = [0] * self.width
+        for y, line in enumerate(lines):
+            for x, ch in enumerate(line):
+                if ch == '#':
+                    self.columns[x] |= 1 << y
+                if ch != ' ':
+                    self.mask_columns[x] |= 1 << y
+        self._rows = [self._bake(shift) for shift in range(8)]
+
+    def _bake(self, shift):
+        pages = (self.height + shift + 7) // 8
+        rows = []
+        for k in range(pages):
+            pixels = mask = 0
+            for x in range(self.width):
+                pixels |= ((self.columns[x] << shift) >> (8 * k) & 0xFF) << (8 * x)
+                mask |= ((self.mask_columns[x] << shift) >> (8 * k) & 0xFF) << (8 * x)
+            rows.append((pixels, mask))
+        return rows
+
+    def rows(self, shift):
+        """(pixels, mask) page rows for a sprite drawn `shift` pixels into a page"""
+        return self._rows[shift]
+
+
+def collide(a, ax, ay, b, bx, by):
+    """Pixel-accurate test of whether two sprites' lit pixels overlap"""
+    ax, ay, bx, by = int(ax), int(ay), int(bx), int(by)
+    x0, x1 = max(ax, bx), min(ax + a.width, bx + b.width)
+    if x0 >= x1 or ay >= by + b.height or by >= ay + a.height:
+        return False
+    # Line both sprites' columns up on a common vertical origin
+    top = min(ay, by)
+    for x in range(x0, x1):
+        if (a.columns[x - ax] << (ay - top)) & (b.columns[x - bx] << (by - top)):
+            return True
+    return False
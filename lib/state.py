@@ -0,0 +1,100 @@
+import base64
+import json
+import os
+import threading
+import time
+
+class StateStore:
+    """Snapshot of UI and app state in a small JSON file, for warm restarts.
+
+    Writes go to a temporary file that is then renamed over the old one,
+    so a crash or power cut mid-write leaves the previous snapshot intact.
+    Unchanged snapshots aren't rewritten, to spare the SD card.
+    """
+
+    def __init__(self, path, interval=30):
+        self.path = path
+        self.interval = interval  # seconds between periodic saves
+        self._last_saved = None
+        self._thread = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    def load(self):
+        """The last snapshot, or None if there is none or it can't be read"""
+        try:
+            with open(self.path) as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            print(f"State load error: {e}")
+            return None
+        self._last_saved = json.dumps(dict(state, saved_at=None), sort_keys=True)
+        return state
+
+    def save(self, state):
+        with self._lock:
+            data = json.dumps(dict(state, saved_at=None), sort_keys=True)
+            if data == self._last_saved:
+                return False
+            tmp = self.path + '.tmp'
+            try:
+                os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+                with open(tmp, 'w') as f:
+                    json.dump(dict(state, saved_at=time.time()), f, separators=(',', ':'))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp, self.path)
+            except OSError as e:
+                print(f"State save error: {e}")
+                return False
+            self._last_saved = data
+            return True
+
+    def start(self, collect):
+        """Save collect() every `interval` seconds on a background thread"""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+
+        def loop():
+            while not self._stop.wait(self.interval):
+                try:
+                    self.save(collect())
+                except Exception as e:
+                    print(f"State snapshot error: {e}")
+
+        self._thread = threading.Thread(target=loop, name="state-store", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+
+def snapshot(display, menu):
+    """Menu and app state plus the frame currently on the panel"""
+    frame = display.current_frame()
+    return {
+        'menu': menu.get_state(),
+        'frame': base64.b64encode(frame).decode('ascii') if frame else None,
+        'size': [display.width, display.height],
+    }
+
+def restore(display, menu, state, show_frame=True):
+    """Hand the menu and apps their state and, with show_frame, put the
+    last frame back on the panel. Returns True if a frame was shown."""
+    menu.restore_state(state.get('menu') or {})
+    frame = state.get('frame')
+    if not show_frame or not frame or state.get('size') != [display.width, display.height]:
+        return False
+    frame = base64.b64decode(frame)
+    if len(frame) != len(display.buffer):
+        return False
+    display.buffer[:] = frame
+    display.show()
+    return True
@@ -0,0 +1,306 @@
+"""
+Headless stand-ins for the OLED and the buttons, so apps can run and be
+measured on a normal Linux box.
+
+VirtualSSD1306 replaces adafruit_ssd1306.SSD1306_I2C: it decodes every I2C
+transaction the way the panel would, keeps an emulated GDDRAM and records
+all traffic. VirtualGPIO replaces the RPi.GPIO module, with button presses
+driven from a script of timestamps.
+"""
+
+import heapq
+import threading
+import time
+
+# Number of argument bytes that follow each multi-byte SSD1306 command
+COMMAND_ARGS = {
+    0x20: 1, 0x21: 2, 0x22: 2, 0x26: 6, 0x27: 6, 0x29: 5, 0x2A: 5,
+    0x81: 1, 0x8D: 1, 0xA3: 2, 0xA8: 1, 0xAD: 1, 0xD3: 1, 0xD5: 1,
+    0xD9: 1, 0xDA: 1, 0xDB: 1,
+}
+
+class VirtualSSD1306:
+    """In-memory SSD1306 that records every command and data byte sent"""
+
+    def __init__(self, width=128, height=32, record_frames=False):
+        self.width = width
+        self.height = height
+        self.pages = height // 8
+        self.i2c_device = self  # Display writes through oled.i2c_device
+
+        # Driver-side buffer, same layout as adafruit_ssd1306 (control byte first)
+        self.buffer = bytearray(width * self.pages + 1)
+        self.buffer[0] = 0x40
+
+        # Emulated panel state
+        self.gddram = bytearray(128 * self.pages)
+        self.display_on = True
+        self._col_range = (0, 127)
+        self._page_range = (0, self.pages - 1)
+        self._col = 0
+        self._page = 0
+        self._pending = []  # command still waiting for its argument bytes
+
+        # Traffic log
+        self.record_frames = record_frames
+        self.frames = []
+        self.commands = []  # (command, args)
+        self.stats = {
+            'transactions': 0,
+            'bytes': 0,  # including the address byte of each transaction
+            'data_bytes': 0,
+            'commands': 0,
+        }
+
+    # I2CDevice interface used by Display and write_cmd
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def write(self, data):
+        data = bytes(data)
+        self.stats['transactions'] += 1
+        self.stats['bytes'] += len(data) + 1
+        if not data:
+            return
+
+        control = data[0]
+        if control & 0x40:
+            self._write_data(data[1:])
+        elif control & 0x80:
+            # Co=1: each command byte comes with its own control byte
+            for i in range(1, len(data), 2):
+                self._feed_command(data[i])
+        else:
+            for byte in data[1:]:
+                self._feed_command(byte)
+
+    def write_cmd(self, cmd):
+        self.write(bytes([0x80, cmd]))
+
+    # Subset of the adafruit_ssd1306 driver API
+    def fill(self, color):
+        self.buffer[1:] = (b'\xff' if color else b'\x00') * (len(self.buffer) - 1)
+
+    def image(self, image):
+        """Pack a 1-bit PIL image into buffer, pixel by pixel like the driver"""
+        pixels = image.load()
+        self.fill(0)
+        width = self.width
+        for x in range(width):
+            for y in range(self.height):
+                if pixels[x, y]:
+                    self.buffer[1 + (y >> 3) * width + x] |= 1 << (y & 0x07)
+
+    def show(self):
+        self.write(bytes([0x00, 0x21, 0, self.width - 1, 0x22, 0, self.pages - 1]))
+        self.write(self.buffer)
+
+    def poweroff(self):
+        self.write_cmd(0xAE)
+
+    def _feed_command(self, byte):
+        if self._pending:
+            self._pending.append(byte)
+        else:
+            self._pending = [byte]
+        cmd = self._pending[0]
+        if len(self._pending) - 1 < COMMAND_ARGS.get(cmd, 0):
+            return
+
+        args = self._pending[1:]
+        self._pending = []
+        self.commands.append((cmd, tuple(args)))
+        self.stats['commands'] += 1
+
+        if cmd == 0x21:
+            self._col_range = (args[0], args[1])
+            self._col = args[0]
+        elif cmd == 0x22:
+            self._page_range = (args[0], args[1] & 0x07)
+            self._page = args[0]
+        elif cmd == 0xAE:
+            self.display_on = False
+        elif cmd == 0xAF:
+            self.display_on = True
+
+    def _write_data(self, data):
+        col0, col1 = self._col_range
+        page0, page1 = self._page_range
+        for byte in data:
+            if self._page < self.pages:
+                self.gddram[self._page * 128 + self._col] = byte
+            # Horizontal addressing: wrap to the next page, then back to the top
+            self._col += 1
+            if self._col > col1:
+                self._col = col0
+                self._page += 1
+                if self._page > page1:
+                    self._page = page0
+        self.stats['data_bytes'] += len(data)
+        if self.record_frames:
+            self.frames.append(self.frame())
+
+    def frame(self):
+        """Visible panel contents in page layout (page * width + x)"""
+        offset = (128 - self.width) // 2 if self.width != 128 else 0
+        return b''.join(
+            bytes(self.gddram[page * 128 + offset:page * 128 + offset + self.width])
+            for page in range(self.pages)
+        )
+
+    def to_image(self, frame=None):
+        from PIL import Image
+
+        frame = frame if frame is not None else self.frame()
+        image = Image.new("1", (self.width, self.height))
+        pixels = image.load()
+        for page in range(self.pages):
+            for x in range(self.width):
+                byte = frame[page * self.width + x]
+                for bit in range(8):
+                    if byte >> bit & 1:
+                        pixels[x, page * 8 + bit] = 255
+        return image
+
+    def save_png(self, path, frame=None, scale=4):
+        image = self.to_image(frame)
+        if scale != 1:
+            image = image.resize((self.width * scale, self.height * scale))
+        image.save(path)
+
+    def save_raw(self, path, frame=None):
+        with open(path, 'wb') as f:
+            f.write(frame if frame is not None else self.frame())
+
+    def dump_frames(self, directory, raw=False):
+        """Write every recorded frame as frame_00000.png (or .bin)"""
+        import os
+
+        os.makedirs(directory, exist_ok=True)
+        for i, frame in enumerate(self.frames):
+            if raw:
+                self.save_raw(os.path.join(directory, f"frame_{i:05d}.bin"), frame)
+            else:
+                self.save_png(os.path.join(directory, f"frame_{i:05d}.png"), frame)
+
+
+class VirtualGPIO:
+    """Drop-in for the RPi.GPIO module, with scriptable button presses"""
+
+    BCM = 11
+    BOARD = 10
+    IN = 1
+    OUT = 0
+    HIGH = 1
+    LOW = 0
+    PUD_UP = 22
+    PUD_DOWN = 21
+    RISING = 31
+    FALLING = 32
+    BOTH = 33
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.pins = {}
+        self._presses = {}  # pin -> [(start, end)]
+
+        # Edge detection: scheduled (time, pin) edges fired from a thread
+        self._callbacks = {}
+        self._edges = []
+        self._cond = threading.Condition()
+        self._edge_thread = None
+
+    def setmode(self, mode):
+        pass
+
+    def setwarnings(self, flag):
+        pass
+
+    def setup(self, pin, direction, pull_up_down=None):
+        self.pins[pin] = direction
+        self._presses.setdefault(pin, [])
+
+    def input(self, pin):
+        # Buttons pull the pin LOW while pressed
+        now = self.clock()
+        presses = self._presses.get(pin, [])
+        while presses and presses[0][1] <= now:
+            presses.pop(0)
+        if presses and presses[0][0] <= now:
+            return self.LOW
+        return self.HIGH
+
+    def add_event_detect(self, pin, edge, callback=None, bouncetime=None):
+        """Call callback(pin) on every press and release of pin"""
+        with self._cond:
+            self._callbacks[pin] = callback
+            for start, end in self._presses.get(pin, []):
+                heapq.heappush(self._edges, (start, pin))
+                heapq.heappush(self._edges, (end, pin))
+            if self._edge_thread is None:
+                self._edge_thread = threading.Thread(target=self._edge_loop, daemon=True)
+                self._edge_thread.start()
+            self._cond.notify()
+
+    def remove_event_detect(self, pin):
+        with self._cond:
+            self._callbacks.pop(pin, None)
+
+    def _edge_loop(self):
+        while True:
+            with self._cond:
+                if not self._edges:
+                    self._cond.wait()
+                    continue
+                at, pin = self._edges[0]
+                delay = at - self.clock()
+                if delay > 0:
+                    self._cond.wait(delay)
+                    continue
+                heapq.heappop(self._edges)
+                callback = self._callbacks.get(pin)
+            if callback:
+                callback(pin)
+
+    def cleanup(self):
+        with self._cond:
+            self._callbacks.clear()
+            self._edges = []
+
+    def press(self, pin, at=None, duration=0.05):
+        """Hold pin LOW from `at` (default now) for `duration` seconds"""
+        start = self.clock() if at is None else at
+        self._presses.setdefault(pin, []).append((start, start + duration))
+        self._presses[pin].sort()
+        with self._cond:
+            if pin in self._callbacks:
+                heapq.heappush(self._edges, (start, pin))
+                heapq.heappush(self._edges, (start + duration, pin))
+                self._cond.notify()
+
+    def load_script(self, script, pins, start=None):
+        """Schedule (offset_seconds, button[, duration]) presses from `start`"""
+        start = self.clock() if start is None else start
+        for event in script:
+            offset, button = event[0], event[1]
+            duration = event[2] if len(event) > 2 else 0.05
+            self.press(pins[button], at=start + offset, duration=duration)
+
+
+def read_script(path):
+    """Parse a button script: one "<seconds> <button> [duration]" per line"""
+    script = []
+    with open(path) as f:
+        for line in f:
+            line = line.split('#', 1)[0].strip()
+            if not line:
+                continue
+            parts = line.split()
+            event = (float(parts[0]), parts[1])
+            if len(parts) > 2:
+                event += (float(parts[2]),)
+            script.append(event)
+    return script
@@ -1,60 +1,164 @@
-import board
-import busio
+import argparse
+import signal
 import time
 from apps.menu import Menu
-from apps.weather import WeatherApp
-from apps.notes import NotesApp
-from apps.music_control import SpotifyApp
-from apps.timer import TimerApp
-from apps.snake_game import SnakeGame  # Your existing snake game
-from apps.dino_game import DinoRunner  # Your existing dino game
-from apps.games_menu import GamesMenu  # New games menu
 from apps.hello import HelloScreen  # ADD THIS IMPORT
+from apps import registry
 from lib.display import Display
 from lib.buttons import ButtonHandler
+from lib.latency import LatencyTracer
+from lib.state import StateStore, snapshot, restore
+from lib.scheduler import JobScheduler
+from lib import metrics
 import config
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="OLED multi-app device")
+    parser.add_argument('--virtual', action='store_true',
+                        help="run headless on an emulated display and buttons")
+    parser.add_argument('--script',
+                        help="button script for --virtual, one '<seconds> <button> [duration]' per line")
+    parser.add_argument('--dump',
+                        help="directory to save every frame sent to the virtual display as PNG")
+    parser.add_argument('--record',
+                        help="save the button presses of this session as a script for scripts/replay.py")
+    return parser.parse_args()
+
+def create_hardware(args):
+    if args.virtual:
+        from lib.virtual import VirtualSSD1306, VirtualGPIO, read_script
+        oled = VirtualSSD1306(config.OLED_WIDTH, config.OLED_HEIGHT, record_frames=bool(args.dump))
+        display = Display(None, config.OLED_WIDTH, config.OLED_HEIGHT, oled=oled)
+        gpio = VirtualGPIO()
+        buttons = ButtonHandler(config, gpio=gpio)
+        if args.script:
+            gpio.load_script(read_script(args.script), buttons.button_pins)
+        return display, buttons
+    
+    import board
+    import busio
+    i2c = busio.I2C(board.SCL, board.SDA)
+    display = Display(i2c, config.OLED_WIDTH, config.OLED_HEIGHT, config.OLED_ADDRESS)
+    buttons = ButtonHandler(config)
+    return display, buttons
+
+def create_menu(display, buttons):
+    # Apps (see apps/registry.py) are imported and built when first selected
+    apps = registry.apps.lazy_apps(display, buttons)
+    return Menu(display, buttons, apps)
+
+def save_state(store, display, menu):
+    if store is None or menu is None:
+        return
+    store.stop()
+    try:
+        store.save(snapshot(display, menu))
+    except Exception as e:
+        print(f"State save error: {e}")
+
+def configure_http():
+    if config.HTTP_LOG:
+        from lib import http
+        http.log = True
+
+def start_metrics(display, buttons, scheduler):
+    metrics.metrics.min_interval = config.METRICS_MIN_INTERVAL
+    metrics.metrics.add_source('display', metrics.display_source(display))
+    metrics.metrics.add_source('scheduler', metrics.scheduler_source(scheduler))
+    if buttons.tracer is not None:
+        metrics.metrics.add_source('latency', metrics.latency_source(buttons.tracer))
+    exporter = metrics.MetricsExporter(metrics.metrics, config.METRICS_SOCKET,
+                                       config.METRICS_FILE, config.METRICS_FILE_INTERVAL)
+    try:
+        exporter.start()
+    except OSError as e:
+        print(f"Metrics exporter error: {e}")
+    return exporter
+
+def handle_sigterm(signum, frame):
+    # systemd stops the service with SIGTERM: shut down like on Ctrl+C
+    raise KeyboardInterrupt
+
 def main():
+    args = parse_args()
+    signal.signal(signal.SIGTERM, handle_sigterm)
+    store = StateStore(config.STATE_FILE, config.STATE_SAVE_INTERVAL) if config.STATE_FILE else None
     try:
         # Initialize hardware
-        i2c = busio.I2C(board.SCL, board.SDA)
-        display = Display(i2c, config.OLED_WIDTH, config.OLED_HEIGHT, config.OLED_ADDRESS)
-        buttons = ButtonHandler(config)
+        display, buttons = create_hardware(args)
+        buttons.display = display
+        if config.OLED_ASYNC_FLUSH:
+            display.start_writer()
+        if config.LATENCY_TRACE:
+            buttons.tracer = display.tracer = LatencyTracer()
+            buttons.set_app("Hello")
         
-        # SHOW HELLO SCREEN FIRST
-        hello = HelloScreen(display, buttons)
-        hello.show()
+        if args.record:
+            # Only needed for --record: kept out of the boot imports
+            from lib.replay import InputRecorder
+            buttons.recorder = InputRecorder()
+        
+        configure_http()
+        menu = create_menu(display, buttons)
         
-        # Initialize games separately
-        games = [
-            SnakeGame(display, buttons),
-            DinoRunner(display, buttons)
-        ]
+        # Warm restart: put the last frame back up straight away and
+        # restore the menu position and app state
+        state = store.load() if store else None
+        warm = False
+        if state:
+            recent = time.time() - (state.get('saved_at') or 0) < config.WARM_RESTART_MAX_AGE
+            warm = restore(display, menu, state, show_frame=recent)
         
-        # Create games menu
-        games_menu = GamesMenu(display, buttons, games)
+        # Keep Weather and Spotify data fresh in the background,
+        # starting while the hello screen is up
+        scheduler = JobScheduler(config.SCHEDULER_WORKERS,
+                                 idle=lambda: buttons.idle_time() > config.SCHEDULER_IDLE_AFTER)
+        registry.schedule_prefetch(scheduler, menu.apps)
+        scheduler.start()
+        exporter = start_metrics(display, buttons, scheduler)
         
-        # Initialize main apps (including games menu)
-        apps = [
-            WeatherApp(display, buttons),
-            NotesApp(display, buttons),
-            SpotifyApp(display, buttons),
-            TimerApp(display, buttons),
-            games_menu  # Games submenu replaces individual games
-        ]
+        # SHOW HELLO SCREEN FIRST
+        if not warm:
+            hello = HelloScreen(display, buttons)
+            hello.show()
         
         # Start menu system
-        menu = Menu(display, buttons, apps)
-        menu.run()
+        if store:
+            store.start(lambda: snapshot(display, menu))
+        if config.APP_PREWARM:
+            # Build the remaining apps in the background while the menu is idle
+            registry.prewarm(menu.apps, idle=lambda: menu.current_app is None)
+        if config.ASYNC_RUNTIME:
+            from lib.runtime import Runtime
+            Runtime(buttons).run(menu)
+        else:
+            menu.run()
         
     except KeyboardInterrupt:
         print("\nShutting down...")
+        save_state(store, display, locals().get('menu'))
+        if 'scheduler' in locals():
+            scheduler.stop()
+        if 'exporter' in locals():
+            exporter.stop()
         display.clear()
+        display.stop_writer()
         buttons.cleanup()  # Clean up GPIO
+        if display.tracer is not None:
+            display.tracer.dump(config.LATENCY_TRACE_FILE)
+            print(f"Saved input latency to {config.LATENCY_TRACE_FILE}")
+        if args.record:
+            buttons.recorder.save(args.record)
+            print(f"Saved {len(buttons.recorder.events)} button presses to {args.record}")
+        if args.dump:
+            display.oled.dump_frames(args.dump)
+            print(f"Saved {len(display.oled.frames)} frames to {args.dump}")
     except Exception as e:
         print(f"Error: {e}")
         if 'display' in locals():
+            save_state(store, display, locals().get('menu'))
             display.draw_centered_text(f"Error:\n{str(e)[:20]}")
+            display.stop_writer()
             time.sleep(3)
         if 'buttons' in locals():
             buttons.cleanup()
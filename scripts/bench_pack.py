@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Frame Packing Benchmark
+Compares the per-pixel PIL-to-SSD1306 conversion done by the Adafruit
+driver's image() against lib.framebuf.pack_image on game-like frames.
+
+Usage:
+    python scripts/bench_pack.py [frames]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from PIL import Image, ImageDraw
+from lib.framebuf import pack_image
+
+import config
+
+def make_frames(count, width, height):
+    """Snake/Dino-like frames: a few filled blocks and a ground line"""
+    frames = []
+    for _ in range(count):
+        image = Image.new("1", (width, height))
+        draw = ImageDraw.Draw(image)
+        for _ in range(12):
+            x, y = random.randrange(0, width - 4), random.randrange(0, height - 4)
+            draw.rectangle([x, y, x + 3, y + 3], fill=255)
+        draw.line([(0, height - 6), (width, height - 6)], fill=255)
+        frames.append(image)
+    return frames
+
+def driver_packer(width, height):
+    """The driver's image(): adafruit_framebuf when installed, else its emulation"""
+    try:
+        import adafruit_framebuf
+        buf = bytearray(width * height // 8)
+        fb = adafruit_framebuf.FrameBuffer(buf, width, height, adafruit_framebuf.MVLSB)
+        return "adafruit_framebuf.image", fb.image
+    except ImportError:
+        from lib.virtual import VirtualSSD1306
+        return "VirtualSSD1306.image (driver emulation)", VirtualSSD1306(width, height).image
+
+def bench(name, pack, frames):
+    start = time.perf_counter()
+    for image in frames:
+        pack(image)
+    elapsed = time.perf_counter() - start
+    per_frame = elapsed / len(frames) * 1000
+    print(f"{name:45s} {per_frame:8.3f} ms/frame  {len(frames) / elapsed:9.0f} frames/s")
+    return per_frame
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    width, height = config.OLED_WIDTH, config.OLED_HEIGHT
+    frames = make_frames(count, width, height)
+
+    name, driver_pack = driver_packer(width, height)
+    print(f"{count} frames of {width}x{height}")
+    slow = bench(name, driver_pack, frames)
+    fast = bench("lib.framebuf.pack_image", lambda image: pack_image(image, width, height), frames)
+    print(f"speedup: {slow / fast:.0f}x")
+
+if __name__ == "__main__":
+    main()
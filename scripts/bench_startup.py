@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark
+Measures cold start in fresh interpreters: import time per module (from
+python -X importtime) and the time from interpreter start to the first
+HelloScreen frame reaching the (virtual) panel. It also times importing
+each registered app, which the lazy registry moves out of boot.
+
+Usage:
+    python scripts/bench_startup.py [runs]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, ROOT)
+
+from apps import registry
+
+# Runs main.py --virtual and exits as soon as a lit frame reaches the panel,
+# printing the seconds since the script started
+FIRST_FRAME = """
+import os, sys, time
+started = time.perf_counter()
+from lib import virtual
+write_data = virtual.VirtualSSD1306._write_data
+def first_frame(self, data):
+    write_data(self, data)
+    if any(self.gddram):
+        print(time.perf_counter() - started)
+        sys.stdout.flush()
+        os._exit(0)
+virtual.VirtualSSD1306._write_data = first_frame
+sys.argv = ['main.py', '--virtual']
+import main
+main.main()
+"""
+
+def run_python(code, *flags):
+    return subprocess.run([sys.executable, *flags, '-c', code], cwd=ROOT,
+                          capture_output=True, text=True, timeout=60)
+
+def import_times(module=None):
+    """{module: cumulative microseconds} for one cold import (or for
+    interpreter startup alone, with no module)"""
+    result = run_python(f"import {module}" if module else "pass", '-X', 'importtime')
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+def time_to_first_frame():
+    """(seconds after interpreter start, seconds including process spawn)"""
+    start = time.perf_counter()
+    result = run_python(FIRST_FRAME)
+    total = time.perf_counter() - start
+    if result.returncode != 0 or not result.stdout.strip():
+        raise RuntimeError(result.stderr.strip() or "no frame was drawn")
+    return float(result.stdout.strip().splitlines()[-1]), total
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    print("Import time of main (cumulative, top 15, interpreter startup excluded)")
+    startup = import_times()
+    times = {name: us for name, us in import_times('main').items() if name not in startup}
+    for name, us in sorted(times.items(), key=lambda item: -item[1])[:15]:
+        print(f"  {us / 1000:8.1f} ms  {name}")
+
+    print("\nDeferred app imports (paid on first use or by prewarm)")
+    for descriptor in registry.apps.descriptors + registry.games.descriptors:
+        if callable(descriptor.factory):
+            continue
+        us = import_times(descriptor.module).get(descriptor.module, 0)
+        print(f"  {us / 1000:8.1f} ms  {descriptor.name} ({descriptor.module})")
+
+    print(f"\nTime to first HelloScreen frame ({runs} runs)")
+    in_process, wall = zip(*(time_to_first_frame() for _ in range(runs)))
+    print(f"  after interpreter start: median {statistics.median(in_process) * 1000:.1f} ms")
+    print(f"  including process spawn: median {statistics.median(wall) * 1000:.1f} ms, "
+          f"max {max(wall) * 1000:.1f} ms")
+
+if __name__ == "__main__":
+    main()
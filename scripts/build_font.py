@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Font Atlas Compiler
+Pre-rasterizes a TTF or BDF font into lib/fonts/<name>.py, with glyphs laid
+out in SSD1306 page format so Display can blit text without FreeType.
+
+Usage:
+    python scripts/build_font.py /usr/share/fonts/truetype/dejavu/DejaVuSans.ttf 10
+    python scripts/build_font.py myfont.bdf
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from lib.font import BitmapFont
+
+FONTS_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'lib', 'fonts'))
+
+def module_name(path, size=None):
+    base = os.path.splitext(os.path.basename(path))[0]
+    name = ''.join(ch if ch.isalnum() else '_' for ch in base).lower()
+    return f"{name}_{size}" if size else name
+
+def write_atlas(font, source, path):
+    with open(path, 'w') as f:
+        f.write(f"# Generated by scripts/build_font.py from {source} - do not edit\n")
+        f.write(f"NAME = {font.name!r}\n")
+        f.write(f"HEIGHT = {font.height}\n")
+        f.write("\n# code point: (advance, left offset, column bytes page by page)\n")
+        f.write("GLYPHS = {\n")
+        for code in sorted(font.glyphs):
+            advance, left, data = font.glyphs[code]
+            f.write(f"    {code}: ({advance}, {left}, {data!r}),\n")
+        f.write("}\n")
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+
+    source = sys.argv[1]
+    if source.lower().endswith('.bdf'):
+        name = module_name(source)
+        font = BitmapFont.from_bdf(source, name)
+        sources = [(font, name)]
+    else:
+        from PIL import ImageFont
+        sizes = [int(s) for s in sys.argv[2:]] or [10]
+        sources = []
+        for size in sizes:
+            name = module_name(source, size)
+            pil_font = ImageFont.truetype(source, size)
+            sources.append((BitmapFont.from_pil(pil_font, name), name))
+
+    for font, name in sources:
+        path = os.path.join(FONTS_DIR, f"{name}.py")
+        write_atlas(font, os.path.basename(source), path)
+        print(f"Wrote {path} ({len(font.glyphs)} glyphs, {font.height}px)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Input Replay
+Plays a recorded (main.py --record) or hand-written button script against an
+app on the virtual display and virtual clock, and reports CPU time, frames
+and bytes flushed. The frame digest is identical on every run of the same
+script, so a changed digest means the app renders differently.
+
+Usage:
+    python scripts/replay.py snake session.txt
+    python scripts/replay.py weather scroll.txt --fixtures weather.json
+    python scripts/replay.py main session.txt --dump frames/ --expect <digest>
+
+Fixture files are JSON: {"env": {...}, "http": {"<url>": {"status": 200, "json": {...}}}}
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from apps.dino_game import DinoRunner
+from apps.games_menu import GamesMenu
+from apps.hello import HelloScreen
+from apps.music_control import SpotifyApp
+from apps.notes import NotesApp
+from apps.snake_game import SnakeGame
+from apps.timer import TimerApp
+from apps.weather import WeatherApp
+from lib.replay import replay
+from lib.virtual import read_script
+from main import create_menu
+
+import config
+
+class Session:
+    """The whole device as main.py runs it: hello screen, then the menu"""
+
+    def __init__(self, display, buttons):
+        self.hello = HelloScreen(display, buttons)
+        self.menu = create_menu(display, buttons)
+
+    def run(self):
+        self.hello.show()
+        self.menu.run()
+
+APPS = {
+    'main': Session,
+    'menu': create_menu,
+    'weather': WeatherApp,
+    'notes': NotesApp,
+    'spotify': SpotifyApp,
+    'timer': TimerApp,
+    'games': lambda display, buttons: GamesMenu(display, buttons, [
+        SnakeGame(display, buttons), DinoRunner(display, buttons)]),
+    'snake': SnakeGame,
+    'dino': DinoRunner,
+}
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a button script against an app")
+    parser.add_argument('app', choices=sorted(APPS))
+    parser.add_argument('script', help="button script, one '<seconds> <button>' per line")
+    parser.add_argument('--seed', type=int, default=0, help="random seed (default 0)")
+    parser.add_argument('--tail', type=float, default=2.0,
+                        help="seconds to keep running after the last press (default 2)")
+    parser.add_argument('--fixtures', help="JSON file with env vars and HTTP responses")
+    parser.add_argument('--dump', help="directory to save every frame as PNG")
+    parser.add_argument('--expect', help="fail unless the frame digest matches")
+    args = parser.parse_args()
+
+    # Start from an empty cache so earlier runs don't change what's drawn
+    config.CACHE_DIR = tempfile.mkdtemp(prefix="replay-cache-")
+
+    fixtures = {}
+    if args.fixtures:
+        with open(args.fixtures) as f:
+            fixtures = json.load(f)
+
+    result = replay(APPS[args.app], read_script(args.script), seed=args.seed,
+                    width=config.OLED_WIDTH, height=config.OLED_HEIGHT, tail=args.tail,
+                    fixtures=fixtures.get('http'), env=fixtures.get('env'))
+
+    print(f"App:          {args.app}")
+    print(f"Virtual time: {result['virtual_time']:.2f} s")
+    print(f"CPU time:     {result['cpu_time'] * 1000:.1f} ms")
+    print(f"Frames sent:  {result['frames']}")
+    print(f"I2C bytes:    {result['bytes']} in {result['transactions']} transactions")
+    print(f"Digest:       {result['digest']}")
+
+    if args.dump:
+        result['oled'].dump_frames(args.dump)
+        print(f"Saved {len(result['oled'].frames)} frames to {args.dump}")
+
+    if args.expect and args.expect != result['digest']:
+        print("Digest mismatch: the replay rendered different frames")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()